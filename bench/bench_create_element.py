@@ -0,0 +1,165 @@
+# Copyright (C) 2026 The FEniCS Project
+#
+# This file is part of Basix (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    MIT
+"""Benchmark the creation of finite elements.
+
+Times the creation of elements of a range of families and degrees on
+tetrahedra and hexahedra. Run with::
+
+    python bench/bench_create_element.py
+
+Basix caches data that is shared between elements, e.g. lattices and
+DOF transformations, so creating the same element again is faster
+than creating it for the first time. The ``first`` column is the time
+taken to create each element in a new Python process, where these
+caches are empty. The ``cached`` column is the time taken to create it
+again in the same process.
+
+The ``custom`` family creates a custom element with the same span as a
+Lagrange element. Its ``wcoeffs`` are multiplied by a random matrix, so
+orthonormalising them is part of the work that is timed.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+
+import basix
+
+_LEGENDRE = {"lagrange_variant": basix.LagrangeVariant.legendre}
+_FAMILIES = {
+    "P": (basix.ElementFamily.P, {"lagrange_variant": basix.LagrangeVariant.gll_warped}),
+    "N1E": (basix.ElementFamily.N1E, _LEGENDRE),
+    "RT": (basix.ElementFamily.RT, _LEGENDRE),
+    "N2E": (basix.ElementFamily.N2E, {**_LEGENDRE, "dpc_variant": basix.DPCVariant.legendre}),
+    "bubble": (basix.ElementFamily.bubble, {}),
+    "custom": (basix.ElementFamily.P, {"lagrange_variant": basix.LagrangeVariant.gll_warped}),
+}
+
+
+def _time(f, repeat: int) -> float:
+    """Best time in seconds of a number of calls of a function."""
+    return min(timeit.repeat(f, number=1, repeat=repeat))
+
+
+def _save_custom_data(filename: str, cell: basix.CellType, degree: int):
+    """Save the data used to create a custom element to a file."""
+    family, kwargs = _FAMILIES["custom"]
+    e = basix.create_element(family, cell, degree, **kwargs)
+    rng = np.random.default_rng(0)
+    wcoeffs = rng.random((e.dim, e.dim)) @ e.wcoeffs
+    data = {"wcoeffs": wcoeffs}
+    for d in range(4):
+        for i, (x, M) in enumerate(zip(e.x[d], e.M[d])):
+            data[f"x_{d}_{i}"] = x
+            data[f"M_{d}_{i}"] = M
+    np.savez(filename, **data)
+
+
+def _load_custom_data(filename: str, cell: basix.CellType):
+    """Load the data used to create a custom element from a file."""
+    with np.load(filename) as f:
+        data = dict(f)
+    top = basix.topology(cell)
+    x = [[data[f"x_{d}_{i}"] for i in range(len(t))] for d, t in enumerate(top)]
+    M = [[data[f"M_{d}_{i}"] for i in range(len(t))] for d, t in enumerate(top)]
+    return data["wcoeffs"], x, M
+
+
+def _create(name: str, cell: basix.CellType, degree: int, custom_data=None):
+    """Create an element."""
+    if name != "custom":
+        family, kwargs = _FAMILIES[name]
+        return basix.create_element(family, cell, degree, **kwargs)
+
+    wcoeffs, x, M = custom_data
+    return basix.create_custom_element(
+        cell,
+        [],
+        wcoeffs,
+        x,
+        M,
+        0,
+        basix.MapType.identity,
+        basix.SobolevSpace.H1,
+        False,
+        degree,
+        degree,
+        basix.PolysetType.standard,
+    )
+
+
+def _time_first(args: list[str], repeat: int) -> float:
+    """Best time in seconds of creating an element in a new process."""
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, __file__, "--first", *args], capture_output=True, text=True, check=True
+        )
+        times.append(float(out.stdout))
+    return min(times)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3, help="Number of repeats")
+    parser.add_argument(
+        "--degrees", type=int, nargs="+", default=[2, 4, 6, 8], help="Element degrees"
+    )
+    parser.add_argument(
+        "--families",
+        nargs="+",
+        default=list(_FAMILIES),
+        choices=list(_FAMILIES),
+        help="Element families",
+    )
+    parser.add_argument("--first", nargs="+", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.first is not None:
+        # Time the creation of one element in this (new) process
+        name, cell, degree, *filename = args.first
+        cell, degree = basix.CellType[cell], int(degree)
+        data = _load_custom_data(filename[0], cell) if name == "custom" else None
+        print(_time(lambda: _create(name, cell, degree, data), 1))
+        return
+
+    cells = [basix.CellType.tetrahedron, basix.CellType.hexahedron]
+    print(f"{'family':>8} {'cell':>12} {'degree':>6} {'dim':>6}", end=" ")
+    print(f"{'first (ms)':>11} {'cached (ms)':>11}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name in args.families:
+            family, _ = _FAMILIES[name]
+            for cell in cells:
+                for degree in args.degrees:
+                    if family == basix.ElementFamily.bubble and degree < (
+                        4 if cell == basix.CellType.tetrahedron else 2
+                    ):
+                        continue
+                    worker_args = [name, cell.name, str(degree)]
+                    custom_data = None
+                    if name == "custom":
+                        filename = os.path.join(tmpdir, f"{cell.name}_{degree}.npz")
+                        _save_custom_data(filename, cell, degree)
+                        worker_args.append(filename)
+                        custom_data = _load_custom_data(filename, cell)
+
+                    t_first = _time_first(worker_args, args.repeat)
+                    e = _create(name, cell, degree, custom_data)
+                    t = _time(lambda: _create(name, cell, degree, custom_data), args.repeat)
+                    print(
+                        f"{name:>8} {cell.name:>12} {degree:>6} {e.dim:>6} "
+                        f"{1e3 * t_first:>11.3f} {1e3 * t:>11.3f}"
+                    )
+
+
+if __name__ == "__main__":
+    main()
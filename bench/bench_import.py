@@ -0,0 +1,84 @@
+# Copyright (C) 2026 The FEniCS Project
+#
+# This file is part of Basix (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    MIT
+"""Benchmark the time taken to import Basix.
+
+Imports Basix in a new interpreter with ``python -X importtime`` and
+reports the time taken by the slowest modules. NumPy is imported
+before Basix, so its import time is not included. Run with::
+
+    python bench/bench_import.py
+
+If ``--budget`` is given, the benchmark fails if the best import time
+is larger than the budget, or if importing Basix imports any of the
+modules that Basix loads lazily.
+"""
+
+import argparse
+import subprocess
+import sys
+
+# Modules that must not be imported by ``import basix``
+_LAZY = ["basix.ufl", "basix.numba_helpers", "basix.vis", "ufl", "numba"]
+
+
+def _import_times() -> dict[str, int]:
+    """Cumulative import time in microseconds of each module imported by Basix."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import numpy; import basix"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    times: dict[str, int] = {}
+    started = False
+    for line in out.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        name = name.strip()
+        # Modules are listed once they have been imported, so the modules
+        # imported by Basix are those listed after NumPy
+        if started:
+            times[name] = int(cumulative)
+        started = started or name == "numpy"
+    return times
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of repeats")
+    parser.add_argument("--top", type=int, default=10, help="Number of modules to list")
+    parser.add_argument(
+        "--budget", type=float, default=None, help="Maximum import time in milliseconds"
+    )
+    args = parser.parse_args()
+
+    runs = [_import_times() for _ in range(args.repeat)]
+    best = min(runs, key=lambda t: t["basix"])
+
+    print(f"{'module':>40} {'time (ms)':>10}")
+    for name, t in sorted(best.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"{name:>40} {1e-3 * t:>10.3f}")
+
+    total = 1e-3 * best["basix"]
+    print(f"import basix: {total:.3f} ms")
+
+    if args.budget is not None:
+        failed = False
+        lazy = [name for name in _LAZY if name in best]
+        if len(lazy) > 0:
+            print(f"Modules that should be lazily imported were imported: {', '.join(lazy)}")
+            failed = True
+        if total > args.budget:
+            print(f"Import time is larger than the budget of {args.budget:.3f} ms")
+            failed = True
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Copyright (C) 2026 The FEniCS Project
+#
+# This file is part of Basix (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    MIT
+"""Benchmark the computation of one-dimensional quadrature rules.
+
+Times the computation of Gauss-Jacobi and Gauss-Lobatto-Legendre rules
+with up to 500 points. Run with::
+
+    python bench/bench_quadrature.py
+"""
+
+import argparse
+import timeit
+
+import basix
+
+
+def _time(f, repeat: int) -> float:
+    """Best time in seconds of a number of calls of a function."""
+    return min(timeit.repeat(f, number=1, repeat=repeat))
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of repeats")
+    parser.add_argument(
+        "--npoints",
+        type=int,
+        nargs="+",
+        default=[10, 20, 50, 100, 200, 500],
+        help="Numbers of quadrature points",
+    )
+    args = parser.parse_args()
+
+    print(f"{'m':>6} {'GJ a=0 (ms)':>12} {'GJ a=2 (ms)':>12} {'GLL (ms)':>12}")
+    for m in args.npoints:
+        t0 = _time(lambda: basix.quadrature.gauss_jacobi_rule(0.0, m), args.repeat)
+        t2 = _time(lambda: basix.quadrature.gauss_jacobi_rule(2.0, m), args.repeat)
+        tgll = _time(
+            lambda: basix.make_quadrature(
+                basix.CellType.interval, 2 * m - 3, rule=basix.QuadratureType.gll
+            ),
+            args.repeat,
+        )
+        print(f"{m:>6} {1e3 * t0:>12.3f} {1e3 * t2:>12.3f} {1e3 * tgll:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,8 +8,11 @@
 #include "polyset.h"
 #include <algorithm>
 #include <array>
+#include <atomic>
 #include <concepts>
 #include <functional>
+#include <map>
+#include <mutex>
 #include <span>
 #include <tuple>
 
@@ -494,6 +497,154 @@ std::pair<std::vector<T>, std::array<std::size_t, 2>> compute_transformation(
 
   return {std::move(transformb), {transform.extent(0), transform.extent(1)}};
 }
+//-----------------------------------------------------------------------------
+void combine_hashes(std::size_t& a, std::size_t b)
+{
+  a ^= b + 0x9e3779b9 + (a << 6) + (a >> 2);
+}
+//-----------------------------------------------------------------------------
+/// Number of times that compute_entity_transformations() has found the
+/// transformations for an entity type in its cache
+std::atomic<std::size_t> cache_hits = 0;
+//-----------------------------------------------------------------------------
+template <std::floating_point T>
+std::pair<std::vector<T>, std::array<std::size_t, 3>> compute_transformations(
+    cell::type cell_type, int tdim, int entity,
+    const std::vector<map_data_t<T>>& emap_data,
+    const std::array<std::vector<mdspan_t<const T, 2>>, 4>& x,
+    const std::array<std::vector<mdspan_t<const T, 4>>, 4>& M,
+    mdspan_t<const T, 2> coeffs, int degree, std::size_t vs,
+    maps::type map_type, polyset::type ptype)
+{
+  std::size_t ndofs = M[tdim].size() == 0 ? 0 : M[tdim][entity].extent(0);
+  std::vector<T> transform;
+  transform.reserve(emap_data.size() * ndofs * ndofs);
+  for (auto& [mapfn, J, detJ, K] : emap_data)
+  {
+    auto [t2b, _]
+        = compute_transformation(cell_type, x, M, coeffs, J, detJ, K, mapfn,
+                                 degree, tdim, entity, vs, map_type, ptype);
+    transform.insert(transform.end(), t2b.begin(), t2b.end());
+  }
+
+  return {std::move(transform), {emap_data.size(), ndofs, ndofs}};
+}
+//-----------------------------------------------------------------------------
+/// Compute the transformations of the DOFs associated with the first
+/// sub-entity of type `entity_type` of the cell, or find them in a
+/// cache if they have already been computed.
+///
+/// The transformations of the DOFs of an entity only depend on the
+/// interpolation points and matrix of the entity and on the rows of
+/// `coeffs` for these DOFs, so the same transformations are computed
+/// for many elements, eg elements with different DOF orderings and the
+/// sub-elements of blocked elements. Entries are found using a hash of
+/// this data, and the data is stored with each entry and compared to
+/// check that an entry really is for the same data. The cache is
+/// cleared if it grows too large.
+template <std::floating_point T>
+std::pair<std::vector<T>, std::array<std::size_t, 3>> cached_transformations(
+    cell::type cell_type, cell::type entity_type,
+    const std::vector<map_data_t<T>>& emap_data,
+    const std::array<std::vector<mdspan_t<const T, 2>>, 4>& x,
+    const std::array<std::vector<mdspan_t<const T, 4>>, 4>& M,
+    mdspan_t<const T, 2> coeffs, int degree, std::size_t vs,
+    maps::type map_type, polyset::type ptype)
+{
+  const int tdim = cell::topological_dimension(entity_type);
+  const int entity = find_first_subentity(cell_type, entity_type);
+  if (x[tdim].empty() or x[tdim][entity].extent(0) == 0)
+  {
+    return compute_transformations(cell_type, tdim, entity, emap_data, x, M,
+                                   coeffs, degree, vs, map_type, ptype);
+  }
+
+  using key_t = std::tuple<cell::type, cell::type, int, std::size_t, maps::type,
+                           polyset::type, std::size_t>;
+  using value_t = std::pair<std::vector<T>, std::array<std::size_t, 3>>;
+  struct entry_t
+  {
+    std::array<std::size_t, 7> shape;
+    std::vector<T> data;
+    value_t value;
+  };
+  static std::mutex cache_mutex;
+  static std::map<key_t, entry_t> cache;
+  static std::size_t cache_data_size = 0;
+  constexpr std::size_t max_cache_size = 256;
+  constexpr std::size_t max_cache_data_size = 1 << 20;
+
+  mdspan_t<const T, 2> x_e = x[tdim][entity];
+  mdspan_t<const T, 4> M_e = M[tdim][entity];
+  std::size_t dofstart = 0;
+  for (int d = 0; d < tdim; ++d)
+    for (auto& M_d : M[d])
+      dofstart += M_d.extent(0);
+  for (int i = 0; i < entity; ++i)
+    dofstart += M[tdim][i].extent(0);
+
+  const std::array<std::size_t, 7> shape
+      = {x_e.extent(0), x_e.extent(1), M_e.extent(0),   M_e.extent(1),
+         M_e.extent(2), M_e.extent(3), coeffs.extent(1)};
+  const std::array<std::span<const T>, 3> data
+      = {std::span(x_e.data_handle(), x_e.size()),
+         std::span(M_e.data_handle(), M_e.size()),
+         std::span(coeffs.data_handle() + dofstart * coeffs.extent(1),
+                   M_e.extent(0) * coeffs.extent(1))};
+
+  std::size_t h = 0;
+  for (std::size_t n : shape)
+    combine_hashes(h, n);
+  for (std::span<const T> d : data)
+    for (T v : d)
+      combine_hashes(h, std::hash<T>{}(v));
+
+  const key_t key = {cell_type, entity_type, degree, vs, map_type, ptype, h};
+  {
+    std::scoped_lock lock(cache_mutex);
+    if (auto it = cache.find(key);
+        it != cache.end() and it->second.shape == shape)
+    {
+      // The shapes are equal, so the data has the same size
+      auto stored = it->second.data.begin();
+      bool equal = true;
+      for (std::span<const T> d : data)
+      {
+        equal = equal and std::equal(d.begin(), d.end(), stored);
+        stored += d.size();
+      }
+      if (equal)
+      {
+        ++cache_hits;
+        return it->second.value;
+      }
+    }
+  }
+
+  value_t out = compute_transformations(cell_type, tdim, entity, emap_data, x,
+                                        M, coeffs, degree, vs, map_type, ptype);
+
+  std::vector<T> stored_data;
+  for (std::span<const T> d : data)
+    stored_data.insert(stored_data.end(), d.begin(), d.end());
+
+  std::scoped_lock lock(cache_mutex);
+  if (auto it = cache.find(key); it != cache.end())
+  {
+    // Replace an entry for different data with the same hash
+    cache_data_size -= it->second.data.size();
+    cache.erase(it);
+  }
+  if (cache.size() >= max_cache_size
+      or cache_data_size + stored_data.size() > max_cache_data_size)
+  {
+    cache.clear();
+    cache_data_size = 0;
+  }
+  cache_data_size += stored_data.size();
+  cache.emplace(key, entry_t{shape, std::move(stored_data), out});
+  return out;
+}
 } // namespace
 //-----------------------------------------------------------------------------
 template <std::floating_point T>
@@ -514,27 +665,19 @@ doftransforms::compute_entity_transformations(
   const mapinfo_t<T> mapinfo = get_mapinfo<T>(cell_type);
   for (auto& [entity_type, emap_data] : mapinfo)
   {
-    const int tdim = cell::topological_dimension(entity_type);
-    const int entity = find_first_subentity(cell_type, entity_type);
-    std::size_t ndofs = M[tdim].size() == 0 ? 0 : M[tdim][entity].extent(0);
-    std::vector<T> transform;
-    transform.reserve(emap_data.size() * ndofs * ndofs);
-    for (auto& [mapfn, J, detJ, K] : emap_data)
-    {
-      auto [t2b, _]
-          = compute_transformation(cell_type, x, M, coeffs, J, detJ, K, mapfn,
-                                   degree, tdim, entity, vs, map_type, ptype);
-      transform.insert(transform.end(), t2b.begin(), t2b.end());
-    }
-
-    out.try_emplace(entity_type,
-                    std::pair(std::move(transform),
-                              std::array{emap_data.size(), ndofs, ndofs}));
+    out.try_emplace(entity_type, cached_transformations(
+                                     cell_type, entity_type, emap_data, x, M,
+                                     coeffs, degree, vs, map_type, ptype));
   }
 
   return out;
 }
 //-----------------------------------------------------------------------------
+std::size_t doftransforms::entity_transformations_cache_hits()
+{
+  return cache_hits;
+}
+//-----------------------------------------------------------------------------
 /// @cond
 template std::map<cell::type,
                   std::pair<std::vector<float>, std::array<std::size_t, 3>>>
@@ -22,6 +22,10 @@ namespace basix::doftransforms
 {
 /// @brief Compute the entity DOF transformations for an element.
 ///
+/// The transformations for each entity type are cached, so elements
+/// that have the same DOFs on an entity (eg elements that differ only
+/// in their DOF ordering) do not recompute them.
+///
 /// @param[in] cell_type The cell type
 /// @param[in] x Interpolation points for the element. Indices are
 /// (tdim, entity index, point index, dim)
@@ -49,4 +53,11 @@ compute_entity_transformations(
     md::mdspan<const T, md::dextents<std::size_t, 2>> coeffs, int degree,
     std::size_t vs, maps::type map_type, polyset::type ptype);
 
+/// @brief The number of times that compute_entity_transformations()
+/// has found the transformations for an entity type in its cache.
+///
+/// This is intended for testing.
+/// @return The number of cache hits
+std::size_t entity_transformations_cache_hits();
+
 } // namespace basix::doftransforms
@@ -6,6 +6,7 @@
 #include "element-families.h"
 #include "lattice.h"
 #include "maps.h"
+#include "math.h"
 #include "polyset.h"
 #include "quadrature.h"
 #include "sobolev-spaces.h"
@@ -177,11 +178,18 @@ FiniteElement<T> basix::element::create_bubble(cell::type celltype, int degree,
     throw std::runtime_error("Unknown cell type.");
   }
 
-  impl::mdarray_t<T, 2> wcoeffs(ndofs, psize);
+  // wcoeffs = (phi1 * bubble * wts) phi^T
   for (std::size_t i = 0; i < phi1.extent(0); ++i)
+    for (std::size_t k = 0; k < wts.size(); ++k)
+      phi1(i, k) *= wts[k] * bubble[k];
+  std::vector<T> phit_b(wts.size() * psize);
+  impl::mdspan_t<T, 2> phit(phit_b.data(), wts.size(), psize);
+  for (std::size_t k = 0; k < wts.size(); ++k)
     for (std::size_t j = 0; j < psize; ++j)
-      for (std::size_t k = 0; k < wts.size(); ++k)
-        wcoeffs(i, j) += wts[k] * phi1(i, k) * bubble[k] * phi(0, j, k);
+      phit(k, j) = phi(0, j, k);
+
+  impl::mdarray_t<T, 2> wcoeffs(ndofs, psize);
+  math::dot(phi1, phit, impl::mdspan_t<T, 2>(wcoeffs.data(), ndofs, psize));
 
   math::orthogonalise<T>(wcoeffs);
 
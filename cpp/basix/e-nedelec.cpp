@@ -395,12 +395,14 @@ FiniteElement<T> element::create_nedelec2(cell::type celltype, int degree,
 
   const std::size_t psize
       = polyset::dim(celltype, polyset::type::standard, degree);
+  sobolev::space space
+      = discontinuous ? sobolev::space::L2 : sobolev::space::HCurl;
   return FiniteElement<T>(
       element::family::N2E, celltype, polyset::type::standard, degree, {tdim},
       impl::mdspan_t<T, 2>(math::eye<T>(tdim * psize).data(), tdim * psize,
                            tdim * psize),
-      xview, Mview, 0, maps::type::covariantPiola, sobolev::space::HCurl,
-      discontinuous, degree, degree, lvariant, element::dpc_variant::unset);
+      xview, Mview, 0, maps::type::covariantPiola, space, discontinuous, degree,
+      degree, lvariant, element::dpc_variant::unset);
 }
 //-----------------------------------------------------------------------------
 template FiniteElement<float> element::create_nedelec(cell::type, int,
@@ -19,10 +19,14 @@
 #include "polyset.h"
 #include <algorithm>
 #include <basix/version.h>
+#include <bit>
 #include <cmath>
 #include <concepts>
+#include <exception>
 #include <limits>
 #include <numeric>
+#include <optional>
+#include <thread>
 
 #define str_macro(X) #X
 #define str(X) str_macro(X)
@@ -81,6 +85,24 @@ constexpr int num_transformations(cell::type cell_type)
   }
 }
 //-----------------------------------------------------------------------------
+/// Set on the threads started by Basix, so that work started on them
+/// runs serially instead of starting more threads
+thread_local bool in_worker_thread = false;
+//-----------------------------------------------------------------------------
+/// Number of threads to start for work that can be split into at most
+/// `max_threads` parts, when `num_threads` threads are requested. No
+/// more threads than the number of hardware threads are started.
+std::size_t num_worker_threads(int num_threads, std::size_t max_threads)
+{
+  if (num_threads < 1)
+    throw std::runtime_error("The number of threads must be at least 1.");
+  const std::size_t hw_threads
+      = std::max(1u, std::thread::hardware_concurrency());
+  return std::max<std::size_t>(std::min({static_cast<std::size_t>(num_threads),
+                                         hw_threads, max_threads}),
+                               1);
+}
+//-----------------------------------------------------------------------------
 template <std::floating_point T>
 std::pair<std::vector<T>, std::array<std::size_t, 2>> compute_dual_matrix(
     cell::type cell_type, polyset::type poly_type, mdspan_t<const T, 2> B,
@@ -104,69 +126,114 @@ std::pair<std::vector<T>, std::array<std::size_t, 2>> compute_dual_matrix(
   std::size_t pdim = polyset::dim(cell_type, poly_type, degree);
   mdarray_t<T, 3> D(vs, pdim, num_dofs);
   std::fill(D.data(), D.data() + D.size(), 0);
-  std::vector<T> Pb;
 
-  // Loop over different dimensions
-  std::size_t dof_index = 0;
-  for (std::size_t d = 0; d < M.size(); ++d)
+  // List the entities with their first dof and an estimate of the cost
+  // of their contribution
+  std::vector<std::array<std::size_t, 3>> entities;
+  std::size_t work = 0;
   {
-    // Loop over entities of dimension d
-    for (std::size_t e = 0; e < x[d].size(); ++e)
+    std::size_t dof_index = 0;
+    for (std::size_t d = 0; d < M.size(); ++d)
     {
-      // Evaluate polynomial basis at x[d]
-      mdspan_t<const T, 2> x_e = x[d][e];
-      mdspan_t<const T, 3> P;
-      if (x_e.extent(0) > 0)
+      for (std::size_t e = 0; e < M[d].size(); ++e)
       {
-        std::array<std::size_t, 3> shape;
-        std::tie(Pb, shape)
-            = polyset::tabulate(cell_type, poly_type, degree, nderivs, x_e);
-        P = mdspan_t<const T, 3>(Pb.data(), shape);
+        mdspan_t<const T, 4> Me = M[d][e];
+        entities.push_back({d, e, dof_index});
+        work += Me.extent(0) * Me.extent(1) * Me.extent(2) * Me.extent(3);
+        dof_index += Me.extent(0);
       }
+    }
+  }
+  work *= pdim;
 
-      // Me: [dof, vs, point, deriv]
-      mdspan_t<const T, 4> Me = M[d][e];
-
-      // Compute dual matrix contribution
-      if (Me.extent(3) > 1)
-      {
-        for (std::size_t l = 0; l < Me.extent(3); ++l)       // Derivative
-          for (std::size_t m = 0; m < P.extent(1); ++m)      // Polynomial term
-            for (std::size_t i = 0; i < Me.extent(0); ++i)   // Dof index
-              for (std::size_t j = 0; j < Me.extent(1); ++j) // Value index
-                for (std::size_t k = 0; k < Me.extent(2); ++k) // Point
-                  D(j, m, dof_index + i) += Me(i, j, k, l) * P(l, m, k);
-      }
-      else
+  // Add the contribution of an entity to D. Entities own disjoint sets
+  // of dofs, so the contributions can be computed concurrently.
+  auto compute = [&](std::size_t d, std::size_t e, std::size_t dof_index)
+  {
+    // Me: [dof, vs, point, deriv]
+    mdspan_t<const T, 2> x_e = x[d][e];
+    mdspan_t<const T, 4> Me = M[d][e];
+    if (x_e.extent(0) == 0 or Me.extent(0) == 0)
+      return;
+
+    // Evaluate polynomial basis at x[d]
+    const auto [Pb, shape]
+        = polyset::tabulate(cell_type, poly_type, degree, nderivs, x_e);
+    mdspan_t<const T, 3> P(Pb.data(), shape);
+
+    // Contracting over the points and derivatives is a single
+    // matrix-matrix product of Me, viewed as a (dof * vs, point *
+    // deriv) matrix, with the derivatives of the polynomials stacked
+    // into a (point * deriv, poly) matrix
+    const std::size_t nd = Me.extent(3);
+    std::vector<T> Pt_b(P.extent(2) * nd * P.extent(1));
+    mdspan_t<T, 3> Pt(Pt_b.data(), P.extent(2), nd, P.extent(1));
+    for (std::size_t i = 0; i < Pt.extent(0); ++i)
+      for (std::size_t l = 0; l < Pt.extent(1); ++l)
+        for (std::size_t j = 0; j < Pt.extent(2); ++j)
+          Pt(i, l, j) = P(l, j, i);
+
+    std::vector<T> De_b(Me.extent(0) * Me.extent(1) * P.extent(1));
+    mdspan_t<T, 2> De(De_b.data(), Me.extent(0) * Me.extent(1), P.extent(1));
+    math::dot(
+        mdspan_t<const T, 2>(Me.data_handle(), Me.extent(0) * Me.extent(1),
+                             Me.extent(2) * nd),
+        mdspan_t<const T, 2>(Pt_b.data(), Me.extent(2) * nd, P.extent(1)), De);
+
+    // Expand and copy
+    for (std::size_t i = 0; i < Me.extent(0); ++i)
+      for (std::size_t j = 0; j < Me.extent(1); ++j)
+        for (std::size_t k = 0; k < P.extent(1); ++k)
+          D(j, k, dof_index + i) = De(i * Me.extent(1) + j, k);
+  };
+
+  // Only use threads when there is enough work to pay for them, and
+  // not when already running on a thread started by Basix (e.g. in
+  // create_elements)
+  constexpr std::size_t min_work_per_thread = 1 << 22;
+  const std::size_t nthreads
+      = in_worker_thread
+            ? 1
+            : std::clamp<std::size_t>(
+                  std::min<std::size_t>(std::thread::hardware_concurrency(),
+                                        work / min_work_per_thread),
+                  1, entities.size());
+  if (nthreads <= 1)
+  {
+    for (auto [d, e, dof_index] : entities)
+      compute(d, e, dof_index);
+  }
+  else
+  {
+    std::vector<std::exception_ptr> errors(nthreads);
+    {
+      std::vector<std::jthread> threads;
+      threads.reserve(nthreads);
+      for (std::size_t t = 0; t < nthreads; ++t)
       {
-        // Flatten and use matrix-matrix multiplication, possibly using
-        // BLAS for larger cases. We can do this straightforwardly when
-        // Me.extent(3) == 1 since we are contracting over one index
-        // only.
-
-        std::vector<T> Pt_b(P.extent(2) * P.extent(1));
-        mdspan_t<T, 2> Pt(Pt_b.data(), P.extent(2), P.extent(1));
-        for (std::size_t i = 0; i < Pt.extent(0); ++i)
-          for (std::size_t j = 0; j < Pt.extent(1); ++j)
-            Pt(i, j) = P(0, j, i);
-
-        std::vector<T> De_b(Me.extent(0) * Me.extent(1) * Pt.extent(1));
-        mdspan_t<T, 2> De(De_b.data(), Me.extent(0) * Me.extent(1),
-                          Pt.extent(1));
-        math::dot(mdspan_t<const T, 2>(Me.data_handle(),
-                                       Me.extent(0) * Me.extent(1),
-                                       Me.extent(2)),
-                  Pt, De);
-
-        // Expand and copy
-        for (std::size_t i = 0; i < Me.extent(0); ++i)
-          for (std::size_t j = 0; j < Me.extent(1); ++j)
-            for (std::size_t k = 0; k < P.extent(1); ++k)
-              D(j, k, dof_index + i) += De(i * Me.extent(1) + j, k);
+        threads.emplace_back(
+            [&, t]()
+            {
+              in_worker_thread = true;
+              try
+              {
+                for (std::size_t i = t; i < entities.size(); i += nthreads)
+                {
+                  auto [d, e, dof_index] = entities[i];
+                  compute(d, e, dof_index);
+                }
+              }
+              catch (...)
+              {
+                errors[t] = std::current_exception();
+              }
+            });
       }
-
-      dof_index += M[d][e].extent(0);
     }
+
+    for (auto& e : errors)
+      if (e)
+        std::rethrow_exception(e);
   }
 
   // Flatten D
@@ -183,6 +250,65 @@ void combine_hashes(std::size_t& a, std::size_t b)
   a ^= b + 0x9e3779b9 + (a << 6) + (a >> 2);
 }
 //-----------------------------------------------------------------------------
+
+/// @brief A 64-bit hash of a stream of values that is the same on all
+/// platforms and in all processes.
+///
+/// Each value is read as an unsigned integer with the bits of the
+/// value, which gives the same result as reading its little-endian
+/// bytes. Integers are widened to 64 bits so that the hash does not
+/// depend on the size of `std::size_t`.
+class stable_hasher
+{
+public:
+  /// Add a value to the hash
+  template <typename T>
+    requires std::is_arithmetic_v<T>
+  void add(T v)
+  {
+    if constexpr (std::is_same_v<T, float>)
+      round(std::bit_cast<std::uint32_t>(v));
+    else if constexpr (std::is_same_v<T, double>)
+      round(std::bit_cast<std::uint64_t>(v));
+    else
+      round(static_cast<std::uint64_t>(static_cast<std::int64_t>(v)));
+  }
+
+  /// Add the size and the values of a range to the hash
+  template <std::ranges::sized_range R>
+  void add_range(const R& r)
+  {
+    add(std::ranges::size(r));
+    for (auto v : r)
+      add(v);
+  }
+
+  /// The hash of the values added so far
+  std::uint64_t value() const
+  {
+    // Final avalanche, as in xxHash
+    std::uint64_t h = _h;
+    h ^= h >> 33;
+    h *= 0xc2b2ae3d27d4eb4f;
+    h ^= h >> 29;
+    h *= 0x165667b19e3779f9;
+    h ^= h >> 32;
+    return h;
+  }
+
+private:
+  void round(std::uint64_t w)
+  {
+    w *= 0xc2b2ae3d27d4eb4f;
+    w = std::rotl(w, 31);
+    w *= 0x9e3779b185ebca87;
+    _h ^= w;
+    _h = std::rotl(_h, 27) * 0x9e3779b185ebca87 + 0x85ebca77c2b2ae63;
+  }
+
+  std::uint64_t _h = 0x27d4eb2f165667c5;
+};
+//-----------------------------------------------------------------------------
 } // namespace
 //-----------------------------------------------------------------------------
 template <std::floating_point T>
@@ -323,6 +449,80 @@ basix::create_element(element::family, cell::type, int,
                       std::vector<int>);
 //-----------------------------------------------------------------------------
 template <std::floating_point T>
+std::vector<FiniteElement<T>> basix::create_elements(
+    const std::vector<
+        std::tuple<element::family, cell::type, int, element::lagrange_variant,
+                   element::dpc_variant, bool, std::vector<int>>>& specs,
+    int num_threads)
+{
+  const std::size_t nthreads = num_worker_threads(num_threads, specs.size());
+  if (specs.empty())
+    return {};
+
+  std::vector<std::optional<FiniteElement<T>>> elements(specs.size());
+  std::vector<std::exception_ptr> errors(specs.size());
+
+  // The cost of creating elements varies a lot, so each thread takes
+  // the next element that has not been started
+  std::atomic<std::size_t> next = 0;
+  auto create = [&]()
+  {
+    for (std::size_t i = next++; i < specs.size(); i = next++)
+    {
+      auto& [family, cell, degree, lvariant, dvariant, discontinuous,
+             dof_ordering] = specs[i];
+      try
+      {
+        elements[i] = create_element<T>(family, cell, degree, lvariant,
+                                        dvariant, discontinuous, dof_ordering);
+      }
+      catch (...)
+      {
+        errors[i] = std::current_exception();
+      }
+    }
+  };
+
+  if (nthreads <= 1)
+    create();
+  else
+  {
+    std::vector<std::jthread> threads;
+    threads.reserve(nthreads);
+    for (std::size_t i = 0; i < nthreads; ++i)
+    {
+      threads.emplace_back(
+          [&]()
+          {
+            in_worker_thread = true;
+            create();
+          });
+    }
+  }
+
+  for (auto& e : errors)
+    if (e)
+      std::rethrow_exception(e);
+
+  std::vector<FiniteElement<T>> out;
+  out.reserve(elements.size());
+  for (auto& e : elements)
+    out.push_back(std::move(*e));
+  return out;
+}
+//-----------------------------------------------------------------------------
+template std::vector<basix::FiniteElement<float>> basix::create_elements(
+    const std::vector<
+        std::tuple<element::family, cell::type, int, element::lagrange_variant,
+                   element::dpc_variant, bool, std::vector<int>>>&,
+    int);
+template std::vector<basix::FiniteElement<double>> basix::create_elements(
+    const std::vector<
+        std::tuple<element::family, cell::type, int, element::lagrange_variant,
+                   element::dpc_variant, bool, std::vector<int>>>&,
+    int);
+//-----------------------------------------------------------------------------
+template <std::floating_point T>
 FiniteElement<T>
 basix::create_tp_element(element::family family, cell::type cell, int degree,
                          element::lagrange_variant lvariant,
@@ -986,20 +1186,18 @@ FiniteElement<T> basix::create_custom_element(
     }
   }
 
-  auto [dualmatrix, dualshape]
-      = compute_dual_matrix(cell_type, poly_type, wcoeffs_ortho, x, M,
-                            embedded_superdegree, interpolation_nderivs);
-  if (math::is_singular(mdspan_t<const T, 2>(dualmatrix.data(), dualshape)))
-  {
-    throw std::runtime_error(
-        "Dual matrix is singular, there is an error in your inputs");
-  }
-
-  return basix::FiniteElement<T>(
+  // The constructor checks that the dual matrix is not singular
+  basix::FiniteElement<T> e(
       element::family::custom, cell_type, poly_type, embedded_superdegree,
       value_shape, wcoeffs_ortho, x, M, interpolation_nderivs, map_type,
       sobolev_space, discontinuous, embedded_subdegree, embedded_superdegree,
       element::lagrange_variant::unset, element::dpc_variant::unset);
+
+  // Compute the DOF transformations now, so that errors in the input
+  // are reported when the element is created rather than when it is
+  // first used
+  e.precompute_transformations();
+  return e;
 }
 //-----------------------------------------------------------------------------
 /// @cond
@@ -1068,10 +1266,11 @@ FiniteElement<F>::FiniteElement(
   std::copy(wcoeffs.data_handle(), wcoeffs.data_handle() + wcoeffs.size(),
             wcoeffs_b.begin());
 
-  _wcoeffs = {wcoeffs_b, {wcoeffs.extent(0), wcoeffs.extent(1)}};
-  _dual_matrix
-      = compute_dual_matrix<F>(cell_type, poly_type, wcoeffs, x, M,
-                               embedded_superdegree, interpolation_nderivs);
+  _wcoeffs = std::make_shared<const array2_t>(
+      std::move(wcoeffs_b), std::array{wcoeffs.extent(0), wcoeffs.extent(1)});
+  _dual_matrix = std::make_shared<const array2_t>(
+      compute_dual_matrix<F>(cell_type, poly_type, wcoeffs, x, M,
+                             embedded_superdegree, interpolation_nderivs));
 
   // Copy x
   for (std::size_t i = 0; i < x.size(); ++i)
@@ -1096,24 +1295,34 @@ FiniteElement<F>::FiniteElement(
   }
 
   // Compute C = (BD^T)^{-1} B
-  _coeffs.first = math::solve<F>(
-      mdspan_t<const F, 2>(_dual_matrix.first.data(), _dual_matrix.second),
-      wcoeffs);
-  _coeffs.second = {_dual_matrix.second[1], wcoeffs.extent(1)};
+  array2_t coeffs;
+  try
+  {
+    coeffs.first = math::solve<F>(
+        mdspan_t<const F, 2>(_dual_matrix->first.data(), _dual_matrix->second),
+        wcoeffs);
+  }
+  catch (const std::runtime_error&)
+  {
+    throw std::runtime_error(
+        "Dual matrix is singular, there is an error in your inputs");
+  }
+  coeffs.second = {_dual_matrix->second[1], wcoeffs.extent(1)};
+  _coeffs = std::make_shared<const array2_t>(std::move(coeffs));
 
   std::size_t num_points = 0;
   for (auto& x_dim : x)
     for (auto& x_e : x_dim)
       num_points += x_e.extent(0);
 
-  _points.first.reserve(num_points * _cell_tdim);
-  _points.second = {num_points, _cell_tdim};
-  mdspan_t<F, 2> pview(_points.first.data(), _points.second);
+  array2_t points;
+  points.first.reserve(num_points * _cell_tdim);
+  points.second = {num_points, _cell_tdim};
   for (auto& x_dim : x)
     for (auto& x_e : x_dim)
       for (std::size_t p = 0; p < x_e.extent(0); ++p)
         for (std::size_t k = 0; k < x_e.extent(1); ++k)
-          _points.first.push_back(x_e(p, k));
+          points.first.push_back(x_e(p, k));
 
   // Copy into _matM
   const std::size_t value_size = std::accumulate(
@@ -1131,24 +1340,21 @@ FiniteElement<F>::FiniteElement(
   }
 
   // Check that number of dofs is equal to number of coefficients
-  if (num_dofs != _coeffs.second[0])
+  if (num_dofs != _coeffs->second[0])
   {
     throw std::runtime_error(
         "Number of entity dofs does not match total number of dofs");
   }
 
-  _entity_transformations = doftransforms::compute_entity_transformations(
-      cell_type, x, M,
-      mdspan_t<const F, 2>(_coeffs.first.data(), _coeffs.second),
-      embedded_superdegree, value_size, map_type, poly_type);
-
   const std::size_t nderivs
       = polyset::nderivs(cell_type, interpolation_nderivs);
 
-  _matM = {std::vector<F>(num_dofs * value_size * num_points1 * nderivs),
-           {num_dofs, value_size * num_points1 * nderivs}};
-  mdspan_t<F, 4> Mview(_matM.first.data(), num_dofs, value_size, num_points1,
-                       nderivs);
+  array2_t matM_data
+      = {std::vector<F>(num_dofs * value_size * num_points1 * nderivs),
+         {num_dofs, value_size * num_points1 * nderivs}};
+  mdspan_t<F, 4> Mview(matM_data.first.data(), num_dofs, value_size,
+                       num_points1, nderivs);
+  std::vector<array2_t> block_data;
 
   // Loop over each topological dimensions
   std::size_t dof_offset(0), point_offset(0);
@@ -1157,17 +1363,42 @@ FiniteElement<F>::FiniteElement(
     // Loop of entities of dimension d
     for (auto& Me : M[d])
     {
+      std::vector<F> Mb(Me.extent(0) * Mview.extent(1) * Me.extent(2)
+                        * Mview.extent(3));
+      mdspan_t<F, 4> Mbview(Mb.data(), Me.extent(0), Mview.extent(1),
+                            Me.extent(2), Mview.extent(3));
       for (std::size_t k0 = 0; k0 < Me.extent(0); ++k0)
+      {
         for (std::size_t k1 = 0; k1 < Mview.extent(1); ++k1)
+        {
           for (std::size_t k2 = 0; k2 < Me.extent(2); ++k2)
+          {
             for (std::size_t k3 = 0; k3 < Mview.extent(3); ++k3)
+            {
               Mview(k0 + dof_offset, k1, k2 + point_offset, k3)
                   = Me(k0, k1, k2, k3);
+              Mbview(k0, k1, k2, k3) = Me(k0, k1, k2, k3);
+            }
+          }
+        }
+      }
+
+      // The dofs of an entity only depend on the values at the points
+      // of the entity, so each entity gives a block of _matM
+      if (Me.extent(0) > 0)
+      {
+        _matM_blocks.push_back(
+            {dof_offset, Me.extent(0), point_offset, Me.extent(2)});
+        block_data.emplace_back(
+            std::move(Mb),
+            std::array{Mbview.extent(0), Mbview.size() / Mbview.extent(0)});
+      }
 
       dof_offset += Me.extent(0);
       point_offset += Me.extent(2);
     }
   }
+  _matM = std::make_shared<const array2_t>(std::move(matM_data));
 
   // Compute number of dofs for each cell entity (computed from
   // interpolation data)
@@ -1207,15 +1438,16 @@ FiniteElement<F>::FiniteElement(
       }
     }
 
-    // Apply permutation to _points (for interpolation)
-    std::vector<F> new_points(_points.first.size());
-    assert(_points.second[0] == _dof_ordering.size());
-    const int gdim = _points.second[1];
+    // Apply permutation to the points (for interpolation)
+    std::vector<F> new_points(points.first.size());
+    assert(points.second[0] == _dof_ordering.size());
+    const int gdim = points.second[1];
     for (std::size_t d = 0; d < _dof_ordering.size(); ++d)
       for (int i = 0; i < gdim; ++i)
-        new_points[gdim * _dof_ordering[d] + i] = _points.first[gdim * d + i];
-    _points = {new_points, _points.second};
+        new_points[gdim * _dof_ordering[d] + i] = points.first[gdim * d + i];
+    points.first = std::move(new_points);
   }
+  _points = std::make_shared<const array2_t>(std::move(points));
 
   const std::vector<std::vector<std::vector<std::vector<int>>>> connectivity
       = cell::sub_entity_connectivity(cell_type);
@@ -1239,14 +1471,406 @@ FiniteElement<F>::FiniteElement(
     }
   }
 
+  // The data used to apply DOF transformations is computed on first
+  // use
+  _transformation_data = std::make_shared<lazy_transformation_data_t>();
+
+  // Check if interpolation matrix is the identity
+  mdspan_t<const F, 2> matM(_matM->first.data(), _matM->second);
+  _interpolation_is_identity = matM.extent(0) == matM.extent(1);
+  for (std::size_t row = 0; _interpolation_is_identity && row < matM.extent(0);
+       ++row)
+  {
+    for (std::size_t col = 0; col < matM.extent(1); ++col)
+    {
+      F v = col == row ? 1.0 : 0.0;
+      const F eps = 10 * degree * degree * std::numeric_limits<F>::epsilon();
+      if (std::abs(matM(row, col) - v) > eps)
+      {
+        _interpolation_is_identity = false;
+        break;
+      }
+    }
+  }
+
+  // The blocks are not needed to interpolate if the interpolation
+  // matrix is the identity
+  if (_interpolation_is_identity)
+    block_data.clear();
+  _matM_block_data
+      = std::make_shared<const std::vector<array2_t>>(std::move(block_data));
+
+  // Hash the data that defines the element. The assembled points and
+  // interpolation matrix are used rather than x and M, as they are
+  // the same for the continuous and discontinuous versions of an
+  // element.
+  stable_hasher hasher;
+  for (auto& a : {_wcoeffs.get(), _points.get(), _matM.get()})
+  {
+    hasher.add_range(a->second);
+    hasher.add_range(a->first);
+  }
+  _data_hash = hasher.value();
+  _content_hash = compute_content_hash();
+}
+/// @endcond
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+const typename FiniteElement<F>::transformation_data_t&
+FiniteElement<F>::transformation_data() const
+{
+  std::call_once(_transformation_data->flag,
+                 [this]()
+                 {
+                   _transformation_data->data = compute_transformation_data();
+                   _transformation_data->computed = true;
+                 });
+  return _transformation_data->data;
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+FiniteElement<F> FiniteElement<F>::slim() const
+{
+  // The transformation data is computed from data that the slim
+  // element does not store, so compute it first
+  transformation_data();
+
+  FiniteElement<F> e(*this);
+  e._wcoeffs = std::make_shared<const array2_t>();
+  e._x = {};
+  e._M = {};
+  e._dual_matrix = std::make_shared<const array2_t>();
+
+  // The interpolation blocks are kept, so the shape of the
+  // interpolation matrix is kept for interpolate()
+  e._matM = std::make_shared<const array2_t>(std::vector<F>(), _matM->second);
+
+  for (auto& factors : e._tensor_factors)
+    for (auto& factor : factors)
+      factor = factor.slim();
+
+  e._slim = true;
+  return e;
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+std::map<std::string, std::size_t> FiniteElement<F>::memory_usage() const
+{
+  auto bytes = [](auto& a) { return a.size() * sizeof(a[0]); };
+
+  auto nested_bytes = [&bytes](auto& a)
+  {
+    std::size_t n = 0;
+    for (auto& a_i : a)
+      n += bytes(a_i);
+    return n;
+  };
+
+  std::map<std::string, std::size_t> usage;
+  usage["coeffs"] = bytes(_coeffs->first);
+  usage["wcoeffs"] = bytes(_wcoeffs->first);
+  usage["dual_matrix"] = bytes(_dual_matrix->first);
+  usage["interpolation_matrix"] = bytes(_matM->first);
+  usage["points"] = bytes(_points->first);
+
+  std::size_t x = 0, M = 0;
+  for (std::size_t d = 0; d < 4; ++d)
+  {
+    for (auto& [x_e, _] : _x[d])
+      x += bytes(x_e);
+    for (auto& [M_e, _] : _M[d])
+      M += bytes(M_e);
+  }
+  usage["x"] = x;
+  usage["M"] = M;
+
+  std::size_t blocks = bytes(_matM_blocks);
+  for (auto& [Mb, _] : *_matM_block_data)
+    blocks += bytes(Mb);
+  usage["interpolation_blocks"] = blocks;
+
+  std::size_t edofs = 0;
+  for (auto& dofs_d : _edofs)
+    edofs += nested_bytes(dofs_d);
+  for (auto& dofs_d : _e_closure_dofs)
+    edofs += nested_bytes(dofs_d);
+  usage["entity_dofs"] = edofs;
+
+  std::size_t factors = 0;
+  for (auto& fs : _tensor_factors)
+  {
+    for (auto& f : fs)
+    {
+      for (auto& [_, b] : f.memory_usage())
+        factors += b;
+    }
+  }
+  usage["tensor_factors"] = factors;
+
+  std::size_t trans = 0;
+  if (_transformation_data->computed)
+  {
+    const transformation_data_t& data = _transformation_data->data;
+    for (auto& [_, t] : data.entity_transformations)
+      trans += bytes(t.first);
+    for (auto perms :
+         {&data.eperm, &data.eperm_inv, &data.subentity_closure_perm,
+          &data.subentity_closure_perm_inv})
+    {
+      for (auto& [_, p] : *perms)
+        trans += nested_bytes(p);
+    }
+    for (auto etrans :
+         {&data.etrans, &data.etransT, &data.etrans_inv, &data.etrans_invT})
+    {
+      for (auto& [_, t] : *etrans)
+      {
+        for (auto& [p, A] : t)
+          trans += bytes(p) + bytes(A.first);
+      }
+    }
+  }
+  usage["transformations"] = trans;
+
+  return usage;
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+template <std::floating_point U>
+FiniteElement<U> FiniteElement<F>::cast() const
+{
+  auto cast_array
+      = []<std::size_t d>(
+            const std::pair<std::vector<F>, std::array<std::size_t, d>>& a)
+  {
+    return std::pair(std::vector<U>(a.first.begin(), a.first.end()), a.second);
+  };
+
+  auto cast_trans = [&cast_array](const std::map<cell::type, trans_data_t>& t)
+  {
+    std::map<cell::type, typename FiniteElement<U>::trans_data_t> t_cast;
+    for (auto& [ct, data] : t)
+    {
+      auto& data_cast = t_cast[ct];
+      for (auto& [perm, A] : data)
+        data_cast.emplace_back(perm, cast_array(A));
+    }
+    return t_cast;
+  };
+
+  auto share = []<typename A>(A&& a)
+  {
+    return std::make_shared<const std::remove_cvref_t<A>>(std::forward<A>(a));
+  };
+
+  FiniteElement<U> e;
+  e._cell_type = _cell_type;
+  e._poly_type = _poly_type;
+  e._cell_tdim = _cell_tdim;
+  e._cell_subentity_types = _cell_subentity_types;
+  e._family = _family;
+  e._lagrange_variant = _lagrange_variant;
+  e._dpc_variant = _dpc_variant;
+  e._degree = _degree;
+  e._interpolation_nderivs = _interpolation_nderivs;
+  e._embedded_superdegree = _embedded_superdegree;
+  e._embedded_subdegree = _embedded_subdegree;
+  e._value_shape = _value_shape;
+  e._map_type = _map_type;
+  e._sobolev_space = _sobolev_space;
+  e._coeffs = share(cast_array(*_coeffs));
+  e._edofs = _edofs;
+  e._e_closure_dofs = _e_closure_dofs;
+  e._points = share(cast_array(*_points));
+  for (std::size_t d = 0; d < _x.size(); ++d)
+  {
+    for (auto& x : _x[d])
+      e._x[d].push_back(cast_array(x));
+    for (auto& M : _M[d])
+      e._M[d].push_back(cast_array(M));
+  }
+  e._matM = share(cast_array(*_matM));
+  e._matM_blocks = _matM_blocks;
+  std::vector<typename FiniteElement<U>::array2_t> block_data;
+  for (auto& block : *_matM_block_data)
+    block_data.push_back(cast_array(block));
+  e._matM_block_data = share(std::move(block_data));
+  e._discontinuous = _discontinuous;
+  e._dual_matrix = share(cast_array(*_dual_matrix));
+  e._dof_ordering = _dof_ordering;
+  for (auto& factors : _tensor_factors)
+  {
+    auto& factors_cast = e._tensor_factors.emplace_back();
+    for (auto& factor : factors)
+      factors_cast.push_back(factor.template cast<U>());
+  }
+  e._interpolation_is_identity = _interpolation_is_identity;
+  e._slim = _slim;
+  e._wcoeffs = share(cast_array(*_wcoeffs));
+
+  // The data is not hashed again, as it may not be stored. The scalar
+  // type is included in the content hash, so the hashes differ.
+  e._data_hash = _data_hash;
+  e._content_hash = e.compute_content_hash();
+
+  // Convert the transformation data, computing it in the precision of
+  // this element if it has not been computed yet
+  const transformation_data_t& data = transformation_data();
+  e._transformation_data = std::make_shared<
+      typename FiniteElement<U>::lazy_transformation_data_t>();
+  std::call_once(e._transformation_data->flag,
+                 [&]()
+                 {
+                   auto& data_cast = e._transformation_data->data;
+                   for (auto& [ct, t] : data.entity_transformations)
+                     data_cast.entity_transformations[ct] = cast_array(t);
+                   data_cast.dof_transformations_are_permutations
+                       = data.dof_transformations_are_permutations;
+                   data_cast.dof_transformations_are_identity
+                       = data.dof_transformations_are_identity;
+                   data_cast.eperm = data.eperm;
+                   data_cast.eperm_inv = data.eperm_inv;
+                   data_cast.etrans = cast_trans(data.etrans);
+                   data_cast.etransT = cast_trans(data.etransT);
+                   data_cast.etrans_inv = cast_trans(data.etrans_inv);
+                   data_cast.etrans_invT = cast_trans(data.etrans_invT);
+                   data_cast.subentity_closure_perm
+                       = data.subentity_closure_perm;
+                   data_cast.subentity_closure_perm_inv
+                       = data.subentity_closure_perm_inv;
+                   e._transformation_data->computed = true;
+                 });
+
+  return e;
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+FiniteElement<F> FiniteElement<F>::discontinuous_element() const
+{
+  if (_discontinuous)
+    return *this;
+  if (_family == element::family::bubble)
+    throw std::runtime_error("Cannot create a discontinuous bubble element.");
+
+  // The coefficients, points and interpolation matrix are the same for
+  // the discontinuous element, so the copy shares them
+  FiniteElement<F> e(*this);
+  e._discontinuous = true;
+  e._sobolev_space = sobolev::space::L2;
+
+  if (!_slim)
+  {
+    std::array<std::vector<mdspan_t<const F, 2>>, 4> x;
+    for (std::size_t i = 0; i < _x.size(); ++i)
+      for (auto& [buffer, shape] : _x[i])
+        x[i].emplace_back(buffer.data(), shape);
+    std::array<std::vector<mdspan_t<const F, 4>>, 4> M;
+    for (std::size_t i = 0; i < _M.size(); ++i)
+      for (auto& [buffer, shape] : _M[i])
+        M[i].emplace_back(buffer.data(), shape);
+
+    const std::size_t value_size = std::accumulate(
+        _value_shape.begin(), _value_shape.end(), 1, std::multiplies{});
+    auto [xb, xshape, Mb, Mshape]
+        = element::make_discontinuous(x, M, _cell_tdim, value_size);
+    for (std::size_t i = 0; i < 4; ++i)
+    {
+      e._x[i].clear();
+      for (std::size_t j = 0; j < xb[i].size(); ++j)
+        e._x[i].emplace_back(std::move(xb[i][j]), xshape[i][j]);
+      e._M[i].clear();
+      for (std::size_t j = 0; j < Mb[i].size(); ++j)
+        e._M[i].emplace_back(std::move(Mb[i][j]), Mshape[i][j]);
+    }
+  }
+
+  // All DOFs are associated with the interior of the cell
+  const int ndofs = dim();
+  for (std::size_t d = 0; d < _cell_tdim; ++d)
+  {
+    for (auto& dofs : e._edofs[d])
+      dofs.clear();
+    for (auto& dofs : e._e_closure_dofs[d])
+      dofs.clear();
+  }
+  e._edofs[_cell_tdim][0].resize(ndofs);
+  e._e_closure_dofs[_cell_tdim][0].resize(ndofs);
+  for (int i = 0; i < ndofs; ++i)
+  {
+    e._edofs[_cell_tdim][0][i] = _dof_ordering.empty() ? i : _dof_ordering[i];
+    e._e_closure_dofs[_cell_tdim][0][i] = i;
+  }
+
+  try
+  {
+    e._tensor_factors
+        = tp_factors<F>(_family, _cell_type, _degree, _lagrange_variant,
+                        _dpc_variant, true, _dof_ordering);
+    if (_slim)
+    {
+      for (auto& factors : e._tensor_factors)
+        for (auto& factor : factors)
+          factor = factor.slim();
+    }
+  }
+  catch (...)
+  {
+    e._tensor_factors.clear();
+  }
+
+  e._transformation_data = std::make_shared<lazy_transformation_data_t>();
+  e._content_hash = e.compute_content_hash();
+  return e;
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+typename FiniteElement<F>::transformation_data_t
+FiniteElement<F>::compute_transformation_data() const
+{
+  transformation_data_t data;
+
+  if (_discontinuous)
+  {
+    // A discontinuous element has no DOFs on the sub-entities, so the
+    // transformations are empty. These are set directly as the
+    // interpolation data may not be stored (see slim())
+    for (std::size_t d = 1; d < _cell_tdim; ++d)
+    {
+      for (cell::type ct : _cell_subentity_types[d])
+      {
+        const std::size_t ntrans = ct == cell::type::interval ? 1 : 2;
+        data.entity_transformations.try_emplace(
+            ct, std::vector<F>(), std::array<std::size_t, 3>{ntrans, 0, 0});
+      }
+    }
+  }
+  else
+  {
+    std::array<std::vector<mdspan_t<const F, 2>>, 4> x;
+    for (std::size_t i = 0; i < _x.size(); ++i)
+      for (auto& [buffer, shape] : _x[i])
+        x[i].emplace_back(buffer.data(), shape);
+    std::array<std::vector<mdspan_t<const F, 4>>, 4> M;
+    for (std::size_t i = 0; i < _M.size(); ++i)
+      for (auto& [buffer, shape] : _M[i])
+        M[i].emplace_back(buffer.data(), shape);
+
+    const std::size_t value_size = std::accumulate(
+        _value_shape.begin(), _value_shape.end(), 1, std::multiplies{});
+    data.entity_transformations = doftransforms::compute_entity_transformations(
+        _cell_type, x, M,
+        mdspan_t<const F, 2>(_coeffs->first.data(), _coeffs->second),
+        _embedded_superdegree, value_size, _map_type, _poly_type);
+  }
+
   // Check if base transformations are all permutations
-  _dof_transformations_are_permutations = true;
-  _dof_transformations_are_identity = true;
-  for (const auto& [ctype, trans_data] : _entity_transformations)
+  data.dof_transformations_are_permutations = true;
+  data.dof_transformations_are_identity = true;
+  for (const auto& [ctype, trans_data] : data.entity_transformations)
   {
     mdspan_t<const F, 3> trans(trans_data.first.data(), trans_data.second);
     for (std::size_t i = 0;
-         _dof_transformations_are_permutations and i < trans.extent(0); ++i)
+         data.dof_transformations_are_permutations and i < trans.extent(0); ++i)
     {
       for (std::size_t row = 0; row < trans.extent(1); ++row)
       {
@@ -1259,29 +1883,30 @@ FiniteElement<F>::FiniteElement(
           rtot += r;
         }
 
-        const F eps = 10 * degree * degree * std::numeric_limits<F>::epsilon();
+        const F eps
+            = 10 * _degree * _degree * std::numeric_limits<F>::epsilon();
         if ((trans.extent(2) != 1 and std::abs(rmin) > eps)
             or std::abs(rmax - 1.0) > eps or std::abs(rtot - 1.0) > eps)
         {
-          _dof_transformations_are_permutations = false;
-          _dof_transformations_are_identity = false;
+          data.dof_transformations_are_permutations = false;
+          data.dof_transformations_are_identity = false;
           break;
         }
 
         if (std::abs(trans(i, row, row) - 1) > eps)
-          _dof_transformations_are_identity = false;
+          data.dof_transformations_are_identity = false;
       }
     }
-    if (!_dof_transformations_are_permutations)
+    if (!data.dof_transformations_are_permutations)
       break;
   }
 
-  if (!_dof_transformations_are_identity)
+  if (!data.dof_transformations_are_identity)
   {
     // If transformations are permutations, then create the permutations
-    if (_dof_transformations_are_permutations)
+    if (data.dof_transformations_are_permutations)
     {
-      for (const auto& [ctype, trans_data] : _entity_transformations)
+      for (const auto& [ctype, trans_data] : data.entity_transformations)
       {
         mdspan_t<const F, 3> trans(trans_data.first.data(), trans_data.second);
         for (std::size_t i = 0; i < trans.extent(0); ++i)
@@ -1306,8 +1931,8 @@ FiniteElement<F>::FiniteElement(
           precompute::prepare_permutation(inv_perm);
 
           // Store the permutations
-          auto& eperm = _eperm.try_emplace(ctype).first->second;
-          auto& eperm_inv = _eperm_inv.try_emplace(ctype).first->second;
+          auto& eperm = data.eperm.try_emplace(ctype).first->second;
+          auto& eperm_inv = data.eperm_inv.try_emplace(ctype).first->second;
           eperm.push_back(perm);
           eperm_inv.push_back(inv_perm);
 
@@ -1319,10 +1944,10 @@ FiniteElement<F>::FiniteElement(
           for (std::size_t i = 0; i < perm.size(); ++i)
             identity.first[i * perm.size() + i] = 1;
 
-          auto& etrans = _etrans.try_emplace(ctype).first->second;
-          auto& etransT = _etransT.try_emplace(ctype).first->second;
-          auto& etrans_invT = _etrans_invT.try_emplace(ctype).first->second;
-          auto& etrans_inv = _etrans_inv.try_emplace(ctype).first->second;
+          auto& etrans = data.etrans.try_emplace(ctype).first->second;
+          auto& etransT = data.etransT.try_emplace(ctype).first->second;
+          auto& etrans_invT = data.etrans_invT.try_emplace(ctype).first->second;
+          auto& etrans_inv = data.etrans_inv.try_emplace(ctype).first->second;
           etrans.push_back({perm, identity});
           etrans_invT.push_back({perm, identity});
           etransT.push_back({inv_perm, identity});
@@ -1333,16 +1958,16 @@ FiniteElement<F>::FiniteElement(
     else
     {
       // Precompute the DOF transformations
-      for (const auto& [ctype, trans_data] : _entity_transformations)
+      for (const auto& [ctype, trans_data] : data.entity_transformations)
       {
         mdspan_t<const F, 3> trans(trans_data.first.data(), trans_data.second);
 
         // Buffers for matrices
         std::vector<F> M_b, Minv_b, matint;
-        auto& etrans = _etrans.try_emplace(ctype).first->second;
-        auto& etransT = _etransT.try_emplace(ctype).first->second;
-        auto& etrans_invT = _etrans_invT.try_emplace(ctype).first->second;
-        auto& etrans_inv = _etrans_inv.try_emplace(ctype).first->second;
+        auto& etrans = data.etrans.try_emplace(ctype).first->second;
+        auto& etransT = data.etransT.try_emplace(ctype).first->second;
+        auto& etrans_invT = data.etrans_invT.try_emplace(ctype).first->second;
+        auto& etrans_inv = data.etrans_inv.try_emplace(ctype).first->second;
         for (std::size_t i = 0; i < trans.extent(0); ++i)
         {
           if (trans.extent(1) == 0)
@@ -1430,7 +2055,7 @@ FiniteElement<F>::FiniteElement(
 
   // If DOF transformations are permutations, compute the subentity closure
   // permutations
-  if (_dof_transformations_are_permutations)
+  if (data.dof_transformations_are_permutations)
   {
     if (_cell_tdim > 1)
     {
@@ -1458,9 +2083,9 @@ FiniteElement<F>::FiniteElement(
       // Edges
       ref.insert(ref.end(), dofs[1][0].begin(), dofs[1][0].end());
 
-      if (!_dof_transformations_are_identity)
+      if (!data.dof_transformations_are_identity)
       {
-        auto& trans1 = _eperm.at(cell::type::interval)[0];
+        auto& trans1 = data.eperm.at(cell::type::interval)[0];
         if (!dofs[1][0].empty())
         {
           precompute::apply_permutation(trans1, std::span(ref), dofs[1][0][0]);
@@ -1469,19 +2094,19 @@ FiniteElement<F>::FiniteElement(
 
       precompute::prepare_permutation(ref);
 
-      auto& secp = _subentity_closure_perm.try_emplace(cell::type::interval)
+      auto& secp = data.subentity_closure_perm.try_emplace(cell::type::interval)
                        .first->second;
       secp.push_back(ref);
       auto& secpi
-          = _subentity_closure_perm_inv.try_emplace(cell::type::interval)
+          = data.subentity_closure_perm_inv.try_emplace(cell::type::interval)
                 .first->second;
       secpi.push_back(ref);
     }
-    if (_cell_type == cell::type::tetrahedron || cell_type == cell::type::prism
-        || cell_type == cell::type::pyramid)
+    if (_cell_type == cell::type::tetrahedron || _cell_type == cell::type::prism
+        || _cell_type == cell::type::pyramid)
     {
       // triangle
-      const int face_n = cell_type == cell::type::pyramid ? 1 : 0;
+      const int face_n = _cell_type == cell::type::pyramid ? 1 : 0;
 
       int dof_n = 0;
       const auto conn = cell::sub_entity_connectivity(_cell_type)[2][face_n];
@@ -1537,11 +2162,11 @@ FiniteElement<F>::FiniteElement(
       // Face
       ref.insert(ref.end(), dofs[2][0].begin(), dofs[2][0].end());
 
-      if (!_dof_transformations_are_identity)
+      if (!data.dof_transformations_are_identity)
       {
-        auto& trans1 = _eperm.at(cell::type::interval)[0];
-        auto& trans2 = _eperm.at(cell::type::triangle);
-        auto& trans3 = _eperm_inv.at(cell::type::triangle);
+        auto& trans1 = data.eperm.at(cell::type::interval)[0];
+        auto& trans2 = data.eperm.at(cell::type::triangle);
+        auto& trans3 = data.eperm_inv.at(cell::type::triangle);
 
         if (!dofs[1][0].empty())
         {
@@ -1568,21 +2193,21 @@ FiniteElement<F>::FiniteElement(
       precompute::prepare_permutation(rot_inv);
       precompute::prepare_permutation(ref);
 
-      auto& secp = _subentity_closure_perm.try_emplace(cell::type::triangle)
+      auto& secp = data.subentity_closure_perm.try_emplace(cell::type::triangle)
                        .first->second;
       secp.push_back(rot);
       secp.push_back(ref);
       auto& secpi
-          = _subentity_closure_perm_inv.try_emplace(cell::type::triangle)
+          = data.subentity_closure_perm_inv.try_emplace(cell::type::triangle)
                 .first->second;
       secpi.push_back(rot_inv);
       secpi.push_back(ref);
     }
-    if (_cell_type == cell::type::hexahedron || cell_type == cell::type::prism
-        || cell_type == cell::type::pyramid)
+    if (_cell_type == cell::type::hexahedron || _cell_type == cell::type::prism
+        || _cell_type == cell::type::pyramid)
     {
       // quadrilateral
-      const int face_n = cell_type == cell::type::prism ? 1 : 0;
+      const int face_n = _cell_type == cell::type::prism ? 1 : 0;
 
       int dof_n = 0;
       const auto conn = cell::sub_entity_connectivity(_cell_type)[2][face_n];
@@ -1643,11 +2268,11 @@ FiniteElement<F>::FiniteElement(
       // Face
       ref.insert(ref.end(), dofs[2][0].begin(), dofs[2][0].end());
 
-      if (!_dof_transformations_are_identity)
+      if (!data.dof_transformations_are_identity)
       {
-        auto& trans1 = _eperm.at(cell::type::interval)[0];
-        auto& trans2 = _eperm.at(cell::type::quadrilateral);
-        auto& trans3 = _eperm_inv.at(cell::type::quadrilateral);
+        auto& trans1 = data.eperm.at(cell::type::interval)[0];
+        auto& trans2 = data.eperm.at(cell::type::quadrilateral);
+        auto& trans3 = data.eperm_inv.at(cell::type::quadrilateral);
 
         if (!dofs[1][0].empty())
         {
@@ -1674,37 +2299,20 @@ FiniteElement<F>::FiniteElement(
       precompute::prepare_permutation(ref);
 
       auto& secp
-          = _subentity_closure_perm.try_emplace(cell::type::quadrilateral)
+          = data.subentity_closure_perm.try_emplace(cell::type::quadrilateral)
                 .first->second;
       secp.push_back(rot);
       secp.push_back(ref);
-      auto& secpi
-          = _subentity_closure_perm_inv.try_emplace(cell::type::quadrilateral)
-                .first->second;
+      auto& secpi = data.subentity_closure_perm_inv
+                        .try_emplace(cell::type::quadrilateral)
+                        .first->second;
       secpi.push_back(rot_inv);
       secpi.push_back(ref);
     }
   }
 
-  // Check if interpolation matrix is the identity
-  mdspan_t<const F, 2> matM(_matM.first.data(), _matM.second);
-  _interpolation_is_identity = matM.extent(0) == matM.extent(1);
-  for (std::size_t row = 0; _interpolation_is_identity && row < matM.extent(0);
-       ++row)
-  {
-    for (std::size_t col = 0; col < matM.extent(1); ++col)
-    {
-      F v = col == row ? 1.0 : 0.0;
-      const F eps = 10 * degree * degree * std::numeric_limits<F>::epsilon();
-      if (std::abs(matM(row, col) - v) > eps)
-      {
-        _interpolation_is_identity = false;
-        break;
-      }
-    }
-  }
+  return data;
 }
-/// @endcond
 //-----------------------------------------------------------------------------
 template <std::floating_point F>
 bool FiniteElement<F>::operator==(const FiniteElement& e) const
@@ -1715,9 +2323,9 @@ bool FiniteElement<F>::operator==(const FiniteElement& e) const
            and e.family() == element::family::custom)
   {
     bool coeff_equal = false;
-    if (_coeffs.first.size() == e.coefficient_matrix().first.size()
-        and _coeffs.second == e.coefficient_matrix().second
-        and std::ranges::equal(_coeffs.first, e.coefficient_matrix().first,
+    if (_coeffs->first.size() == e.coefficient_matrix().first.size()
+        and _coeffs->second == e.coefficient_matrix().second
+        and std::ranges::equal(_coeffs->first, e.coefficient_matrix().first,
                                [](auto x, auto y)
                                { return std::abs(x - y) < 1.0e-10; }))
     {
@@ -1746,6 +2354,32 @@ bool FiniteElement<F>::operator==(const FiniteElement& e) const
 }
 //-----------------------------------------------------------------------------
 template <std::floating_point F>
+std::uint64_t FiniteElement<F>::compute_content_hash() const
+{
+  stable_hasher hasher;
+  hasher.add(static_cast<int>(_family));
+  hasher.add(static_cast<int>(_cell_type));
+  hasher.add(static_cast<int>(_poly_type));
+  hasher.add(_degree);
+  hasher.add_range(_value_shape);
+  hasher.add(_interpolation_nderivs);
+  hasher.add(static_cast<int>(_map_type));
+  hasher.add(static_cast<int>(_sobolev_space));
+  hasher.add(_discontinuous);
+  hasher.add(_embedded_subdegree);
+  hasher.add(_embedded_superdegree);
+  hasher.add(static_cast<int>(_lagrange_variant));
+  hasher.add(static_cast<int>(_dpc_variant));
+  hasher.add(sizeof(F));
+  hasher.add_range(_dof_ordering);
+  for (auto& edofs_d : _edofs)
+    for (auto& edofs : edofs_d)
+      hasher.add(edofs.size());
+  hasher.add(_data_hash);
+  return hasher.value();
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
 std::size_t FiniteElement<F>::hash() const
 {
   std::size_t dof_ordering_hash = 0;
@@ -1769,17 +2403,15 @@ std::size_t FiniteElement<F>::hash() const
 
   if (family() == element::family::custom)
   {
-    std::size_t coeff_hash = 0;
-    for (auto i : _coeffs.first)
-    {
-      // This takes five decimal places of each matrix entry. We should revisit
-      // this
-      combine_hashes(coeff_hash, int(i * 100000));
-    }
+    // Custom elements whose coefficients differ by roundoff compare
+    // equal, so the coefficients are not included in the hash. Custom
+    // elements with the same properties have the same hash and are
+    // told apart by operator==
     std::size_t vs_hash = 0;
     for (std::size_t i = 0; i < value_shape().size(); ++i)
       combine_hashes(vs_hash, std::hash<int>{}(value_shape()[i]));
-    combine_hashes(h, coeff_hash);
+    combine_hashes(h, std::hash<int>{}(dim()));
+    combine_hashes(h, std::hash<bool>{}(discontinuous()));
     combine_hashes(h, std::hash<int>{}(embedded_superdegree()));
     combine_hashes(h, std::hash<int>{}(embedded_subdegree()));
     combine_hashes(h, std::hash<int>{}(static_cast<int>(polyset_type())));
@@ -1835,10 +2467,10 @@ void FiniteElement<F>::tabulate(int nd, impl::mdspan_t<const F, 2> x,
   const int vs = std::accumulate(_value_shape.begin(), _value_shape.end(), 1,
                                  std::multiplies{});
 
-  std::vector<F> C_b(_coeffs.second[0] * psize);
-  mdspan_t<F, 2> C(C_b.data(), _coeffs.second[0], psize);
+  std::vector<F> C_b(_coeffs->second[0] * psize);
+  mdspan_t<F, 2> C(C_b.data(), _coeffs->second[0], psize);
 
-  mdspan_t<const F, 2> coeffs_view(_coeffs.first.data(), _coeffs.second);
+  mdspan_t<const F, 2> coeffs_view(_coeffs->first.data(), _coeffs->second);
   std::vector<F> result_b(C.extent(0) * bsize[2]);
   mdspan_t<F, 2> result(result_b.data(), C.extent(0), bsize[2]);
   for (std::size_t p = 0; p < basis.extent(0); ++p)
@@ -1904,12 +2536,14 @@ FiniteElement<F>::base_transformations() const
       dofstart += edofs0.size();
   }
 
+  const std::map<cell::type, array3_t>& entity_transformations
+      = transformation_data().entity_transformations;
   int transform_n = 0;
   if (_cell_tdim > 1)
   {
     // Base transformations for edges
     {
-      auto& tmp_data = _entity_transformations.at(cell::type::interval);
+      auto& tmp_data = entity_transformations.at(cell::type::interval);
       mdspan_t<const F, 3> tmp(tmp_data.first.data(), tmp_data.second);
       for (auto& e : _edofs[1])
       {
@@ -1930,7 +2564,7 @@ FiniteElement<F>::base_transformations() const
         if (std::size_t ndofs = _edofs[2][f].size(); ndofs > 0)
         {
           auto& tmp_data
-              = _entity_transformations.at(_cell_subentity_types[2][f]);
+              = entity_transformations.at(_cell_subentity_types[2][f]);
           mdspan_t<const F, 3> tmp(tmp_data.first.data(), tmp_data.second);
 
           for (std::size_t i = 0; i < ndofs; ++i)
@@ -2024,6 +2658,188 @@ FiniteElement<F>::pull_back(impl::mdspan_t<const F, 3> u,
   return {std::move(Ub), shape};
 }
 //-----------------------------------------------------------------------------
+template <std::floating_point F>
+void FiniteElement<F>::interpolate(impl::mdspan_t<const F, 2> values,
+                                   impl::mdspan_t<F, 2> coeffs) const
+{
+  if (values.extent(0) != _matM->second[1])
+    throw std::runtime_error("Values have the wrong shape.");
+  if (coeffs.extent(0) != _matM->second[0]
+      or coeffs.extent(1) != values.extent(1))
+  {
+    throw std::runtime_error("Coefficients have the wrong shape.");
+  }
+
+  std::vector<F> work;
+  interpolate_blocks(values, coeffs, work);
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+void FiniteElement<F>::interpolate_cells(
+    impl::mdspan_t<const F, 3> u, impl::mdspan_t<const F, 3> J,
+    std::span<const F> detJ, impl::mdspan_t<const F, 3> K,
+    std::span<const std::uint32_t> cell_info, impl::mdspan_t<F, 2> coeffs,
+    int num_threads) const
+{
+  if (_interpolation_nderivs > 0)
+  {
+    throw std::runtime_error(
+        "Interpolation into elements with derivative DOFs is not supported.");
+  }
+
+  const std::size_t ncells = u.extent(0);
+  const std::size_t num_points = _points->second[0];
+  const std::size_t ndofs = _matM->second[0];
+  const std::size_t value_size = _matM->second[1] / num_points;
+  const std::size_t tdim = cell::topological_dimension(_cell_type);
+  const std::size_t gdim = J.extent(1);
+  if (J.extent(0) != ncells or detJ.size() != ncells or K.extent(0) != ncells)
+    throw std::runtime_error("Geometry data has the wrong shape.");
+  if (gdim < tdim or J.extent(2) != tdim or K.extent(1) != tdim
+      or K.extent(2) != gdim)
+  {
+    throw std::runtime_error("Jacobian data has the wrong shape.");
+  }
+  const std::size_t physical_value_size
+      = _map_type == maps::type::identity ? value_size
+                                          : compute_value_size(_map_type, gdim);
+  if (u.extent(1) != num_points or u.extent(2) != physical_value_size)
+    throw std::runtime_error("Values have the wrong shape.");
+  if (!cell_info.empty() and cell_info.size() != ncells)
+    throw std::runtime_error("Cell info has the wrong size.");
+  if (coeffs.extent(0) != ncells or coeffs.extent(1) != ndofs)
+    throw std::runtime_error("Coefficients have the wrong shape.");
+
+  // Number of cells that are interpolated at once
+  constexpr std::size_t group_size = 32;
+  const std::size_t nthreads
+      = num_worker_threads(num_threads, (ncells + group_size - 1) / group_size);
+  if (ncells == 0)
+    return;
+
+  using u_t = md::mdspan<const F, md::dextents<std::size_t, 2>>;
+  using U_t = md::mdspan<F, md::dextents<std::size_t, 2>>;
+  using J_t = md::mdspan<const F, md::dextents<std::size_t, 2>>;
+  using K_t = md::mdspan<const F, md::dextents<std::size_t, 2>>;
+  auto map = this->map_fn<U_t, u_t, K_t, J_t>();
+
+  // Interpolate the cells [c0, c1)
+  auto compute = [&](std::size_t c0, std::size_t c1)
+  {
+    std::vector<F> Ub(num_points * value_size);
+    std::vector<F> Vb(num_points * value_size * group_size);
+    std::vector<F> Cb(ndofs * group_size);
+    std::vector<F> work;
+    U_t U(Ub.data(), num_points, value_size);
+    for (std::size_t g0 = c0; g0 < c1; g0 += group_size)
+    {
+      const std::size_t n = std::min(group_size, c1 - g0);
+
+      // Pull back the values on each cell of the group, and store them
+      // with one column for each cell
+      mdspan_t<F, 3> V(Vb.data(), value_size, num_points, n);
+      for (std::size_t c = 0; c < n; ++c)
+      {
+        const std::size_t cell = g0 + c;
+        u_t _u(u.data_handle() + cell * u.extent(1) * u.extent(2), u.extent(1),
+               u.extent(2));
+        J_t _J(J.data_handle() + cell * J.extent(1) * J.extent(2), J.extent(1),
+               J.extent(2));
+        K_t _K(K.data_handle() + cell * K.extent(1) * K.extent(2), K.extent(1),
+               K.extent(2));
+        map(U, _u, _K, 1.0 / detJ[cell], _J);
+        for (std::size_t k = 0; k < value_size; ++k)
+          for (std::size_t p = 0; p < num_points; ++p)
+            V(k, p, c) = U(p, k);
+      }
+
+      mdspan_t<F, 2> C(Cb.data(), ndofs, n);
+      interpolate_blocks(
+          mdspan_t<const F, 2>(Vb.data(), value_size * num_points, n), C, work);
+
+      for (std::size_t c = 0; c < n; ++c)
+      {
+        const std::size_t cell = g0 + c;
+        std::span<F> coeffs_c(coeffs.data_handle() + cell * ndofs, ndofs);
+        for (std::size_t i = 0; i < ndofs; ++i)
+          coeffs_c[i] = C(i, c);
+        if (!cell_info.empty())
+          Tt_inv_apply(coeffs_c, 1, cell_info[cell]);
+      }
+    }
+  };
+
+  if (nthreads <= 1)
+    compute(0, ncells);
+  else
+  {
+    std::vector<std::exception_ptr> errors(nthreads);
+    {
+      std::vector<std::jthread> threads;
+      threads.reserve(nthreads);
+      for (std::size_t i = 0; i < nthreads; ++i)
+      {
+        threads.emplace_back(
+            [&, i]()
+            {
+              try
+              {
+                compute(i * ncells / nthreads, (i + 1) * ncells / nthreads);
+              }
+              catch (...)
+              {
+                errors[i] = std::current_exception();
+              }
+            });
+      }
+    }
+
+    for (auto& e : errors)
+      if (e)
+        std::rethrow_exception(e);
+  }
+}
+//-----------------------------------------------------------------------------
+template <std::floating_point F>
+void FiniteElement<F>::interpolate_blocks(impl::mdspan_t<const F, 2> values,
+                                          impl::mdspan_t<F, 2> coeffs,
+                                          std::vector<F>& work) const
+{
+  const std::size_t num_dofs = _matM->second[0];
+  const std::size_t n = values.extent(1);
+  if (_interpolation_is_identity)
+  {
+    std::copy_n(values.data_handle(), num_dofs * n, coeffs.data_handle());
+    return;
+  }
+
+  const std::size_t value_size = std::accumulate(
+      _value_shape.begin(), _value_shape.end(), 1, std::multiplies{});
+  const std::size_t num_points = _points->second[0];
+  const std::size_t nderivs = _matM->second[1] / (value_size * num_points);
+  mdspan_t<const F, 4> v(values.data_handle(), value_size, num_points, nderivs,
+                         n);
+
+  for (std::size_t b = 0; b < _matM_blocks.size(); ++b)
+  {
+    auto [dof0, ndofs, p0, npts] = _matM_blocks[b];
+    auto& [Mb, Mbshape] = (*_matM_block_data)[b];
+
+    // Pack the values at the points of the block
+    work.resize(Mbshape[1] * n);
+    mdspan_t<F, 4> vb(work.data(), value_size, npts, nderivs, n);
+    for (std::size_t k = 0; k < value_size; ++k)
+      for (std::size_t p = 0; p < npts; ++p)
+        for (std::size_t l = 0; l < nderivs; ++l)
+          for (std::size_t j = 0; j < n; ++j)
+            vb(k, p, l, j) = v(k, p0 + p, l, j);
+
+    math::dot(mdspan_t<const F, 2>(Mb.data(), Mbshape),
+              mdspan_t<const F, 2>(work.data(), Mbshape[1], n),
+              mdspan_t<F, 2>(coeffs.data_handle() + dof0 * n, ndofs, n));
+  }
+}
+//-----------------------------------------------------------------------------
 std::string basix::version()
 {
   static const std::string version_str = str(BASIX_VERSION);
@@ -2033,5 +2849,9 @@ std::string basix::version()
 /// @cond
 template class basix::FiniteElement<float>;
 template class basix::FiniteElement<double>;
+template FiniteElement<float> FiniteElement<float>::cast<float>() const;
+template FiniteElement<double> FiniteElement<float>::cast<double>() const;
+template FiniteElement<float> FiniteElement<double>::cast<float>() const;
+template FiniteElement<double> FiniteElement<double>::cast<double>() const;
 /// @endcond
 //-----------------------------------------------------------------------------
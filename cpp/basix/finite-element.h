@@ -12,10 +12,13 @@
 #include "precompute.h"
 #include "sobolev-spaces.h"
 #include <array>
+#include <atomic>
 #include <concepts>
 #include <cstdint>
 #include <functional>
 #include <map>
+#include <memory>
+#include <mutex>
 #include <numeric>
 #include <span>
 #include <string>
@@ -348,9 +351,23 @@ public:
   /// @return True if elements are the same
   bool operator==(const FiniteElement& e) const;
 
-  /// Get a unique hash of this element
+  /// @brief Get a hash of this element.
+  ///
+  /// Elements that compare equal have the same hash. Use
+  /// content_hash() to identify the data that defines an element.
   std::size_t hash() const;
 
+  /// @brief Get a hash of the data that defines this element.
+  ///
+  /// The hash is computed from the raw values of the polynomial set
+  /// coefficients, the interpolation points and the interpolation
+  /// matrix, and the properties of the element. It is computed when
+  /// the element is created, and is the same on all platforms and in
+  /// all processes, so it can be used as a key for caching data, e.g.
+  /// generated code, for an element.
+  /// @return The content hash
+  std::uint64_t content_hash() const { return _content_hash; }
+
   /// @brief Array shape for tabulate basis values and derivatives at
   /// set of points.
   ///
@@ -370,7 +387,7 @@ public:
       ndsize /= i;
     std::size_t vs = std::accumulate(_value_shape.begin(), _value_shape.end(),
                                      1, std::multiplies{});
-    std::size_t ndofs = _coeffs.second[0];
+    std::size_t ndofs = _coeffs->second[0];
     return {ndsize, num_points, ndofs, vs};
   }
 
@@ -515,7 +532,7 @@ public:
   ///
   /// The dimension is the number of degrees-of-freedom for the element.
   /// @return Number of degrees of freedom
-  int dim() const { return _coeffs.second[0]; }
+  int dim() const { return _coeffs->second[0]; }
 
   /// @brief The finite element family.
   /// @return The family
@@ -550,15 +567,72 @@ public:
   /// permutations.
   bool dof_transformations_are_permutations() const
   {
-    return _dof_transformations_are_permutations;
+    return transformation_data().dof_transformations_are_permutations;
   }
 
   /// @brief Indicates is the dof transformations are all the identity.
   bool dof_transformations_are_identity() const
   {
-    return _dof_transformations_are_identity;
+    return transformation_data().dof_transformations_are_identity;
   }
 
+  /// @brief Compute the data used to apply DOF transformations.
+  ///
+  /// This data is computed the first time that it is used, eg by
+  /// T_apply(). Calling this function computes it immediately instead.
+  void precompute_transformations() const { transformation_data(); }
+
+  /// @brief Create a copy of this element that only stores the data
+  /// needed at runtime.
+  ///
+  /// The copy can be used to tabulate, apply DOF transformations and
+  /// interpolate, but does not store the data that is only used to
+  /// construct an element: the coefficients that define the polynomial
+  /// set (wcoeffs()), the interpolation points and matrices of each
+  /// sub-entity (x() and M()), the interpolation matrix and the dual
+  /// matrix. Calling the functions that return this data on the copy
+  /// throws an exception.
+  /// @return The slim element.
+  FiniteElement slim() const;
+
+  /// @brief Get the memory used by the data stored by this element.
+  ///
+  /// The data used to apply DOF transformations is only included if it
+  /// has been computed.
+  /// @return The number of bytes used by the arrays stored for each
+  /// item of data.
+  std::map<std::string, std::size_t> memory_usage() const;
+
+  /// @brief Indicates whether this element only stores the data needed
+  /// at runtime.
+  /// @return True if this element was created by slim().
+  bool is_slim() const { return _slim; }
+
+  /// @brief Convert this element to a different floating point type.
+  ///
+  /// The data stored by the element is converted, so the element is
+  /// not constructed again. Converting an element with scalar type
+  /// `double` to `float` gives a more accurate element than creating
+  /// it in single precision. The data used to apply DOF
+  /// transformations is computed in the precision of this element
+  /// before it is converted.
+  /// @tparam U The floating point type of the new element
+  /// @return The element with scalar type `U`.
+  template <std::floating_point U>
+  FiniteElement<U> cast() const;
+
+  /// @brief Create the discontinuous version of this element.
+  ///
+  /// The discontinuous element has the same basis functions as this
+  /// element, but all of its DOFs are associated with the interior of
+  /// the cell. The element is not constructed again: the arrays that
+  /// are the same for both elements (the coefficients, the
+  /// interpolation points and matrix, the dual matrix and wcoeffs) are
+  /// shared with this element rather than copied.
+  /// @return The discontinuous version of this element. If this
+  /// element is discontinuous, a copy of this element is returned.
+  FiniteElement discontinuous_element() const;
+
   /// @brief Map function values from the reference to a physical cell.
   ///
   /// This function can perform the mapping for multiple points, grouped
@@ -588,6 +662,55 @@ public:
   pull_back(impl::mdspan_t<const F, 3> u, impl::mdspan_t<const F, 3> J,
             std::span<const F> detJ, impl::mdspan_t<const F, 3> K) const;
 
+  /// @brief Interpolate functions into the finite element space.
+  ///
+  /// This computes `interpolation_matrix() * values`, but only applies
+  /// the blocks given by interpolation_blocks(), so the cost is the sum
+  /// of the sizes of the blocks rather than the size of the full
+  /// interpolation matrix. If interpolation_is_identity() is true, the
+  /// values are copied.
+  ///
+  /// @param[in] values The values of the functions at points(). The
+  /// rows are ordered in the same way as the columns of
+  /// interpolation_matrix(), and each column holds the values of one
+  /// function. Shape is `(value_size * num_points * nderivs, n)`.
+  /// @param[out] coeffs The coefficients of the interpolated functions.
+  /// Shape is `(dim(), n)`.
+  void interpolate(impl::mdspan_t<const F, 2> values,
+                   impl::mdspan_t<F, 2> coeffs) const;
+
+  /// @brief Interpolate functions on a set of physical cells into the
+  /// finite element space.
+  ///
+  /// For each cell, this pulls back the values (as pull_back()),
+  /// computes the coefficients (as interpolate()) and applies the
+  /// inverse transpose DOF transformation for the cell (as
+  /// Tt_inv_apply()). The cells are split between threads, and each
+  /// thread interpolates groups of cells at once using workspace that
+  /// is allocated once.
+  ///
+  /// @param[in] u The values of the functions at points() on each cell.
+  /// The indices are `[cell index, point index, components]`.
+  /// @param[in] J The Jacobian of the mapping for each cell. The
+  /// indices are `[cell index, J_i, J_j]`.
+  /// @param[in] detJ The determinant of the Jacobian of the mapping for
+  /// each cell.
+  /// @param[in] K The inverse of the Jacobian of the mapping for each
+  /// cell. The indices are `[cell index, K_i, K_j]`.
+  /// @param[in] cell_info The permutation info for each cell. If empty,
+  /// no DOF transformations are applied.
+  /// @param[out] coeffs The coefficients on each cell. Shape is
+  /// `(num cells, dim())`.
+  /// @param[in] num_threads The maximum number of threads to use. Must
+  /// be at least 1. No more threads than the number of hardware
+  /// threads, or than one for each 32 cells, are used.
+  void interpolate_cells(impl::mdspan_t<const F, 3> u,
+                         impl::mdspan_t<const F, 3> J, std::span<const F> detJ,
+                         impl::mdspan_t<const F, 3> K,
+                         std::span<const std::uint32_t> cell_info,
+                         impl::mdspan_t<F, 2> coeffs,
+                         int num_threads = 1) const;
+
   /// @brief Return a function that performs the appropriate
   /// push-forward/pull-back for the element type.
   ///
@@ -767,7 +890,7 @@ public:
   std::map<cell::type, std::pair<std::vector<F>, std::array<std::size_t, 3>>>
   entity_transformations() const
   {
-    return _entity_transformations;
+    return transformation_data().entity_transformations;
   }
 
   /// @brief Permute indices associated with degree-of-freedoms on the
@@ -794,16 +917,17 @@ public:
   /// @param cell_info Permutation info for the cell
   void permute(std::span<std::int32_t> d, std::uint32_t cell_info) const
   {
-    if (!_dof_transformations_are_permutations)
+    const transformation_data_t& data = transformation_data();
+    if (!data.dof_transformations_are_permutations)
     {
       throw std::runtime_error(
           "The DOF transformations for this element are not permutations");
     }
 
-    if (_dof_transformations_are_identity)
+    if (data.dof_transformations_are_identity)
       return;
     else
-      permute_data<std::int32_t, false>(d, 1, cell_info, _eperm);
+      permute_data<std::int32_t, false>(d, 1, cell_info, data.eperm);
   }
 
   /// @brief Perform the inverse of the operation applied by permute().
@@ -825,16 +949,17 @@ public:
   /// @param cell_info Permutation info for the cell
   void permute_inv(std::span<std::int32_t> d, std::uint32_t cell_info) const
   {
-    if (!_dof_transformations_are_permutations)
+    const transformation_data_t& data = transformation_data();
+    if (!data.dof_transformations_are_permutations)
     {
       throw std::runtime_error(
           "The DOF transformations for this element are not permutations");
     }
 
-    if (_dof_transformations_are_identity)
+    if (data.dof_transformations_are_identity)
       return;
     else
-      permute_data<std::int32_t, true>(d, 1, cell_info, _eperm_inv);
+      permute_data<std::int32_t, true>(d, 1, cell_info, data.eperm_inv);
   }
 
   /// @brief Permute indices associated with degree-of-freedoms on the
@@ -934,7 +1059,8 @@ public:
                                  std::uint32_t entity_info,
                                  cell::type entity_type) const
   {
-    if (!_dof_transformations_are_permutations)
+    const transformation_data_t& data = transformation_data();
+    if (!data.dof_transformations_are_permutations)
     {
       throw std::runtime_error(
           "The DOF transformations for this element are not permutations");
@@ -945,7 +1071,7 @@ public:
     if (entity_dim == 0)
       return;
 
-    auto& perm = _subentity_closure_perm.at(entity_type);
+    auto& perm = data.subentity_closure_perm.at(entity_type);
     if (entity_dim == 1)
     {
       if (entity_info & 1)
@@ -989,7 +1115,8 @@ public:
                                      std::uint32_t entity_info,
                                      cell::type entity_type) const
   {
-    if (!_dof_transformations_are_permutations)
+    const transformation_data_t& data = transformation_data();
+    if (!data.dof_transformations_are_permutations)
     {
       throw std::runtime_error(
           "The DOF transformations for this element are not permutations");
@@ -1000,7 +1127,7 @@ public:
     if (entity_dim == 0)
       return;
 
-    auto& perm = _subentity_closure_perm_inv.at(entity_type);
+    auto& perm = data.subentity_closure_perm_inv.at(entity_type);
     if (entity_dim == 1)
     {
       if (entity_info & 1)
@@ -1161,7 +1288,7 @@ public:
   /// @return Array of coordinate with shape `(num_points, tdim)`
   const std::pair<std::vector<F>, std::array<std::size_t, 2>>& points() const
   {
-    return _points;
+    return *_points;
   }
 
   /// @brief Return a matrix of weights interpolation.
@@ -1218,7 +1345,25 @@ public:
   const std::pair<std::vector<F>, std::array<std::size_t, 2>>&
   interpolation_matrix() const
   {
-    return _matM;
+    if (_slim)
+      throw std::runtime_error(
+          "The interpolation matrix is not stored by slim elements.");
+    return *_matM;
+  }
+
+  /// @brief Get the entity blocks of the interpolation matrix.
+  ///
+  /// The DOFs associated with each sub-entity of the cell only depend
+  /// on the function values at the interpolation points on that
+  /// sub-entity, so the interpolation matrix is block sparse. Each
+  /// block is given as `{first DOF, number of DOFs, first point, number
+  /// of points}`, where the DOFs are rows of interpolation_matrix() and
+  /// the points are rows of points(). Entities with no DOFs are not
+  /// included.
+  /// @return The blocks of the interpolation matrix.
+  const std::vector<std::array<std::size_t, 4>>& interpolation_blocks() const
+  {
+    return _matM_blocks;
   }
 
   /// @brief Get the dual matrix.
@@ -1229,7 +1374,10 @@ public:
   const std::pair<std::vector<F>, std::array<std::size_t, 2>>&
   dual_matrix() const
   {
-    return _dual_matrix;
+    if (_slim)
+      throw std::runtime_error(
+          "The dual matrix is not stored by slim elements.");
+    return *_dual_matrix;
   }
 
   /// @brief Get the coefficients that define the polynomial set in
@@ -1270,7 +1418,9 @@ public:
   /// dim(Lagrange polynomials))`.
   const std::pair<std::vector<F>, std::array<std::size_t, 2>>& wcoeffs() const
   {
-    return _wcoeffs;
+    if (_slim)
+      throw std::runtime_error("wcoeffs is not stored by slim elements.");
+    return *_wcoeffs;
   }
 
   /// @brief Get the interpolation points for each subentity.
@@ -1281,6 +1431,8 @@ public:
       std::vector<std::pair<std::vector<F>, std::array<std::size_t, 2>>>, 4>&
   x() const
   {
+    if (_slim)
+      throw std::runtime_error("x is not stored by slim elements.");
     return _x;
   }
 
@@ -1324,6 +1476,8 @@ public:
       std::vector<std::pair<std::vector<F>, std::array<std::size_t, 4>>>, 4>&
   M() const
   {
+    if (_slim)
+      throw std::runtime_error("M is not stored by slim elements.");
     return _M;
   }
 
@@ -1333,7 +1487,7 @@ public:
   const std::pair<std::vector<F>, std::array<std::size_t, 2>>&
   coefficient_matrix() const
   {
-    return _coeffs;
+    return *_coeffs;
   }
 
   /// @brief Indicates whether or not this element can be represented as a
@@ -1384,6 +1538,21 @@ public:
   const std::vector<int>& dof_ordering() const { return _dof_ordering; }
 
 private:
+  template <std::floating_point>
+  friend class FiniteElement;
+
+  /// Constructor used by cast()
+  FiniteElement() = default;
+
+  /// Apply the blocks of the interpolation matrix
+  /// @param values Function values, shape (value_size * num_points *
+  /// nderivs, n)
+  /// @param coeffs Coefficients, shape (dim(), n)
+  /// @param work Workspace, resized as needed
+  void interpolate_blocks(impl::mdspan_t<const F, 2> values,
+                          impl::mdspan_t<F, 2> coeffs,
+                          std::vector<F>& work) const;
+
   /// Data permutation
   /// @param data Data to be permuted
   /// @param block_size
@@ -1401,6 +1570,63 @@ private:
   using trans_data_t
       = std::vector<std::pair<std::vector<std::size_t>, array2_t>>;
 
+  /// Data used to apply DOF transformations
+  struct transformation_data_t
+  {
+    // Entity transformations
+    std::map<cell::type, array3_t> entity_transformations;
+
+    // Indicates whether or not the DOF transformations are all
+    // permutations
+    bool dof_transformations_are_permutations;
+
+    // Indicates whether or not the DOF transformations are all identity
+    bool dof_transformations_are_identity;
+
+    // The entity permutations (factorised). This will only be set if
+    // dof_transformations_are_permutations is True and
+    // dof_transformations_are_identity is False
+    std::map<cell::type, std::vector<std::vector<std::size_t>>> eperm;
+
+    // The reverse entity permutations (factorised). This will only be set
+    // if dof_transformations_are_permutations is True and
+    // dof_transformations_are_identity is False
+    std::map<cell::type, std::vector<std::vector<std::size_t>>> eperm_inv;
+
+    // The entity transformations in precomputed form
+    std::map<cell::type, trans_data_t> etrans;
+
+    // The transposed entity transformations in precomputed form
+    std::map<cell::type, trans_data_t> etransT;
+
+    // The inverse entity transformations in precomputed form
+    std::map<cell::type, trans_data_t> etrans_inv;
+
+    // The inverse transpose entity transformations in precomputed form
+    std::map<cell::type, trans_data_t> etrans_invT;
+
+    // The subentity closure permutations (factorised). This will only be set if
+    // dof_transformations_are_permutations is True
+    std::map<cell::type, std::vector<std::vector<std::size_t>>>
+        subentity_closure_perm;
+
+    // The inverse subentity closure permutations (factorised). This will only
+    // be set if dof_transformations_are_permutations is True
+    std::map<cell::type, std::vector<std::vector<std::size_t>>>
+        subentity_closure_perm_inv;
+  };
+
+  /// Get the data used to apply DOF transformations, computing it if
+  /// it has not yet been computed
+  const transformation_data_t& transformation_data() const;
+
+  /// Compute the data used to apply DOF transformations
+  transformation_data_t compute_transformation_data() const;
+
+  /// Compute the content hash from _data_hash and the properties of
+  /// the element
+  std::uint64_t compute_content_hash() const;
+
   /// Data transformation
   /// @param data Data to be transformed (using matrices)
   /// @param block_size
@@ -1454,12 +1680,17 @@ private:
   /// The Sobolev space this element is contained in
   sobolev::space _sobolev_space;
 
+  // The arrays below that are held by shared pointers are not changed
+  // after construction. They are shared by copies of the element and
+  // by the discontinuous version of an element created by
+  // discontinuous_element().
+
   // Shape function coefficient of expansion sets on cell. If shape
   // function is given by @f$\psi_i = \sum_{k} \phi_{k}
   // \alpha^{i}_{k}@f$, then _coeffs(i, j) = @f$\alpha^i_k@f$. ie
   // _coeffs.row(i) are the expansion coefficients for shape function i
   // (@f$\psi_{i}@f$).
-  std::pair<std::vector<F>, std::array<std::size_t, 2>> _coeffs;
+  std::shared_ptr<const array2_t> _coeffs;
 
   // Dofs associated with each cell (sub-)entity
   std::vector<std::vector<std::vector<int>>> _edofs;
@@ -1467,15 +1698,12 @@ private:
   // Dofs associated with the closdure of each cell (sub-)entity
   std::vector<std::vector<std::vector<int>>> _e_closure_dofs;
 
-  // Entity transformations
-  std::map<cell::type, array3_t> _entity_transformations;
-
   // Set of points used for point evaluation
   // Experimental - currently used for an implementation of
   // "tabulate_dof_coordinates" Most useful for Lagrange. This may change or go
   // away. For non-Lagrange elements, these points will be used in combination
   // with _interpolation_matrix to perform interpolation
-  std::pair<std::vector<F>, std::array<std::size_t, 2>> _points;
+  std::shared_ptr<const array2_t> _points;
 
   // Interpolation points on the cell. The shape is (entity_dim, num
   // entities of given dimension, num_points, tdim)
@@ -1484,53 +1712,33 @@ private:
       _x;
 
   /// The interpolation weights and points
-  std::pair<std::vector<F>, std::array<std::size_t, 2>> _matM;
-
-  // Indicates whether or not the DOF transformations are all
-  // permutations
-  bool _dof_transformations_are_permutations;
-
-  // Indicates whether or not the DOF transformations are all identity
-  bool _dof_transformations_are_identity;
-
-  // The entity permutations (factorised). This will only be set if
-  // _dof_transformations_are_permutations is True and
-  // _dof_transformations_are_identity is False
-  std::map<cell::type, std::vector<std::vector<std::size_t>>> _eperm;
+  std::shared_ptr<const array2_t> _matM;
 
-  // The reverse entity permutations (factorised). This will only be set
-  // if _dof_transformations_are_permutations is True and
-  // _dof_transformations_are_identity is False
-  std::map<cell::type, std::vector<std::vector<std::size_t>>> _eperm_inv;
+  // The blocks of _matM associated with each sub-entity. The entries
+  // are (first dof, number of dofs, first point, number of points)
+  std::vector<std::array<std::size_t, 4>> _matM_blocks;
 
-  // The entity transformations in precomputed form
-  std::map<cell::type, trans_data_t> _etrans;
+  // The entries of each block of _matM, with shape (number of dofs,
+  // value_size * number of points * nderivs)
+  std::shared_ptr<const std::vector<array2_t>> _matM_block_data;
 
-  // The transposed entity transformations in precomputed form
-  std::map<cell::type, trans_data_t> _etransT;
-
-  // The inverse entity transformations in precomputed form
-  std::map<cell::type, trans_data_t> _etrans_inv;
-
-  // The inverse transpose entity transformations in precomputed form
-  std::map<cell::type, trans_data_t> _etrans_invT;
-
-  // The subentity closure permutations (factorised). This will only be set if
-  // _dof_transformations_are_permutations is True
-  std::map<cell::type, std::vector<std::vector<std::size_t>>>
-      _subentity_closure_perm;
-
-  // The inverse subentity closure permutations (factorised). This will only be
-  // set if _dof_transformations_are_permutations is True
-  std::map<cell::type, std::vector<std::vector<std::size_t>>>
-      _subentity_closure_perm_inv;
+  // Data used to apply DOF transformations, computed on first use.
+  // This only depends on data that is not changed after construction,
+  // so it is shared between copies of the element.
+  struct lazy_transformation_data_t
+  {
+    std::once_flag flag;
+    std::atomic<bool> computed = false;
+    transformation_data_t data;
+  };
+  std::shared_ptr<lazy_transformation_data_t> _transformation_data;
 
   // Indicates whether or not this is the discontinuous version of the
   // element
   bool _discontinuous;
 
   // The dual matrix
-  std::pair<std::vector<F>, std::array<std::size_t, 2>> _dual_matrix;
+  std::shared_ptr<const array2_t> _dual_matrix;
 
   // Dof reordering for different element dof layout compatibility.
   // The reference basix layout is ordered by entity, i.e. dofs on
@@ -1550,9 +1758,19 @@ private:
   // Is the interpolation matrix an identity?
   bool _interpolation_is_identity;
 
+  // Does this element only store the data needed at runtime?
+  bool _slim = false;
+
+  // Hash of the raw values of _wcoeffs, _points and _matM
+  std::uint64_t _data_hash;
+
+  // Hash of _data_hash and the properties of the element, see
+  // content_hash()
+  std::uint64_t _content_hash;
+
   // The coefficients that define the polynomial set in terms of the
   // orthonormal polynomials
-  std::pair<std::vector<F>, std::array<std::size_t, 2>> _wcoeffs;
+  std::shared_ptr<const array2_t> _wcoeffs;
 
   // Interpolation matrices for each entity
   using array4_t
@@ -1585,6 +1803,9 @@ private:
 /// polyset
 /// @param[in] poly_type The type of polyset to use for this element
 /// @return A custom finite element
+/// @note Unlike elements created by create_element(), the data used to
+/// apply DOF transformations is computed when the element is created,
+/// so that errors in the input are reported here.
 template <std::floating_point T>
 FiniteElement<T> create_custom_element(
     cell::type cell_type, const std::vector<std::size_t>& value_shape,
@@ -1613,6 +1834,24 @@ FiniteElement<T> create_element(element::family family, cell::type cell,
                                 bool discontinuous,
                                 std::vector<int> dof_ordering = {});
 
+/// Create a list of finite elements using multiple threads
+///
+/// Each element is created on a single thread, so the total number of
+/// threads used is at most `num_threads`.
+/// @param[in] specs The arguments of create_element() for each element.
+/// The entries of each tuple are (family, cell, degree, lvariant,
+/// dvariant, discontinuous, dof_ordering).
+/// @param[in] num_threads The maximum number of threads to use. Must be
+/// at least 1. No more threads than the number of hardware threads, or
+/// than the number of elements, are used.
+/// @return The finite elements, in the same order as `specs`
+template <std::floating_point T>
+std::vector<FiniteElement<T>> create_elements(
+    const std::vector<
+        std::tuple<element::family, cell::type, int, element::lagrange_variant,
+                   element::dpc_variant, bool, std::vector<int>>>& specs,
+    int num_threads);
+
 /// Get the tensor product DOF ordering for an element
 /// @param[in] family The element family
 /// @param[in] cell The reference cell type that the element is defined on.
@@ -1825,14 +2064,15 @@ template <typename T>
 void FiniteElement<F>::T_apply(std::span<T> u, int n,
                                std::uint32_t cell_info) const
 {
-  if (_dof_transformations_are_identity)
+  const transformation_data_t& data = transformation_data();
+  if (data.dof_transformations_are_identity)
     return;
 
-  if (_dof_transformations_are_permutations)
-    permute_data<T, false>(u, n, cell_info, _eperm);
+  if (data.dof_transformations_are_permutations)
+    permute_data<T, false>(u, n, cell_info, data.eperm);
   else
   {
-    transform_data<T, false>(u, n, cell_info, _etrans,
+    transform_data<T, false>(u, n, cell_info, data.etrans,
                              precompute::apply_matrix<F, T>);
   }
 }
@@ -1842,13 +2082,14 @@ template <typename T>
 void FiniteElement<F>::Tt_apply(std::span<T> u, int n,
                                 std::uint32_t cell_info) const
 {
-  if (_dof_transformations_are_identity)
+  const transformation_data_t& data = transformation_data();
+  if (data.dof_transformations_are_identity)
     return;
-  else if (_dof_transformations_are_permutations)
-    permute_data<T, true>(u, n, cell_info, _eperm_inv);
+  else if (data.dof_transformations_are_permutations)
+    permute_data<T, true>(u, n, cell_info, data.eperm_inv);
   else
   {
-    transform_data<T, true>(u, n, cell_info, _etransT,
+    transform_data<T, true>(u, n, cell_info, data.etransT,
                             precompute::apply_matrix<F, T>);
   }
 }
@@ -1858,13 +2099,14 @@ template <typename T>
 void FiniteElement<F>::Tt_inv_apply(std::span<T> u, int n,
                                     std::uint32_t cell_info) const
 {
-  if (_dof_transformations_are_identity)
+  const transformation_data_t& data = transformation_data();
+  if (data.dof_transformations_are_identity)
     return;
-  else if (_dof_transformations_are_permutations)
-    permute_data<T, false>(u, n, cell_info, _eperm);
+  else if (data.dof_transformations_are_permutations)
+    permute_data<T, false>(u, n, cell_info, data.eperm);
   else
   {
-    transform_data<T, false>(u, n, cell_info, _etrans_invT,
+    transform_data<T, false>(u, n, cell_info, data.etrans_invT,
                              precompute::apply_matrix<F, T>);
   }
 }
@@ -1874,13 +2116,14 @@ template <typename T>
 void FiniteElement<F>::Tinv_apply(std::span<T> u, int n,
                                   std::uint32_t cell_info) const
 {
-  if (_dof_transformations_are_identity)
+  const transformation_data_t& data = transformation_data();
+  if (data.dof_transformations_are_identity)
     return;
-  else if (_dof_transformations_are_permutations)
-    permute_data<T, true>(u, n, cell_info, _eperm_inv);
+  else if (data.dof_transformations_are_permutations)
+    permute_data<T, true>(u, n, cell_info, data.eperm_inv);
   else
   {
-    transform_data<T, true>(u, n, cell_info, _etrans_inv,
+    transform_data<T, true>(u, n, cell_info, data.etrans_inv,
                             precompute::apply_matrix<F, T>);
   }
 }
@@ -1890,21 +2133,22 @@ template <typename T>
 void FiniteElement<F>::Tt_apply_right(std::span<T> u, int n,
                                       std::uint32_t cell_info) const
 {
-  if (_dof_transformations_are_identity)
+  const transformation_data_t& data = transformation_data();
+  if (data.dof_transformations_are_identity)
     return;
-  else if (_dof_transformations_are_permutations)
+  else if (data.dof_transformations_are_permutations)
   {
     assert(u.size() % n == 0);
     const int step = u.size() / n;
     for (int i = 0; i < n; ++i)
     {
       std::span<T> dblock(u.data() + i * step, step);
-      permute_data<T, false>(dblock, 1, cell_info, _eperm);
+      permute_data<T, false>(dblock, 1, cell_info, data.eperm);
     }
   }
   else
   {
-    transform_data<T, false>(u, n, cell_info, _etrans,
+    transform_data<T, false>(u, n, cell_info, data.etrans,
                              precompute::apply_tranpose_matrix_right<F, T>);
   }
 }
@@ -1914,21 +2158,22 @@ template <typename T>
 void FiniteElement<F>::Tinv_apply_right(std::span<T> u, int n,
                                         std::uint32_t cell_info) const
 {
-  if (_dof_transformations_are_identity)
+  const transformation_data_t& data = transformation_data();
+  if (data.dof_transformations_are_identity)
     return;
-  else if (_dof_transformations_are_permutations)
+  else if (data.dof_transformations_are_permutations)
   {
     assert(u.size() % n == 0);
     const int step = u.size() / n;
     for (int i = 0; i < n; ++i)
     {
       std::span<T> dblock(u.data() + i * step, step);
-      permute_data<T, false>(dblock, 1, cell_info, _eperm);
+      permute_data<T, false>(dblock, 1, cell_info, data.eperm);
     }
   }
   else
   {
-    transform_data<T, false>(u, n, cell_info, _etrans_invT,
+    transform_data<T, false>(u, n, cell_info, data.etrans_invT,
                              precompute::apply_tranpose_matrix_right<F, T>);
   }
 }
@@ -1938,21 +2183,22 @@ template <typename T>
 void FiniteElement<F>::T_apply_right(std::span<T> u, int n,
                                      std::uint32_t cell_info) const
 {
-  if (_dof_transformations_are_identity)
+  const transformation_data_t& data = transformation_data();
+  if (data.dof_transformations_are_identity)
     return;
-  else if (_dof_transformations_are_permutations)
+  else if (data.dof_transformations_are_permutations)
   {
     assert(u.size() % n == 0);
     const int step = u.size() / n;
     for (int i = 0; i < n; ++i)
     {
       std::span<T> dblock(u.data() + i * step, step);
-      permute_data<T, true>(dblock, 1, cell_info, _eperm_inv);
+      permute_data<T, true>(dblock, 1, cell_info, data.eperm_inv);
     }
   }
   else
   {
-    transform_data<T, true>(u, n, cell_info, _etransT,
+    transform_data<T, true>(u, n, cell_info, data.etransT,
                             precompute::apply_tranpose_matrix_right<F, T>);
   }
 }
@@ -1962,21 +2208,22 @@ template <typename T>
 void FiniteElement<F>::Tt_inv_apply_right(std::span<T> u, int n,
                                           std::uint32_t cell_info) const
 {
-  if (_dof_transformations_are_identity)
+  const transformation_data_t& data = transformation_data();
+  if (data.dof_transformations_are_identity)
     return;
-  else if (_dof_transformations_are_permutations)
+  else if (data.dof_transformations_are_permutations)
   {
     assert(u.size() % n == 0);
     const int step = u.size() / n;
     for (int i = 0; i < n; ++i)
     {
       std::span<T> dblock(u.data() + i * step, step);
-      permute_data<T, true>(dblock, 1, cell_info, _eperm_inv);
+      permute_data<T, true>(dblock, 1, cell_info, data.eperm_inv);
     }
   }
   else
   {
-    transform_data<T, true>(u, n, cell_info, _etrans_inv,
+    transform_data<T, true>(u, n, cell_info, data.etrans_inv,
                             precompute::apply_tranpose_matrix_right<F, T>);
   }
 }
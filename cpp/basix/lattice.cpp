@@ -10,8 +10,11 @@
 #include <algorithm>
 #include <cmath>
 #include <concepts>
+#include <map>
 #include <math.h>
+#include <mutex>
 #include <numeric>
+#include <tuple>
 #include <vector>
 
 using namespace basix;
@@ -360,34 +363,52 @@ create_tri_warped(std::size_t n, lattice::type lattice_type, bool exterior)
   return {std::move(_p), shape};
 }
 //-----------------------------------------------------------------------------
+/// Compute the Isaac point with barycentric multi-index `a`.
+///
+/// The point is defined recursively in terms of the points of the
+/// multi-indices obtained by removing one entry from `a`. The points of
+/// these sub-indices are shared by many points of the lattice, so they
+/// are stored in `points`. `intervals[s]` holds the interval lattice of
+/// size `s`, including the endpoints, and is computed on first use.
+/// `intervals` must have size greater than the sum of the entries of
+/// `a`.
 template <std::floating_point T>
-std::vector<T> isaac_point(lattice::type lattice_type,
-                           std::span<const std::size_t> a)
+const std::vector<T>&
+isaac_point(lattice::type lattice_type, const std::vector<std::size_t>& a,
+            std::map<std::vector<std::size_t>, std::vector<T>>& points,
+            std::vector<std::vector<T>>& intervals)
 {
+  if (auto it = points.find(a); it != points.end())
+    return it->second;
+
+  std::vector<T> res(a.size(), 0);
   if (a.size() == 1)
-    return {1};
+    res[0] = 1;
   else
   {
-    std::vector<T> res(a.size(), 0);
+    const std::size_t size = std::reduce(a.begin(), a.end());
+    if (intervals[size].empty())
+      intervals[size] = create_interval<T>(size, lattice_type, true);
+    const std::vector<T>& x = intervals[size];
+
     T denominator = 0;
     std::vector<std::size_t> sub_a(std::next(a.begin()), a.end());
-    const std::size_t size = std::reduce(a.begin(), a.end());
-    std::vector<T> x = create_interval<T>(size, lattice_type, true);
     for (std::size_t i = 0; i < a.size(); ++i)
     {
       if (i > 0)
         sub_a[i - 1] = a[i - 1];
       const std::size_t sub_size = size - a[i];
-      const std::vector sub_res = isaac_point<T>(lattice_type, sub_a);
+      const std::vector<T>& sub_res
+          = isaac_point<T>(lattice_type, sub_a, points, intervals);
       for (std::size_t j = 0; j < sub_res.size(); ++j)
         res[j < i ? j : j + 1] += x[sub_size] * sub_res[j];
       denominator += x[sub_size];
     }
 
     std::ranges::for_each(res, [denominator](auto& x) { x /= denominator; });
-
-    return res;
   }
+
+  return points.emplace(a, std::move(res)).first->second;
 }
 //-----------------------------------------------------------------------------
 
@@ -404,13 +425,15 @@ create_tri_isaac(std::size_t n, lattice::type lattice_type, bool exterior)
   md::mdspan<T, md::extents<std::size_t, md::dynamic_extent, 2>> p(_p.data(),
                                                                    shape);
 
+  std::map<std::vector<std::size_t>, std::vector<T>> points;
+  std::vector<std::vector<T>> intervals(n + 1);
   int c = 0;
   for (std::size_t j = b; j < (n - b + 1); ++j)
   {
     for (std::size_t i = b; i < (n - b + 1 - j); ++i)
     {
-      const std::vector isaac_p
-          = isaac_point<T>(lattice_type, std::array{i, j, n - i - j});
+      const std::vector<T>& isaac_p
+          = isaac_point<T>(lattice_type, {i, j, n - i - j}, points, intervals);
       for (std::size_t k = 0; k < 2; ++k)
         p(c, k) = isaac_p[k];
       ++c;
@@ -538,6 +561,8 @@ create_tet_isaac(std::size_t n, lattice::type lattice_type, bool exterior)
   md::mdspan<T, md::extents<std::size_t, md::dynamic_extent, 3>> x(xb.data(),
                                                                    shape);
 
+  std::map<std::vector<std::size_t>, std::vector<T>> points;
+  std::vector<std::vector<T>> intervals(n + 1);
   int c = 0;
   for (std::size_t k = b; k < (n - b + 1); ++k)
   {
@@ -545,8 +570,8 @@ create_tet_isaac(std::size_t n, lattice::type lattice_type, bool exterior)
     {
       for (std::size_t i = b; i < (n - b + 1 - j - k); ++i)
       {
-        const std::vector ip
-            = isaac_point<T>(lattice_type, std::array{i, j, k, n - i - j - k});
+        const std::vector<T>& ip = isaac_point<T>(
+            lattice_type, {i, j, k, n - i - j - k}, points, intervals);
         for (std::size_t l = 0; l < 3; ++l)
           x(c, l) = ip[l];
         ++c;
@@ -776,12 +801,11 @@ create_pyramid(int n, lattice::type lattice_type, bool exterior,
         "Non-equispaced points on pyramids not supported yet.");
   }
 }
-} // namespace
 //-----------------------------------------------------------------------------
 template <std::floating_point T>
 std::pair<std::vector<T>, std::array<std::size_t, 2>>
-lattice::create(cell::type celltype, int n, lattice::type type, bool exterior,
-                lattice::simplex_method simplex_method)
+create_lattice(cell::type celltype, int n, lattice::type type, bool exterior,
+               lattice::simplex_method simplex_method)
 {
   switch (celltype)
   {
@@ -809,6 +833,39 @@ lattice::create(cell::type celltype, int n, lattice::type type, bool exterior,
   }
 }
 //-----------------------------------------------------------------------------
+} // namespace
+//-----------------------------------------------------------------------------
+template <std::floating_point T>
+std::pair<std::vector<T>, std::array<std::size_t, 2>>
+lattice::create(cell::type celltype, int n, lattice::type type, bool exterior,
+                lattice::simplex_method simplex_method)
+{
+  // Lattices are created repeatedly with the same arguments, eg for
+  // each sub-entity of each element, so keep a cache. The cache is
+  // cleared if it grows too large.
+  using key_t = std::tuple<cell::type, int, lattice::type, bool,
+                           lattice::simplex_method>;
+  static std::mutex cache_mutex;
+  static std::map<key_t, std::pair<std::vector<T>, std::array<std::size_t, 2>>>
+      cache;
+  constexpr std::size_t max_cache_size = 256;
+
+  const key_t key = {celltype, n, type, exterior, simplex_method};
+  {
+    std::scoped_lock lock(cache_mutex);
+    if (auto it = cache.find(key); it != cache.end())
+      return it->second;
+  }
+
+  auto x = create_lattice<T>(celltype, n, type, exterior, simplex_method);
+
+  std::scoped_lock lock(cache_mutex);
+  if (cache.size() >= max_cache_size)
+    cache.clear();
+  cache.emplace(key, x);
+  return x;
+}
+//-----------------------------------------------------------------------------
 /// @cond
 // Explicit instantiation for double and float
 template std::pair<std::vector<float>, std::array<std::size_t, 2>>
@@ -59,6 +59,9 @@ enum class simplex_method
 /// Gauss-Lobatto-Legendre quadrature points. These are the same as
 /// type::equispaced when `n < 3`.
 ///
+/// Lattices are cached, so repeated calls with the same arguments do
+/// not recompute the points.
+///
 /// @param celltype The cell type.
 /// @param n Size in each direction. There are `n + 1` points along each
 /// edge of the cell.
@@ -12,6 +12,7 @@
 #include <array>
 #include <cmath>
 #include <concepts>
+#include <limits>
 #include <span>
 #include <stdexcept>
 #include <string>
@@ -37,6 +38,16 @@ extern "C"
               double* a, int* lda, double* b, int* ldb, double* beta, double* c,
               int* ldc);
 
+  void sgeqrf_(int* m, int* n, float* a, int* lda, float* tau, float* work,
+               int* lwork, int* info);
+  void dgeqrf_(int* m, int* n, double* a, int* lda, double* tau, double* work,
+               int* lwork, int* info);
+
+  void sorgqr_(int* m, int* n, int* k, float* a, int* lda, float* tau,
+               float* work, int* lwork, int* info);
+  void dorgqr_(int* m, int* n, int* k, double* a, int* lda, double* tau,
+               double* work, int* lwork, int* info);
+
   int sgetrf_(const int* m, const int* n, float* a, const int* lda, int* lpiv,
               int* info);
   int dgetrf_(const int* m, const int* n, double* a, const int* lda, int* lpiv,
@@ -358,6 +369,11 @@ std::vector<T> eye(std::size_t n)
 }
 
 /// @brief Orthogonalise the rows of a matrix (in place).
+///
+/// The rows are orthonormalised in order, so the result is the same as
+/// the result of Gram-Schmidt orthogonalisation, but it is computed
+/// using a Householder QR factorisation (LAPACK `geqrf`/`orgqr`).
+///
 /// @param[in] wcoeffs The matrix.
 /// @param[in] start The row to start from. The rows before this should
 /// already be orthogonal.
@@ -365,30 +381,71 @@ template <std::floating_point T>
 void orthogonalise(md::mdspan<T, md::dextents<std::size_t, 2>> wcoeffs,
                    std::size_t start = 0)
 {
-  for (std::size_t i = start; i < wcoeffs.extent(0); ++i)
+  static_assert(std::is_same_v<T, float> or std::is_same_v<T, double>);
+  if (start >= wcoeffs.extent(0))
+    return;
+
+  // The rows to orthogonalise are the columns of a column-major matrix
+  int m = wcoeffs.extent(1);
+  int n = wcoeffs.extent(0) - start;
+  if (n > m)
+  {
+    throw std::runtime_error("Cannot orthogonalise the rows of a matrix "
+                             "with incomplete row rank");
+  }
+  T* a = wcoeffs.data_handle() + start * wcoeffs.extent(1);
+  int lda = m;
+
+  // Workspace query
+  std::vector<T> tau(n);
+  int lwork = -1;
+  int info;
+  T work_size[2];
+  if constexpr (std::is_same_v<T, float>)
+  {
+    sgeqrf_(&m, &n, a, &lda, tau.data(), work_size, &lwork, &info);
+    sorgqr_(&m, &n, &n, a, &lda, tau.data(), work_size + 1, &lwork, &info);
+  }
+  else
   {
-    T norm = 0;
-    for (std::size_t k = 0; k < wcoeffs.extent(1); ++k)
-      norm += wcoeffs(i, k) * wcoeffs(i, k);
+    dgeqrf_(&m, &n, a, &lda, tau.data(), work_size, &lwork, &info);
+    dorgqr_(&m, &n, &n, a, &lda, tau.data(), work_size + 1, &lwork, &info);
+  }
+  lwork = std::max(work_size[0], work_size[1]);
+  std::vector<T> work(std::max(lwork, 1));
 
-    norm = std::sqrt(norm);
-    if (norm < 2 * std::numeric_limits<T>::epsilon())
+  if constexpr (std::is_same_v<T, float>)
+    sgeqrf_(&m, &n, a, &lda, tau.data(), work.data(), &lwork, &info);
+  else
+    dgeqrf_(&m, &n, a, &lda, tau.data(), work.data(), &lwork, &info);
+  if (info != 0)
+    throw std::runtime_error("QR factorisation failed: " + std::to_string(info));
+
+  // The diagonal of R is the norm of each row after the previous rows
+  // have been subtracted from it
+  std::vector<T> sign(n);
+  for (int i = 0; i < n; ++i)
+  {
+    const T r = a[i * lda + i];
+    if (std::abs(r) < 2 * std::numeric_limits<T>::epsilon())
     {
       throw std::runtime_error("Cannot orthogonalise the rows of a matrix "
                                "with incomplete row rank");
     }
+    sign[i] = r < 0 ? -1 : 1;
+  }
 
-    for (std::size_t k = 0; k < wcoeffs.extent(1); ++k)
-      wcoeffs(i, k) /= norm;
+  if constexpr (std::is_same_v<T, float>)
+    sorgqr_(&m, &n, &n, a, &lda, tau.data(), work.data(), &lwork, &info);
+  else
+    dorgqr_(&m, &n, &n, a, &lda, tau.data(), work.data(), &lwork, &info);
+  if (info != 0)
+    throw std::runtime_error("QR factorisation failed: " + std::to_string(info));
 
-    for (std::size_t j = i + 1; j < wcoeffs.extent(0); ++j)
-    {
-      T a = 0;
-      for (std::size_t k = 0; k < wcoeffs.extent(1); ++k)
-        a += wcoeffs(i, k) * wcoeffs(j, k);
-      for (std::size_t k = 0; k < wcoeffs.extent(1); ++k)
-        wcoeffs(j, k) -= a * wcoeffs(i, k);
-    }
-  }
+  // Fix the signs so that the result matches Gram-Schmidt
+  for (int i = 0; i < n; ++i)
+    if (sign[i] < 0)
+      for (int k = 0; k < m; ++k)
+        a[i * lda + k] = -a[i * lda + k];
 }
 } // namespace basix::math
@@ -33,6 +33,10 @@ std::vector<int> axis_points(const cell::type celltype)
     return {1, 2, 3};
   case cell::type::hexahedron:
     return {1, 2, 4};
+  case cell::type::prism:
+    return {1, 2, 3};
+  case cell::type::pyramid:
+    return {1, 2, 4};
   default:
     throw std::runtime_error(
         "Integrals of this entity type not yet implemented.");
@@ -75,19 +79,15 @@ map_points(const cell::type celltype0, const cell::type celltype1,
         axes(e, i, j) = entity_x(axis_pts[i], j) - entity_x(0, j);
 
     // Compute x = x0 + \Delta x
-    std::vector<T> axes_b(axes.extent(1) * axes.extent(2));
-    mdspan_t<T, 2> axes_e(axes_b.data(), axes.extent(1), axes.extent(2));
-    for (std::size_t i = 0; i < axes_e.extent(0); ++i)
-      for (std::size_t j = 0; j < axes_e.extent(1); ++j)
-        axes_e(i, j) = axes(e, i, j);
-
-    std::vector<T> dxbuffer(x.extent(0) * axes_e.extent(1));
-    mdspan_t<T, 2> dx(dxbuffer.data(), x.extent(0), axes_e.extent(1));
-    math::dot(x, axes_e, dx);
-
     for (std::size_t i = 0; i < p[e].extent(0); ++i)
+    {
       for (std::size_t j = 0; j < p[e].extent(1); ++j)
-        p[e](i, j) = entity_x(0, j) + dx(i, j);
+      {
+        p[e](i, j) = entity_x(0, j);
+        for (std::size_t k = 0; k < axes.extent(1); ++k)
+          p[e](i, j) += x(i, k) * axes(e, k, j);
+      }
+    }
   }
 
   return {p, axes};
@@ -275,10 +275,9 @@ moments::make_tangent_integral_moments(const FiniteElement<T>& V,
   const cell::type sub_celltype = V.cell_type();
   const std::size_t entity_dim = cell::topological_dimension(sub_celltype);
   const std::size_t num_entities = cell::num_sub_entities(celltype, entity_dim);
-  const std::size_t tdim = cell::topological_dimension(celltype);
 
   // If this is always true, value_size input can be removed
-  assert(tdim == value_size);
+  assert(std::size_t(cell::topological_dimension(celltype)) == value_size);
 
   if (entity_dim != 1)
     throw std::runtime_error("Tangent is only well-defined on an edge.");
@@ -297,8 +296,9 @@ moments::make_tangent_integral_moments(const FiniteElement<T>& V,
   const auto [phib, phishape] = V.tabulate(0, pts);
   mdspan_t<const T, 4> phi(phib.data(), phishape);
 
-  const std::array<std::size_t, 2> pshape = {pts.extent(0), tdim};
-  std::vector<std::vector<T>> pb;
+  // Map quadrature points onto each edge. The axis of each edge is its
+  // tangent.
+  const auto [points, axes] = map_points(celltype, sub_celltype, pts);
 
   const std::array<std::size_t, 4> Dshape
       = {phi.extent(2), value_size, phi.extent(1), 1};
@@ -310,33 +310,25 @@ moments::make_tangent_integral_moments(const FiniteElement<T>& V,
   // Iterate over cell entities
   for (std::size_t e = 0; e < num_entities; ++e)
   {
-    const auto [ebuffer, eshape] = cell::sub_entity_geometry<T>(celltype, 1, e);
-    mdspan_t<const T, 2> edge_x(ebuffer.data(), eshape);
-
-    std::vector<T> tangent(edge_x.extent(1));
-    for (std::size_t i = 0; i < edge_x.extent(1); ++i)
-      tangent[i] = edge_x(1, i) - edge_x(0, i);
-
     // No need to normalise the tangent, as the size of this is equal to
     // the integral Jacobian
 
-    // Map quadrature points onto triangle edge
-    auto& _pb = pb.emplace_back(pshape[0] * pshape[1]);
-    mdspan_t<T, 2> _p(_pb.data(), pshape);
-    for (std::size_t i = 0; i < pts.extent(0); ++i)
-      for (std::size_t j = 0; j < _p.extent(1); ++j)
-        _p(i, j) = edge_x(0, j) + pts(i, 0) * tangent[j];
-
     // Compute edge tangent integral moments
     mdspan_t<T, 4>& _D = D.emplace_back(Db[e].data(), Dshape);
     for (std::size_t i = 0; i < phi.extent(2); ++i)
     {
       for (std::size_t j = 0; j < value_size; ++j)
         for (std::size_t k = 0; k < wts.size(); ++k)
-          _D(i, j, k, 0) = phi(0, k, i, 0) * wts[k] * tangent[j];
+          _D(i, j, k, 0) = phi(0, k, i, 0) * wts[k] * axes(e, 0, j);
     }
   }
 
+  const std::array<std::size_t, 2> pshape
+      = {points.front().extent(0), points.front().extent(1)};
+  std::vector<std::vector<T>> pb;
+  for (const mdarray_t<T, 2>& p : points)
+    pb.emplace_back(p.data(), p.data() + p.size());
+
   return {pb, pshape, Db, Dshape};
 }
 //----------------------------------------------------------------------------
@@ -371,9 +363,9 @@ moments::make_normal_integral_moments(const FiniteElement<T>& V,
   const auto [phib, phishape] = V.tabulate(0, pts);
   mdspan_t<const T, 4> phi(phib.data(), phishape);
 
-  // Storage for coordinates of evaluations points in the reference cell
-  const std::array<std::size_t, 2> pshape = {pts.extent(0), tdim};
-  std::vector<std::vector<T>> pb;
+  // Map quadrature points onto each facet. The axes of each facet are
+  // tangent to it.
+  const auto [points, axes] = map_points(celltype, sub_celltype, pts);
 
   // Storage for interpolation matrix
   const std::array<std::size_t, 4> Dshape
@@ -383,45 +375,18 @@ moments::make_normal_integral_moments(const FiniteElement<T>& V,
   std::vector<std::vector<T>> Db(num_entities, std::vector<T>(size));
   std::vector<mdspan_t<T, 4>> D;
 
-  // Evaluate moment space at quadrature points
-
   // Iterate over cell entities
   std::array<T, 3> normal;
   for (std::size_t e = 0; e < num_entities; ++e)
   {
-    // Map quadrature points onto facet (cell entity e)
-    const auto [ebuffer, eshape]
-        = cell::sub_entity_geometry<T>(celltype, tdim - 1, e);
-    mdspan_t<const T, 2> facet_x(ebuffer.data(), eshape);
-
-    auto& _pb = pb.emplace_back(pshape[0] * pshape[1]);
-    mdspan_t<T, 2> _p(_pb.data(), pshape);
+    // No need to normalise the normal, as the size of this is equal to
+    // the integral Jacobian
     if (tdim == 2)
-    {
-      // No need to normalise the normal, as the size of this is equal
-      // to the integral jacobian
-      std::array<T, 2> tangent
-          = {facet_x(1, 0) - facet_x(0, 0), facet_x(1, 1) - facet_x(0, 1)};
-      for (std::size_t p = 0; p < _p.extent(0); ++p)
-        for (std::size_t i = 0; i < _p.extent(1); ++i)
-          _p(p, i) = facet_x(0, i) + pts(p, 0) * tangent[i];
-
-      normal = {-tangent[1], tangent[0], 0.0};
-    }
+      normal = {-axes(e, 0, 1), axes(e, 0, 0), 0.0};
     else if (tdim == 3)
     {
-      // No need to normalise the normal, as the size of this is equal
-      // to the integral Jacobian
-      std::array<T, 3> t0
-          = {facet_x(1, 0) - facet_x(0, 0), facet_x(1, 1) - facet_x(0, 1),
-             facet_x(1, 2) - facet_x(0, 2)};
-      std::array<T, 3> t1
-          = {facet_x(2, 0) - facet_x(0, 0), facet_x(2, 1) - facet_x(0, 1),
-             facet_x(2, 2) - facet_x(0, 2)};
-      for (std::size_t p = 0; p < _p.extent(0); ++p)
-        for (std::size_t i = 0; i < _p.extent(1); ++i)
-          _p(p, i) = facet_x(0, i) + pts(p, 0) * t0[i] + pts(p, 1) * t1[i];
-
+      std::array<T, 3> t0 = {axes(e, 0, 0), axes(e, 0, 1), axes(e, 0, 2)};
+      std::array<T, 3> t1 = {axes(e, 1, 0), axes(e, 1, 1), axes(e, 1, 2)};
       normal = math::cross(t0, t1);
     }
     else
@@ -435,6 +400,12 @@ moments::make_normal_integral_moments(const FiniteElement<T>& V,
           _D(i, j, k, 0) = phi(0, k, i, 0) * wts[k] * normal[j];
   }
 
+  const std::array<std::size_t, 2> pshape
+      = {points.front().extent(0), points.front().extent(1)};
+  std::vector<std::vector<T>> pb;
+  for (const mdarray_t<T, 2>& p : points)
+    pb.emplace_back(p.data(), p.data() + p.size());
+
   return {pb, pshape, Db, Dshape};
 }
 //----------------------------------------------------------------------------
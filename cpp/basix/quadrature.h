@@ -14,13 +14,23 @@
 namespace basix::quadrature
 {
 
-/// Quadrature type
+/// @brief Quadrature type
+///
+/// The `symmetric` rules are fully symmetric rules with positive
+/// weights and interior points that integrate polynomials of total
+/// degree `m` exactly on quadrilaterals, hexahedra, prisms and pyramids,
+/// using far fewer points than the default Gauss-Jacobi rules. Note that
+/// the default rules on these cells integrate the larger polynomial
+/// spaces spanned by the Basix polysets of degree `m` exactly (eg
+/// \f$Q_m\f$ on a quadrilateral). If no symmetric rule is available for
+/// the cell and degree, the `Default` rule is used.
 enum class type
 {
   Default = 0,
   gauss_jacobi = 1,
   gll = 2,
   xiao_gimbutas = 3,
+  symmetric = 4,
   zienkiewicz_taylor = 20,
   keast = 21,
   strang_fix = 22,
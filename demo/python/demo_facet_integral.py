@@ -76,3 +76,13 @@ normal_deriv = tab[0] * normal[0] + tab[1] * normal[1] + tab[2] * normal[2]
 jacobian = basix.cell.facet_jacobians(CellType.tetrahedron)[0]
 size_jacobian = np.linalg.norm(np.cross(jacobian[:, 0], jacobian[:, 1]))
 print(np.sum(normal_deriv * weights) * size_jacobian)
+
+# The mapping of a quadrature rule to each facet of a cell is needed in
+# many places, so Basix can do it for us. The function
+# `make_facet_quadrature` returns the points on every facet of the cell,
+# and weights that have already been scaled by the size of each facet.
+# We use this to compute the same integral again.
+
+facet_points, facet_weights = basix.make_facet_quadrature(CellType.tetrahedron, 3)
+tab = lagrange.tabulate(1, facet_points[0])[1:, :, 5, 0]
+print(np.sum((normal @ tab) * facet_weights[0]))
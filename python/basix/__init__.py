@@ -7,8 +7,17 @@
 
 The core of the library is written in C++, but the majority of Basix's
 functionality can be used via this Python interface.
+
+The submodules :mod:`basix.ufl`, :mod:`basix.numba_helpers` and
+:mod:`basix.vis` are imported the first time they are accessed, so
+``import basix`` does not import UFL, Numba or their dependencies. If
+the optional dependencies of a submodule are not installed, accessing
+it raises an ``AttributeError``.
 """
 
+import importlib as _importlib
+import typing as _typing
+
 # Template placeholder for injecting Windows dll directories in CI
 # WINDOWSDLL
 
@@ -22,17 +31,31 @@ from basix.finite_element import (
     LagrangeVariant,
     create_custom_element,
     create_element,
+    create_elements,
     create_tp_element,
 )
-from basix.interpolation import compute_interpolation_operator
+from basix.interpolation import (
+    compute_interpolation_operator,
+    compute_tensor_product_interpolation_operator,
+)
 from basix.lattice import LatticeSimplexMethod, LatticeType, create_lattice
 from basix.polynomials import PolynomialType, PolysetType, tabulate_polynomials
 from basix.polynomials import restriction as polyset_restriction
 from basix.polynomials import superset as polyset_superset
-from basix.quadrature import QuadratureType, make_quadrature
+from basix.quadrature import QuadratureType, make_facet_quadrature, make_quadrature
 from basix.sobolev_spaces import SobolevSpace
 from basix.utils import index
 
+if _typing.TYPE_CHECKING:
+    from basix import numba_helpers, ufl, vis  # noqa: F401
+
+_LAZY_SUBMODULES = ("numba_helpers", "ufl", "vis")
+
+# The lazy submodules that are listed by dir(). Submodules with optional
+# dependencies are not listed, so that tools that inspect the members of
+# the module (e.g. help() and autodoc) do not import them.
+_LISTED_SUBMODULES = ("vis",)
+
 __all__ = [
     "cell",
     "finite_element",
@@ -40,6 +63,7 @@ __all__ = [
     "polynomials",
     "quadrature",
     "sobolev_spaces",
+    "vis",
     "CellType",
     "DPCVariant",
     "ElementFamily",
@@ -61,7 +85,27 @@ __all__ = [
     "topology",
     "create_custom_element",
     "create_element",
+    "create_elements",
     "create_tp_element",
     "make_quadrature",
+    "make_facet_quadrature",
     "compute_interpolation_operator",
+    "compute_tensor_product_interpolation_operator",
 ]
+
+
+def __getattr__(name: str) -> _typing.Any:
+    """Import a lazily loaded submodule when it is first accessed."""
+    if name in _LAZY_SUBMODULES:
+        # import_module sets the attribute on this module, so this is
+        # only called once for each submodule
+        try:
+            return _importlib.import_module(f"basix.{name}")
+        except ImportError as e:
+            raise AttributeError(f"module 'basix' has no attribute '{name}' ({e})") from e
+    raise AttributeError(f"module 'basix' has no attribute '{name}'")
+
+
+def __dir__() -> list[str]:
+    """List the attributes of the module, including lazy submodules."""
+    return sorted(set(globals()) | set(_LISTED_SUBMODULES))
@@ -82,6 +82,8 @@ class FiniteElement_float32:
 
     def hash(self) -> int: ...
 
+    def content_hash(self) -> int: ...
+
     @overload
     def permute_subentity_closure(self, arg0: Annotated[ArrayLike, dict(dtype='int32', shape=(None), order='C')], arg1: int, arg2: CellType, /) -> Annotated[ArrayLike, dict(dtype='int32')]: ...
 
@@ -98,6 +100,10 @@ class FiniteElement_float32:
 
     def pull_back(self, arg0: Annotated[ArrayLike, dict(dtype='float32', shape=(None, None, None), order='C', writable=False)], arg1: Annotated[ArrayLike, dict(dtype='float32', shape=(None, None, None), order='C', writable=False)], arg2: Annotated[ArrayLike, dict(dtype='float32', shape=(None), order='C', writable=False)], arg3: Annotated[ArrayLike, dict(dtype='float32', shape=(None, None, None), order='C', writable=False)], /) -> Annotated[ArrayLike, dict(dtype='float32')]: ...
 
+    def interpolate(self, arg: Annotated[ArrayLike, dict(dtype='float32', shape=(None, None), order='C', writable=False)], /) -> Annotated[ArrayLike, dict(dtype='float32')]: ...
+
+    def interpolate_cells(self, arg0: Annotated[ArrayLike, dict(dtype='float32', shape=(None, None, None), order='C', writable=False)], arg1: Annotated[ArrayLike, dict(dtype='float32', shape=(None, None, None), order='C', writable=False)], arg2: Annotated[ArrayLike, dict(dtype='float32', shape=(None), order='C', writable=False)], arg3: Annotated[ArrayLike, dict(dtype='float32', shape=(None, None, None), order='C', writable=False)], arg4: Annotated[ArrayLike, dict(dtype='uint32', shape=(None), order='C', writable=False)], arg5: int, /) -> Annotated[ArrayLike, dict(dtype='float32')]: ...
+
     def T_apply(self, arg0: Annotated[ArrayLike, dict(dtype='float32', shape=(None), order='C')], arg1: int, arg2: int, /) -> None: ...
 
     def Tt_apply_right(self, arg0: Annotated[ArrayLike, dict(dtype='float32', shape=(None), order='C')], arg1: int, arg2: int, /) -> None: ...
@@ -108,6 +114,19 @@ class FiniteElement_float32:
 
     def entity_transformations(self) -> dict: ...
 
+    def precompute_transformations(self) -> None: ...
+
+    def slim(self) -> FiniteElement_float32: ...
+
+    def memory_usage(self) -> dict[str, int]: ...
+
+    @property
+    def is_slim(self) -> bool: ...
+
+    def cast(self, arg: str, /) -> FiniteElement_float32 | FiniteElement_float64: ...
+
+    def discontinuous_element(self) -> FiniteElement_float32: ...
+
     def get_tensor_product_representation(self) -> list[list[FiniteElement_float32]]: ...
 
     @property
@@ -179,6 +198,9 @@ class FiniteElement_float32:
     @property
     def interpolation_matrix(self) -> Annotated[ArrayLike, dict(dtype='float32', shape=(None, None), writable=False)]: ...
 
+    @property
+    def interpolation_blocks(self) -> list[tuple[int, int, int, int]]: ...
+
     @property
     def dual_matrix(self) -> Annotated[ArrayLike, dict(dtype='float32', shape=(None, None), writable=False)]: ...
 
@@ -214,6 +236,8 @@ class FiniteElement_float64:
 
     def hash(self) -> int: ...
 
+    def content_hash(self) -> int: ...
+
     @overload
     def permute_subentity_closure(self, arg0: Annotated[ArrayLike, dict(dtype='int64', shape=(None), order='C')], arg1: int, arg2: CellType, /) -> Annotated[ArrayLike, dict(dtype='int64')]: ...
 
@@ -230,6 +254,10 @@ class FiniteElement_float64:
 
     def pull_back(self, arg0: Annotated[ArrayLike, dict(dtype='float64', shape=(None, None, None), order='C', writable=False)], arg1: Annotated[ArrayLike, dict(dtype='float64', shape=(None, None, None), order='C', writable=False)], arg2: Annotated[ArrayLike, dict(dtype='float64', shape=(None), order='C', writable=False)], arg3: Annotated[ArrayLike, dict(dtype='float64', shape=(None, None, None), order='C', writable=False)], /) -> Annotated[ArrayLike, dict(dtype='float64')]: ...
 
+    def interpolate(self, arg: Annotated[ArrayLike, dict(dtype='float64', shape=(None, None), order='C', writable=False)], /) -> Annotated[ArrayLike, dict(dtype='float64')]: ...
+
+    def interpolate_cells(self, arg0: Annotated[ArrayLike, dict(dtype='float64', shape=(None, None, None), order='C', writable=False)], arg1: Annotated[ArrayLike, dict(dtype='float64', shape=(None, None, None), order='C', writable=False)], arg2: Annotated[ArrayLike, dict(dtype='float64', shape=(None), order='C', writable=False)], arg3: Annotated[ArrayLike, dict(dtype='float64', shape=(None, None, None), order='C', writable=False)], arg4: Annotated[ArrayLike, dict(dtype='uint32', shape=(None), order='C', writable=False)], arg5: int, /) -> Annotated[ArrayLike, dict(dtype='float64')]: ...
+
     def T_apply(self, arg0: Annotated[ArrayLike, dict(dtype='float64', shape=(None), order='C')], arg1: int, arg2: int, /) -> None: ...
 
     def Tt_apply_right(self, arg0: Annotated[ArrayLike, dict(dtype='float64', shape=(None), order='C')], arg1: int, arg2: int, /) -> None: ...
@@ -240,6 +268,19 @@ class FiniteElement_float64:
 
     def entity_transformations(self) -> dict: ...
 
+    def precompute_transformations(self) -> None: ...
+
+    def slim(self) -> FiniteElement_float64: ...
+
+    def memory_usage(self) -> dict[str, int]: ...
+
+    @property
+    def is_slim(self) -> bool: ...
+
+    def cast(self, arg: str, /) -> FiniteElement_float32 | FiniteElement_float64: ...
+
+    def discontinuous_element(self) -> FiniteElement_float64: ...
+
     def get_tensor_product_representation(self) -> list[list[FiniteElement_float64]]: ...
 
     @property
@@ -311,6 +352,9 @@ class FiniteElement_float64:
     @property
     def interpolation_matrix(self) -> Annotated[ArrayLike, dict(dtype='float64', shape=(None, None), writable=False)]: ...
 
+    @property
+    def interpolation_blocks(self) -> list[tuple[int, int, int, int]]: ...
+
     @property
     def dual_matrix(self) -> Annotated[ArrayLike, dict(dtype='float64', shape=(None, None), writable=False)]: ...
 
@@ -430,6 +474,8 @@ class QuadratureType(enum.IntEnum):
 
     xiao_gimbutas = 3
 
+    symmetric = 4
+
 class SobolevSpace(enum.IntEnum):
     """Sobolev space."""
 
@@ -477,6 +523,10 @@ def create_custom_element_float64(cell_type: CellType, value_shape: Sequence[int
 
 def create_element(arg0: ElementFamily, arg1: CellType, arg2: int, arg3: LagrangeVariant, arg4: DPCVariant, arg5: bool, arg6: Sequence[int], arg7: str, /) -> FiniteElement_float32 | FiniteElement_float64: ...
 
+def create_elements(arg0: Sequence[tuple[ElementFamily, CellType, int, LagrangeVariant, DPCVariant, bool, Sequence[int]]], arg1: int, arg2: str, /) -> list[FiniteElement_float32] | list[FiniteElement_float64]: ...
+
+def entity_transformations_cache_hits() -> int: ...
+
 def create_lattice(arg0: CellType, arg1: int, arg2: LatticeType, arg3: bool, arg4: LatticeSimplexMethod, /) -> Annotated[ArrayLike, dict(dtype='float64')]: ...
 
 def create_tp_element(arg0: ElementFamily, arg1: CellType, arg2: int, arg3: LagrangeVariant, arg4: DPCVariant, arg5: bool, arg6: str, /) -> FiniteElement_float32 | FiniteElement_float64: ...
@@ -5,6 +5,8 @@
 # SPDX-License-Identifier:    MIT
 """Functions for creating finite elements."""
 
+import inspect
+import os
 import typing
 from warnings import warn
 
@@ -21,6 +23,7 @@ from basix._basixcpp import (
     create_custom_element_float64 as _create_custom_element_float64,
 )
 from basix._basixcpp import create_element as _create_element
+from basix._basixcpp import create_elements as _create_elements
 from basix._basixcpp import create_tp_element as _create_tp_element
 from basix._basixcpp import tp_dof_ordering as _tp_dof_ordering
 from basix._basixcpp import lex_dof_ordering as _lex_dof_ordering
@@ -33,6 +36,7 @@ from basix.sobolev_spaces import SobolevSpace
 __all__ = [
     "FiniteElement",
     "create_element",
+    "create_elements",
     "create_custom_element",
     "create_tp_element",
     "lex_dof_ordering",
@@ -54,6 +58,7 @@ class FiniteElement:
             This initialiser is intended for internal library use.
         """
         self._e = e
+        self._casts: dict[np.dtype, FiniteElement] = {}
 
     def tabulate(self, n: int, x: npt.NDArray) -> npt.ArrayLike:
         """Compute basis values and derivatives at set of points.
@@ -104,6 +109,16 @@ class FiniteElement:
         """Hash."""
         return self.hash()
 
+    def content_hash(self) -> int:
+        """Hash of the data that defines this element.
+
+        The hash is computed from the raw values of the data that
+        defines the element when it is created. It is the same on all
+        platforms and in all processes, so it can be used as a key for
+        caching data for the element, e.g. generated code.
+        """
+        return self._e.content_hash()
+
     def push_forward(self, U, J, detJ, K) -> npt.ArrayLike:
         """Map function values from the reference to a physical cell.
 
@@ -143,6 +158,80 @@ class FiniteElement:
         """
         return self._e.pull_back(u, J, detJ, K)
 
+    def interpolate(self, values: npt.ArrayLike) -> npt.NDArray:
+        """Interpolate functions into the finite element space.
+
+        This computes ``interpolation_matrix @ values``, but only
+        applies the blocks of the interpolation matrix that couple the
+        DOFs of each sub-entity to the interpolation points on that
+        sub-entity.
+
+        Args:
+            values: The values of the functions at :attr:`points`,
+                ordered in the same way as the columns of
+                :attr:`interpolation_matrix`. Shape is
+                ``(value_size * num_points,)`` for one function or
+                ``(value_size * num_points, n)`` for ``n`` functions.
+
+        Returns:
+            The coefficients of the interpolated functions. Shape is
+            ``(dim,)`` or ``(dim, n)``.
+        """
+        v = np.ascontiguousarray(values, dtype=self.dtype)
+        if v.ndim == 1:
+            return np.asarray(self._e.interpolate(v.reshape(-1, 1))).reshape(-1)
+        return np.asarray(self._e.interpolate(v))
+
+    def interpolate_cells(
+        self,
+        u: npt.ArrayLike,
+        J: npt.ArrayLike,
+        detJ: npt.ArrayLike,
+        K: npt.ArrayLike,
+        cell_info: typing.Optional[npt.ArrayLike] = None,
+        num_threads: int = 1,
+    ) -> npt.NDArray:
+        """Interpolate functions on a set of physical cells.
+
+        For each cell, this pulls back the values (as
+        :meth:`pull_back`), computes the coefficients (as
+        :meth:`interpolate`) and applies the inverse transpose DOF
+        transformation for the cell (as :meth:`Tt_inv_apply`). The cells
+        are split between threads, and the GIL is released while the
+        coefficients are computed.
+
+        Args:
+            u: The values of the functions at :attr:`points` on each
+                cell. The indices are ``(cell index, point index,
+                components)``.
+            J: The Jacobian of the mapping for each cell. The indices
+                are ``(cell index, J_i, J_j)``.
+            detJ: The determinant of the Jacobian of the mapping for
+                each cell.
+            K: The inverse of the Jacobian of the mapping for each
+                cell. The indices are ``(cell index, K_i, K_j)``.
+            cell_info: The permutation info for each cell. If ``None``,
+                no DOF transformations are applied.
+            num_threads: The maximum number of threads to use. Must be
+                at least 1. No more threads than the number of hardware
+                threads, or than one for each 32 cells, are used.
+
+        Returns:
+            The coefficients on each cell. Shape is ``(num_cells,
+            dim)``.
+        """
+        info = np.zeros(0, dtype=np.uint32) if cell_info is None else cell_info
+        return np.asarray(
+            self._e.interpolate_cells(
+                np.ascontiguousarray(u, dtype=self.dtype),
+                np.ascontiguousarray(J, dtype=self.dtype),
+                np.ascontiguousarray(detJ, dtype=self.dtype),
+                np.ascontiguousarray(K, dtype=self.dtype),
+                np.ascontiguousarray(info, dtype=np.uint32),
+                num_threads,
+            )
+        )
+
     def T_apply(self, data, block_size, cell_info) -> None:
         """Apply DOF transformations to some data in-place.
 
@@ -293,6 +382,78 @@ class FiniteElement:
         """
         return self._e.entity_transformations()
 
+    def precompute_transformations(self) -> None:
+        """Compute the data used to apply DOF transformations.
+
+        This data is computed the first time that it is used. Calling
+        this function computes it immediately instead.
+        """
+        self._e.precompute_transformations()
+
+    def slim(self) -> "FiniteElement":
+        """Create a copy of this element that only stores runtime data.
+
+        The copy can be used to tabulate, apply DOF transformations and
+        interpolate, but does not store the data that is only used to
+        construct the element: ``wcoeffs``, ``x``, ``M``, the
+        interpolation matrix and the dual matrix.
+
+        Returns:
+            The slim element.
+        """
+        return FiniteElement(self._e.slim())
+
+    def astype(self, dtype: npt.DTypeLike) -> "FiniteElement":
+        """Convert this element to a different floating point type.
+
+        The data stored by the element is converted, so the element is
+        not created again. Converting a ``float64`` element to
+        ``float32`` gives a more accurate element than creating it in
+        single precision. The converted element is cached, so
+        converting an element to the same type again returns the same
+        element.
+
+        Args:
+            dtype: Floating point data type of the new element.
+
+        Returns:
+            The converted element.
+        """
+        dtype = np.dtype(dtype)
+        if dtype == self.dtype:
+            return self
+        if dtype not in self._casts:
+            self._casts[dtype] = FiniteElement(self._e.cast(dtype.char))
+        return self._casts[dtype]
+
+    def discontinuous_element(self) -> "FiniteElement":
+        """Create the discontinuous version of this element.
+
+        The discontinuous element is not created again: the data that is
+        the same for both elements is shared with this element. The
+        result is the same as creating the element with
+        ``discontinuous=True``.
+
+        Returns:
+            The discontinuous element. If this element is discontinuous,
+            this element is returned.
+        """
+        if self.discontinuous:
+            return self
+        return FiniteElement(self._e.discontinuous_element())
+
+    def memory_usage(self) -> dict[str, int]:
+        """Memory used by the data stored by this element.
+
+        The data used to apply DOF transformations is only included if
+        it has been computed.
+
+        Returns:
+            The number of bytes used by the arrays stored for each item
+            of data.
+        """
+        return self._e.memory_usage()
+
     def get_tensor_product_representation(self) -> list[list["FiniteElement"]]:
         """Get the tensor product representation of this element.
 
@@ -491,6 +652,11 @@ class FiniteElement:
         """True if DOF transformations are all the identity."""
         return self._e.dof_transformations_are_identity
 
+    @property
+    def is_slim(self) -> bool:
+        """True if this element only stores the data needed at runtime."""
+        return self._e.is_slim
+
     @property
     def interpolation_is_identity(self) -> bool:
         """True if interpolation matrix for this element is the identity."""
@@ -526,6 +692,17 @@ class FiniteElement:
         """
         return self._e.interpolation_matrix
 
+    @property
+    def interpolation_blocks(self) -> list[tuple[int, int, int, int]]:
+        """Blocks of the interpolation matrix for each sub-entity.
+
+        Each block is ``(first DOF, number of DOFs, first point, number
+        of points)``. The DOFs of a sub-entity only depend on the values
+        at the interpolation points on that sub-entity, so all other
+        entries of the interpolation matrix are zero.
+        """
+        return self._e.interpolation_blocks
+
     @property
     def dual_matrix(self) -> npt.ArrayLike:
         """Matrix $BD^{T}$.
@@ -594,6 +771,7 @@ def create_element(
     discontinuous: bool = False,
     dof_ordering: typing.Optional[list[int]] = None,
     dtype: npt.DTypeLike = np.float64,
+    lazy: bool = True,
 ) -> FiniteElement:
     """Create a finite element.
 
@@ -609,6 +787,9 @@ def create_element(
             the interior of the cell.
         dof_ordering: Ordering of dofs for ``ElementDofLayout``.
         dtype: Element scalar type.
+        lazy: If `True`, the data used to apply DOF transformations is
+            computed the first time that it is used. If `False`, it is
+            computed when the element is created.
 
     Returns:
         A finite element.
@@ -623,10 +804,86 @@ def create_element(
         dof_ordering if dof_ordering is not None else [],
         np.dtype(dtype).char,
     )
+    if not lazy:
+        e.precompute_transformations()
 
     return FiniteElement(e)
 
 
+def create_elements(
+    specs: typing.Sequence[typing.Union[tuple, dict[str, typing.Any]]],
+    max_workers: typing.Optional[int] = None,
+    dtype: npt.DTypeLike = np.float64,
+) -> list[FiniteElement]:
+    """Create a list of finite elements in parallel.
+
+    The elements are created on multiple threads, without holding the
+    Python global interpreter lock. Each distinct element is only
+    created once: the same element is returned for identical specs. If
+    both the continuous and discontinuous versions of an element are
+    requested, only the continuous element is created and the
+    discontinuous element is derived from it.
+
+    Args:
+        specs: The arguments of :func:`create_element` for each
+            element, as a tuple of positional arguments or a dict of
+            keyword arguments. ``dtype`` and ``lazy`` cannot be given.
+        max_workers: The maximum number of threads to use. Must be at
+            least 1. If not set, the number of CPUs is used. No more
+            threads than the number of hardware threads are used.
+        dtype: Element scalar type.
+
+    Returns:
+        The finite elements, in the same order as ``specs``.
+    """
+    signature = inspect.signature(create_element)
+    unique: dict[tuple, int] = {}
+    indices = []
+    for spec in specs:
+        args = signature.bind(*spec) if isinstance(spec, tuple) else signature.bind(**spec)
+        if "dtype" in args.arguments or "lazy" in args.arguments:
+            raise ValueError("The specs of elements cannot include dtype or lazy.")
+        args.apply_defaults()
+        a = args.arguments
+        key = (
+            a["family"],
+            a["celltype"],
+            a["degree"],
+            a["lagrange_variant"],
+            a["dpc_variant"],
+            a["discontinuous"],
+            tuple(a["dof_ordering"] if a["dof_ordering"] is not None else []),
+        )
+        indices.append(unique.setdefault(key, len(unique)))
+
+    # Discontinuous elements whose continuous version is also requested
+    # are derived from the continuous element
+    keys = list(unique)
+    derived = {
+        i: unique[k[:5] + (False,) + k[6:]]
+        for i, k in enumerate(keys)
+        if k[5] and k[:5] + (False,) + k[6:] in unique
+    }
+    created = [i for i in range(len(keys)) if i not in derived]
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    new_elements = [
+        FiniteElement(e)
+        for e in _create_elements(
+            [keys[i][:-1] + (list(keys[i][-1]),) for i in created],
+            max_workers,
+            np.dtype(dtype).char,
+        )
+    ]
+    elements: list[typing.Optional[FiniteElement]] = [None] * len(keys)
+    for i, e in zip(created, new_elements):
+        elements[i] = e
+    for i, j in derived.items():
+        elements[i] = typing.cast(FiniteElement, elements[j]).discontinuous_element()
+    return [typing.cast(FiniteElement, elements[i]) for i in indices]
+
+
 def create_custom_element(
     cell_type: CellType,
     value_shape: tuple[int, ...],
@@ -644,6 +901,10 @@ def create_custom_element(
 ) -> FiniteElement:
     """Create a custom finite element.
 
+    The data used to apply DOF transformations is computed when the
+    element is created, so errors in the input that only affect the DOF
+    transformations are also raised by this function.
+
     Args:
         cell_type: Element cell type.
         value_shape: Value shape of the element.
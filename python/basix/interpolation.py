@@ -5,18 +5,82 @@
 # SPDX-License-Identifier:    MIT
 """Interpolation."""
 
+import functools
+import typing
+
+import numpy as np
 import numpy.typing as npt
 
 from basix._basixcpp import (
     compute_interpolation_operator as _compute_interpolation_operator,
 )
-from basix.finite_element import FiniteElement
+from basix.finite_element import FiniteElement, tp_dof_ordering, tp_factors
+
+if typing.TYPE_CHECKING:
+    import scipy.sparse
+
+__all__ = [
+    "TensorProductInterpolationOperator",
+    "compute_interpolation_operator",
+    "compute_tensor_product_interpolation_operator",
+]
+
+
+@functools.lru_cache(maxsize=128)
+def _interpolation_operator(e0: FiniteElement, e1: FiniteElement) -> npt.NDArray:
+    """Compute and cache the dense interpolation operator between two elements."""
+    op = np.asarray(_compute_interpolation_operator(e0._e, e1._e))  # type: ignore
+    op.setflags(write=False)
+    return op
+
+
+@functools.lru_cache(maxsize=128)
+def _sparse_interpolation_operator(
+    e0: FiniteElement, e1: FiniteElement, tol: float, block_size: int
+) -> "scipy.sparse.csr_array":
+    """Compute and cache the sparse interpolation operator between two elements."""
+    try:
+        import scipy.sparse
+    except ImportError:
+        raise ImportError("SciPy is required to create a sparse interpolation operator.")
+
+    op = _interpolation_operator(e0, e1)
+    op = np.where(np.abs(op) > tol * np.abs(op).max(initial=0.0), op, 0.0)
+    A = scipy.sparse.csr_array(op)
+    if block_size > 1:
+        A = scipy.sparse.csr_array(
+            scipy.sparse.kron(A, scipy.sparse.identity(block_size, dtype=A.dtype), format="csr")
+        )
+    return A
+
+
+@typing.overload
+def compute_interpolation_operator(
+    e0: FiniteElement,
+    e1: FiniteElement,
+    sparse: typing.Literal[False] = ...,
+    tol: typing.Optional[float] = ...,
+    block_size: int = ...,
+) -> npt.NDArray: ...
 
 
+@typing.overload
 def compute_interpolation_operator(
     e0: FiniteElement,
     e1: FiniteElement,
-) -> npt.NDArray:
+    sparse: typing.Literal[True],
+    tol: typing.Optional[float] = ...,
+    block_size: int = ...,
+) -> "scipy.sparse.csr_array": ...
+
+
+def compute_interpolation_operator(
+    e0: FiniteElement,
+    e1: FiniteElement,
+    sparse: bool = False,
+    tol: typing.Optional[float] = None,
+    block_size: int = 1,
+) -> typing.Union[npt.NDArray, "scipy.sparse.csr_array"]:
     """Compute a matrix that represents the interpolation between two elements.
 
     If the two elements have the same value size, this function returns
@@ -42,13 +106,188 @@ def compute_interpolation_operator(
     have the same map type, then only the DOF transformations need to be
     applied, as the pull back and push forward cancel each other out.
 
+    If ``sparse`` is ``True``, the operator is returned as a SciPy CSR
+    array, with entries that are roundoff-level zeros removed. If
+    ``block_size`` is greater than 1, the operator for a blocked
+    layout of both spaces is returned, where component ``i`` of
+    degree-of-freedom ``j`` has index ``j * block_size + i``. This
+    operator is built without forming the dense blocked matrix.
+
+    The operator is cached for each pair of elements.
+
     Args:
         e0: The element to interpolate from
         e1: The element to interpolate to
+        sparse: If ``True``, return a sparse CSR array. This requires
+            SciPy.
+        tol: Entries of the sparse operator whose absolute value is
+            at most ``tol`` times the largest absolute value are
+            removed. Defaults to 100 times the machine epsilon of the
+            elements' floating point type.
+        block_size: Block size of the sparse operator.
 
     Returns:
         Matrix operator that maps the 'from' degrees-of-freedom to
         the 'to' degrees-of-freedom. Shape is (ndofs(element_to),
-        ndofs(element_from))
+        ndofs(element_from)), multiplied by ``block_size`` if the
+        operator is sparse.
+    """
+    if not sparse:
+        if block_size != 1:
+            raise ValueError("A block size can only be used with a sparse operator.")
+        return _interpolation_operator(e0, e1).copy()
+
+    if tol is None:
+        tol = 100 * float(np.finfo(e0.dtype).eps)
+    return _sparse_interpolation_operator(e0, e1, tol, block_size).copy()
+
+
+class TensorProductInterpolationOperator:
+    """An interpolation operator between tensor product elements in factored form.
+
+    The operator is the Kronecker product of an operator between the
+    elements on an interval for each axis, with the rows and columns
+    permuted from the tensor product numbering of the DOFs to the
+    numbering of the DOFs of the two elements. It is applied one axis
+    at a time, so for elements of degree ``p`` on a hexahedron the cost
+    of an application is O(p^4) rather than O(p^6).
+    """
+
+    def __init__(
+        self,
+        factors: list[npt.NDArray],
+        dofs0: typing.Optional[npt.NDArray] = None,
+        dofs1: typing.Optional[npt.NDArray] = None,
+    ):
+        """Initialise the operator.
+
+        Args:
+            factors: The operator on an interval for each axis, with the
+                first axis varying slowest in the tensor product
+                numbering.
+            dofs0: The tensor product index of each DOF of the element
+                interpolated from. If ``None``, the DOFs are in tensor
+                product order.
+            dofs1: The tensor product index of each DOF of the element
+                interpolated to. If ``None``, the DOFs are in tensor
+                product order.
+        """
+        self.factors = factors
+        self._dofs0 = dofs0
+        self._dofs1 = dofs1
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """The shape of the operator as a matrix."""
+        return (
+            int(np.prod([f.shape[0] for f in self.factors])),
+            int(np.prod([f.shape[1] for f in self.factors])),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes used to store the factors."""
+        return sum(f.nbytes for f in self.factors)
+
+    def __matmul__(self, x: npt.ArrayLike) -> npt.NDArray:
+        """Apply the operator."""
+        return self.apply(x)
+
+    def apply(self, x: npt.ArrayLike) -> npt.NDArray:
+        """Apply the operator.
+
+        Args:
+            x: The DOF values of the element interpolated from. Shape is
+                ``(shape[1],)`` for one function or ``(shape[1], n)``
+                for ``n`` functions.
+
+        Returns:
+            The DOF values of the element interpolated to. Shape is
+            ``(shape[0],)`` or ``(shape[0], n)``.
+        """
+        x = np.asarray(x)
+        if x.shape[0] != self.shape[1]:
+            raise ValueError(f"Expected {self.shape[1]} DOF values, but got {x.shape[0]}.")
+
+        y = x.reshape(x.shape[0], -1)
+        if self._dofs0 is not None:
+            y = np.empty_like(y)
+            y[self._dofs0] = x.reshape(x.shape[0], -1)
+        y = y.reshape(*(f.shape[1] for f in self.factors), -1)
+        for axis, f in enumerate(self.factors):
+            y = np.moveaxis(np.tensordot(f, y, axes=(1, axis)), 0, axis)
+        y = y.reshape(self.shape[0], -1)
+        if self._dofs1 is not None:
+            y = y[self._dofs1]
+        return y.reshape((self.shape[0],) + x.shape[1:])
+
+    def todense(self) -> npt.NDArray:
+        """Return the operator as a dense matrix."""
+        return self.apply(np.identity(self.shape[1], dtype=self.factors[0].dtype))
+
+
+def _tensor_product_factors(
+    e: FiniteElement,
+) -> tuple[list[FiniteElement], typing.Optional[npt.NDArray]]:
+    """Get the factors and tensor product index of each DOF of an element."""
+    if e.has_tensor_product_factorisation:
+        return e.get_tensor_product_representation()[0], None
+
+    args = (e.family, e.cell_type, e.degree, e.lagrange_variant, e.dpc_variant, e.discontinuous)
+    try:
+        ordering = tp_dof_ordering(*args)
+    except RuntimeError:
+        raise ValueError("Element does not have a tensor product factorisation.")
+    factors = tp_factors(*args, dof_ordering=ordering, dtype=e.dtype)[0]
+
+    # Reference DOF i is the tensor product DOF ordering[i], and is DOF
+    # e.dof_ordering[i] of the element
+    dofs = np.asarray(ordering)
+    if len(e.dof_ordering) > 0:
+        dofs = np.empty_like(dofs)
+        dofs[e.dof_ordering] = ordering
+    return factors, dofs
+
+
+@functools.lru_cache(maxsize=128)
+def _tensor_product_interpolation_operator(
+    e0: FiniteElement, e1: FiniteElement
+) -> tuple[tuple[npt.NDArray, ...], typing.Optional[npt.NDArray], typing.Optional[npt.NDArray]]:
+    """Compute and cache the factors and DOF permutations of a tensor product operator."""
+    if e0.cell_type != e1.cell_type:
+        raise ValueError("The elements must be defined on the same cell.")
+    factors0, dofs0 = _tensor_product_factors(e0)
+    factors1, dofs1 = _tensor_product_factors(e1)
+    for dofs in (dofs0, dofs1):
+        if dofs is not None:
+            dofs.setflags(write=False)
+
+    ops = tuple(_interpolation_operator(f0, f1) for f0, f1 in zip(factors0, factors1))
+    return ops, dofs0, dofs1
+
+
+def compute_tensor_product_interpolation_operator(
+    e0: FiniteElement, e1: FiniteElement
+) -> TensorProductInterpolationOperator:
+    """Compute the interpolation between two tensor product elements in factored form.
+
+    The two elements must be elements with a tensor product
+    factorisation (see :func:`basix.tp_factors`) on the same cell. The
+    DOFs of the elements do not need to be in tensor product order.
+    This is useful for transferring between degrees in p-multigrid on
+    quadrilaterals and hexahedra, where the dense operator returned by
+    :func:`compute_interpolation_operator` is large.
+
+    The factors of the operator are cached for each pair of elements,
+    and are read-only.
+
+    Args:
+        e0: The element to interpolate from.
+        e1: The element to interpolate to.
+
+    Returns:
+        The operator that maps the 'from' degrees-of-freedom to the
+        'to' degrees-of-freedom.
     """
-    return _compute_interpolation_operator(e0._e, e1._e)  # type: ignore
+    ops, dofs0, dofs1 = _tensor_product_interpolation_operator(e0, e1)
+    return TensorProductInterpolationOperator(list(ops), dofs0, dofs1)
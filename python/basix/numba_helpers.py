@@ -7,9 +7,8 @@
 
 try:
     import numba as _numba
-except ImportError:
-    print("You must have Numba installed to use the Numba helper functions.")
-    raise
+except ImportError as e:
+    raise ImportError("You must have Numba installed to use the Numba helper functions.") from e
 
 import numpy as np
 import numpy.typing as npt
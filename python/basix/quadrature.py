@@ -5,16 +5,81 @@
 # SPDX-License-Identifier:    MIT
 """Functions to manipulate quadrature types."""
 
+import functools as _functools
+import typing
+
 import numpy as _np
 import numpy.typing as _npt
 
 from basix._basixcpp import QuadratureType
 from basix._basixcpp import make_quadrature as _mq
 from basix._basixcpp import gauss_jacobi_rule as _gjr
-from basix.cell import CellType
+from basix.cell import (
+    CellType,
+    facet_jacobians,
+    geometry,
+    subentity_types,
+    topology,
+)
 from basix.polynomials import PolysetType
 
-__all__ = ["string_to_type", "make_quadrature"]
+__all__ = ["string_to_type", "make_quadrature", "make_facet_quadrature", "TensorQuadrature"]
+
+
+class TensorQuadrature:
+    """Quadrature rule that is a tensor product of interval rules.
+
+    The rule is stored as the points and weights of the interval rule
+    for each axis. The points and weights on the full tensor grid are
+    only computed when they are first accessed. The first axis varies
+    slowest in the full grid, as in the rules created by
+    :func:`make_quadrature`.
+
+    The rule can be unpacked like the output of :func:`make_quadrature`,
+    ie ``points, weights = rule``.
+    """
+
+    def __init__(self, factors: list[tuple[_npt.NDArray, _npt.NDArray]]):
+        """Initialise a tensor product quadrature rule.
+
+        Args:
+            factors: Points, with shape ``(npoints,)``, and weights of
+                the interval rule for each axis.
+        """
+        self._factors = [(_np.asarray(p).reshape(-1), _np.asarray(w)) for p, w in factors]
+
+    @property
+    def factors(self) -> list[tuple[_npt.NDArray, _npt.NDArray]]:
+        """Points and weights of the interval rule for each axis."""
+        return self._factors
+
+    @property
+    def tdim(self) -> int:
+        """Topological dimension of the cell."""
+        return len(self._factors)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Number of points along each axis."""
+        return tuple(w.shape[0] for _, w in self._factors)
+
+    @_functools.cached_property
+    def points(self) -> _npt.NDArray:
+        """Points of the rule on the full tensor grid."""
+        grid = _np.meshgrid(*[p for p, _ in self._factors], indexing="ij")
+        return _np.stack([x.reshape(-1) for x in grid], axis=1)
+
+    @_functools.cached_property
+    def weights(self) -> _npt.NDArray:
+        """Weights of the rule on the full tensor grid."""
+        weights = _np.ones(1)
+        for _, w in self._factors:
+            weights = _np.outer(weights, w).reshape(-1)
+        return weights
+
+    def __iter__(self):
+        """Iterate over the points and weights on the full grid."""
+        return iter((self.points, self.weights))
 
 
 def string_to_type(rule: str) -> QuadratureType:
@@ -38,12 +103,34 @@ def string_to_type(rule: str) -> QuadratureType:
     return QuadratureType[rule]
 
 
+@typing.overload
+def make_quadrature(
+    cell: CellType,
+    degree: int,
+    rule: QuadratureType = ...,
+    polyset_type: PolysetType = ...,
+    tensor: typing.Literal[False] = ...,
+) -> tuple[_npt.ArrayLike, _npt.ArrayLike]: ...
+
+
+@typing.overload
+def make_quadrature(
+    cell: CellType,
+    degree: int,
+    rule: QuadratureType = ...,
+    polyset_type: PolysetType = ...,
+    *,
+    tensor: typing.Literal[True],
+) -> TensorQuadrature: ...
+
+
 def make_quadrature(
     cell: CellType,
     degree: int,
     rule: QuadratureType = QuadratureType.default,
     polyset_type: PolysetType = PolysetType.standard,
-) -> tuple[_npt.ArrayLike, _npt.ArrayLike]:
+    tensor: bool = False,
+) -> typing.Union[tuple[_npt.ArrayLike, _npt.ArrayLike], TensorQuadrature]:
     """Create a quadrature rule.
 
     Args:
@@ -53,11 +140,31 @@ def make_quadrature(
         rule: Quadrature rule.
         polyset_type: Type of polynomial that will be integrated
             exactly.
+        tensor: If ``True``, return the rule as a
+            :class:`TensorQuadrature` that holds the interval rule for
+            each axis. This is only supported for tensor product rules
+            on intervals, quadrilaterals and hexahedra.
 
     Returns:
-        Quadrature points and weights.
+        Quadrature points and weights, or a :class:`TensorQuadrature`
+        if ``tensor`` is ``True``.
     """
-    return _mq(rule, cell, polyset_type, degree)
+    if not tensor:
+        return _mq(rule, cell, polyset_type, degree)
+
+    tdim = {CellType.interval: 1, CellType.quadrilateral: 2, CellType.hexahedron: 3}.get(cell)
+    if tdim is None:
+        raise ValueError(f"Tensor product quadrature is not supported on a {cell.name} cell.")
+    if polyset_type != PolysetType.standard:
+        raise ValueError("Tensor product quadrature is only supported for standard polysets.")
+    if rule == QuadratureType.default:
+        # The default rule on these cells is Gauss-Jacobi
+        rule = QuadratureType.gauss_jacobi
+    if rule not in [QuadratureType.gauss_jacobi, QuadratureType.gll]:
+        raise ValueError(f"{rule.name} quadrature is not a tensor product rule.")
+
+    pts, wts = _mq(rule, CellType.interval, polyset_type, degree)
+    return TensorQuadrature([(_np.asarray(pts), _np.asarray(wts))] * tdim)
 
 
 def gauss_jacobi_rule(
@@ -75,3 +182,104 @@ def gauss_jacobi_rule(
         Quadrature points and weights.
     """
     return _gjr(_np.float64(alpha), npoints)
+
+
+def _facet_orientations(facettype: CellType, points: _npt.NDArray) -> _npt.NDArray:
+    """Apply each rotation and reflection of a facet to points on it.
+
+    The orientation with ``rotations`` rotations and ``reflections``
+    reflections has index ``2 * rotations + reflections``.
+
+    Args:
+        facettype: Cell type of the facet.
+        points: Points on the reference facet.
+
+    Returns:
+        Points for each orientation, shape ``(norientations, npoints, fdim)``.
+    """
+    if facettype == CellType.point:
+        return points[_np.newaxis]
+    elif facettype == CellType.interval:
+        return _np.array([points, 1 - points])
+    elif facettype == CellType.triangle:
+        x, y = points.T
+        rotated = [(x, y), (y, 1 - x - y), (1 - x - y, x)]
+    elif facettype == CellType.quadrilateral:
+        x, y = points.T
+        rotated = [(x, y), (y, 1 - x), (1 - x, 1 - y), (1 - y, x)]
+    else:
+        raise ValueError(f"Unsupported facet type: {facettype.name}")
+    return _np.array([_np.array(p[::-1] if ref else p).T for p in rotated for ref in range(2)])
+
+
+@_functools.lru_cache
+def _make_facet_quadrature(
+    cell: CellType,
+    degree: int,
+    rule: QuadratureType,
+    polyset_type: PolysetType,
+    orientations: bool,
+) -> tuple[_npt.NDArray, _npt.NDArray]:
+    tdim = len(geometry(cell)[0])
+    facettypes = set(subentity_types(cell)[tdim - 1])
+    if len(facettypes) != 1:
+        raise ValueError(f"Facets of a {cell.name} cell do not all have the same type.")
+    facettype = facettypes.pop()
+
+    if facettype == CellType.point:
+        pts, wts = _np.zeros((1, 0)), _np.ones(1)
+    else:
+        q = _mq(rule, facettype, polyset_type, degree)
+        pts, wts = _np.asarray(q[0]), _np.asarray(q[1])
+    pts = _facet_orientations(facettype, pts) if orientations else pts[_np.newaxis]
+
+    x = geometry(cell)
+    jacobians = _np.zeros((2, 1, 0)) if tdim == 1 else facet_jacobians(cell)
+    origins = x[[f[0] for f in topology(cell)[tdim - 1]]]
+    points = origins[:, _np.newaxis, _np.newaxis] + _np.einsum("fij,opj->fopi", jacobians, pts)
+    scales = _np.sqrt(_np.linalg.det(_np.einsum("fji,fjk->fik", jacobians, jacobians)))
+    weights = _np.outer(scales, wts)
+    if not orientations:
+        points = points[:, 0]
+
+    points.setflags(write=False)
+    weights.setflags(write=False)
+    return points, weights
+
+
+def make_facet_quadrature(
+    cell: CellType,
+    degree: int,
+    rule: QuadratureType = QuadratureType.default,
+    polyset_type: PolysetType = PolysetType.standard,
+    orientations: bool = False,
+) -> tuple[_npt.NDArray, _npt.NDArray]:
+    """Create a quadrature rule on every facet of a reference cell.
+
+    A quadrature rule is created on the reference facet and mapped to
+    each facet of the reference cell. The weights are scaled by the
+    size of each facet relative to the reference facet, so that they
+    sum to the volume of the facet. The result is cached and the
+    returned arrays are read-only.
+
+    If ``orientations`` is ``True``, the points are additionally
+    computed for each rotation and reflection of the facet, as needed
+    for integrals over interior facets. The orientation with ``r``
+    rotations and ``s`` reflections has index ``2 * r + s``.
+
+    Args:
+        cell: Cell type. All facets of the cell must have the same type.
+        degree: Maximum polynomial degree that will be integrated
+            exactly.
+        rule: Quadrature rule.
+        polyset_type: Type of polynomial that will be integrated
+            exactly.
+        orientations: If ``True``, compute the points for every facet
+            orientation.
+
+    Returns:
+        Quadrature points, with shape ``(nfacets, npoints, tdim)`` or
+        ``(nfacets, norientations, npoints, tdim)`` if ``orientations``
+        is ``True``, and weights, with shape ``(nfacets, npoints)``.
+    """
+    return _make_facet_quadrature(cell, degree, rule, polyset_type, orientations)
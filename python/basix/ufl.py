@@ -5,9 +5,10 @@
 # SPDX-License-Identifier:    MIT
 """Functions to directly wrap Basix elements in UFL."""
 
-import hashlib as _hashlib
-import itertools as _itertools
+import functools as _functools
+import inspect as _inspect
 import typing as _typing
+import weakref as _weakref
 from abc import abstractmethod as _abstractmethod
 from warnings import warn as _warn
 
@@ -25,6 +26,7 @@ import basix as _basix
 
 __all__ = [
     "element",
+    "elements",
     "enriched_element",
     "custom_element",
     "mixed_element",
@@ -102,6 +104,7 @@ class _ElementBase(_AbstractFiniteElement):
     ):
         """Initialise the element."""
         self._repr = repr
+        self._hash = hash("basix" + repr)
         if cellname == "point":
             cellname = "vertex"
         self._cellname = cellname
@@ -120,7 +123,7 @@ class _ElementBase(_AbstractFiniteElement):
 
     def __hash__(self) -> int:
         """Return a hash."""
-        return hash("basix" + self._repr)
+        return self._hash
 
     def basix_hash(self) -> _typing.Optional[int]:
         """Hash of the Basix element (if this is a standard Basix element).
@@ -239,22 +242,22 @@ class _ElementBase(_AbstractFiniteElement):
 
     @property
     @_abstractmethod
-    def num_entity_dofs(self) -> list[list[int]]:
+    def num_entity_dofs(self) -> _typing.Sequence[_typing.Sequence[int]]:
         """Number of DOFs associated with each entity."""
 
     @property
     @_abstractmethod
-    def entity_dofs(self) -> list[list[list[int]]]:
+    def entity_dofs(self) -> _typing.Sequence[_typing.Sequence[_typing.Sequence[int]]]:
         """DOF numbers associated with each entity."""
 
     @property
     @_abstractmethod
-    def num_entity_closure_dofs(self) -> list[list[int]]:
+    def num_entity_closure_dofs(self) -> _typing.Sequence[_typing.Sequence[int]]:
         """Number of DOFs associated with the closure of each entity."""
 
     @property
     @_abstractmethod
-    def entity_closure_dofs(self) -> list[list[list[int]]]:
+    def entity_closure_dofs(self) -> _typing.Sequence[_typing.Sequence[_typing.Sequence[int]]]:
         """DOF numbers associated with the closure of each entity."""
 
     @property
@@ -437,6 +440,11 @@ class _BasixElement(_ElementBase):
             _ufl_pullback_from_enum(element.map_type),
         )
 
+        if self._is_custom:
+            # The repr of a custom element depends on the exact values of
+            # its data, but custom elements whose data differ by roundoff
+            # compare equal, so hash the Basix element instead
+            self._hash = hash(("basix", element.hash()))
         self._element = element
 
     def __eq__(self, other) -> bool:
@@ -767,20 +775,43 @@ class _MixedElement(_ElementBase):
     def degree(self) -> int:
         return max((e.degree for e in self._sub_elements), default=-1)
 
+    @_functools.cached_property
+    def _tabulate_columns(self) -> _npt.NDArray[np.int64]:
+        """Columns of the sub element tables used by :meth:`tabulate`.
+
+        The sub element tables are flattened to shape ``(number of
+        derivatives, number of points, value size * dim)`` and
+        concatenated, followed by a column of zeros. Entry ``i`` is the
+        column of this that is column ``i`` of the table of this
+        element.
+
+        For a blocked sub element, the flattened table has the value of
+        component ``c`` of DOF ``k`` in column ``c * dim + k``, and
+        component ``c`` of the DOFs ``i, ..., i + block_size - 1`` is
+        only non-zero for DOF ``i + c``. The columns used for these DOFs
+        are the columns of these non-zero values.
+        """
+        widths = [e.reference_value_size * e.dim for e in self._sub_elements]
+        columns = np.full(self.reference_value_size * self.dim, sum(widths), dtype=np.int64)
+        start = 0
+        offset = 0
+        for e, width in zip(self._sub_elements, widths):
+            vs = e.reference_value_size
+            c = np.arange(vs)
+            if e.block_size > 1:
+                c = c * e.dim + c
+            for i in range(0, e.dim, vs):
+                columns[start : start + vs] = offset + i + c
+                start += self.reference_value_size
+            offset += width
+        return columns
+
     def tabulate(self, nderivs: int, points: _npt.NDArray[np.floating]) -> _npt.ArrayLike:
-        tables = []
-        results = [e.tabulate(nderivs, points) for e in self._sub_elements]
-        for deriv_tables in zip(*results):
-            new_table = np.zeros((len(points), self.reference_value_size * self.dim))
-            start = 0
-            for e, t in zip(self._sub_elements, deriv_tables):
-                for i in range(0, e.dim, e.reference_value_size):
-                    new_table[:, start : start + e.reference_value_size] = t[
-                        :, i : i + e.reference_value_size
-                    ]
-                    start += self.reference_value_size
-            tables.append(new_table)
-        return np.asarray(tables, dtype=np.float64)
+        tables = [np.asarray(e.tabulate(nderivs, points)) for e in self._sub_elements]
+        # Flatten the block axes of the tables of blocked sub elements
+        tables = [t.reshape(*t.shape[:2], -1) for t in tables]
+        tables.append(np.zeros((*tables[0].shape[:2], 1), dtype=np.float64))
+        return np.take(np.concatenate(tables, axis=-1), self._tabulate_columns, axis=-1)
 
     def get_component_element(self, flat_component: int) -> tuple[_ElementBase, int, int]:
         sub_dims = [0] + [e.dim for e in self._sub_elements]
@@ -827,47 +858,55 @@ class _MixedElement(_ElementBase):
     def dim(self) -> int:
         return sum(e.dim for e in self._sub_elements)
 
-    @property
-    def num_entity_dofs(self) -> list[list[int]]:
+    def _offset_entity_dofs(
+        self, entity_dofs: list[_typing.Sequence[_typing.Sequence[_typing.Sequence[int]]]]
+    ) -> tuple[tuple[tuple[int, ...], ...], ...]:
+        """Combine the DOFs of each entity of the sub elements.
+
+        Args:
+            entity_dofs: DOF numbers of each entity of each sub element.
+
+        Returns:
+            The DOF numbers of each entity, with the DOFs of each sub
+            element offset by the dimensions of the previous sub
+            elements.
+        """
+        offsets = np.cumsum([0] + [e.dim for e in self._sub_elements])
+        return tuple(
+            tuple(
+                tuple(
+                    int(offset + i)
+                    for offset, dofs in zip(offsets, entity_dofs)
+                    for i in dofs[tdim][entity_n]
+                )
+                for entity_n in range(len(entities))
+            )
+            for tdim, entities in enumerate(entity_dofs[0])
+        )
+
+    @_functools.cached_property
+    def num_entity_dofs(self) -> tuple[tuple[int, ...], ...]:
         data = [e.num_entity_dofs for e in self._sub_elements]
-        return [
-            [sum(d[tdim][entity_n] for d in data) for entity_n, _ in enumerate(entities)]
+        return tuple(
+            tuple(sum(d[tdim][entity_n] for d in data) for entity_n, _ in enumerate(entities))
             for tdim, entities in enumerate(data[0])
-        ]
+        )
 
-    @property
-    def entity_dofs(self) -> list[list[list[int]]]:
-        dofs: list[list[list[int]]] = [
-            [[] for i in entities] for entities in self._sub_elements[0].entity_dofs
-        ]
-        start_dof = 0
-        for e in self._sub_elements:
-            for tdim, entities in enumerate(e.entity_dofs):
-                for entity_n, entity_dofs in enumerate(entities):
-                    dofs[tdim][entity_n] += [start_dof + i for i in entity_dofs]
-            start_dof += e.dim
-        return dofs
+    @_functools.cached_property
+    def entity_dofs(self) -> tuple[tuple[tuple[int, ...], ...], ...]:
+        return self._offset_entity_dofs([e.entity_dofs for e in self._sub_elements])
 
-    @property
-    def num_entity_closure_dofs(self) -> list[list[int]]:
+    @_functools.cached_property
+    def num_entity_closure_dofs(self) -> tuple[tuple[int, ...], ...]:
         data = [e.num_entity_closure_dofs for e in self._sub_elements]
-        return [
-            [sum(d[tdim][entity_n] for d in data) for entity_n, _ in enumerate(entities)]
+        return tuple(
+            tuple(sum(d[tdim][entity_n] for d in data) for entity_n, _ in enumerate(entities))
             for tdim, entities in enumerate(data[0])
-        ]
+        )
 
-    @property
-    def entity_closure_dofs(self) -> list[list[list[int]]]:
-        dofs: list[list[list[int]]] = [
-            [[] for i in entities] for entities in self._sub_elements[0].entity_closure_dofs
-        ]
-        start_dof = 0
-        for e in self._sub_elements:
-            for tdim, entities in enumerate(e.entity_closure_dofs):
-                for entity_n, entity_dofs in enumerate(entities):
-                    dofs[tdim][entity_n] += [start_dof + i for i in entity_dofs]
-            start_dof += e.dim
-        return dofs
+    @_functools.cached_property
+    def entity_closure_dofs(self) -> tuple[tuple[tuple[int, ...], ...], ...]:
+        return self._offset_entity_dofs([e.entity_closure_dofs for e in self._sub_elements])
 
     @property
     def num_global_support_dofs(self) -> int:
@@ -942,6 +981,23 @@ class _MixedElement(_ElementBase):
         return False
 
 
+def _block_diagonal(a: _npt.NDArray, n: int) -> _npt.NDArray[np.float64]:
+    """Place copies of an array on the diagonal of its first two axes.
+
+    Args:
+        a: The array.
+        n: The number of copies.
+
+    Returns:
+        Array with shape ``(n * a.shape[0], n * a.shape[1],
+        *a.shape[2:])``, whose ``i``-th diagonal block is ``a``.
+    """
+    out = np.zeros((n, a.shape[0], n, *a.shape[1:]), dtype=np.float64)
+    b = np.arange(n)
+    out[b, :, b] = a
+    return out.reshape(n * a.shape[0], n * a.shape[1], *a.shape[2:])
+
+
 class _BlockedElement(_ElementBase):
     """Element with a block size that contains multiple copies of a sub element.
 
@@ -1039,24 +1095,40 @@ class _BlockedElement(_ElementBase):
         return self._sub_element.is_quadrature
 
     def tabulate(self, nderivs: int, points: _npt.NDArray[np.floating]) -> _npt.ArrayLike:
-        assert len(self._block_shape) == 1  # TODO: block shape
         assert self.reference_value_size == self._block_size  # TODO: remove this assumption
-        output = []
-        for table in self._sub_element.tabulate(nderivs, points):  # type: ignore
-            # Repeat sub element horizontally
-            assert len(table.shape) == 2  # type: ignore
-            new_table = np.zeros(
-                (table.shape[0], *self._block_shape, self._block_size * table.shape[1])  # type: ignore
-            )
-            for i, j in enumerate(_itertools.product(*[range(s) for s in self._block_shape])):
-                if len(j) == 1:
-                    new_table[:, j[0], i :: self._block_size] = table
-                elif len(j) == 2:
-                    new_table[:, j[0], j[1], i :: self._block_size] = table
-                else:
-                    raise NotImplementedError()
-            output.append(new_table)
-        return np.asarray(output, dtype=np.float64)
+        table = np.asarray(self._sub_element.tabulate(nderivs, points))
+        assert len(table.shape) == 3
+        # Component i of DOF k * block_size + i is the sub element DOF k
+        new_table = np.zeros(
+            (*table.shape[:2], self._block_size, table.shape[2], self._block_size),
+            dtype=np.float64,
+        )
+        b = np.arange(self._block_size)
+        new_table[:, :, b, :, b] = table
+        return new_table.reshape(
+            *table.shape[:2], *self._block_shape, table.shape[2] * self._block_size
+        )
+
+    def tabulate_sub_element(
+        self, nderivs: int, points: _npt.NDArray[np.floating]
+    ) -> tuple[_npt.NDArray[np.floating], int]:
+        """Tabulate the sub element without repeating it for each block.
+
+        The table returned by :meth:`tabulate` is zero apart from
+        copies of the sub element table: the value of ``table`` at
+        ``(d, p, i, k * block_size + i)`` is the value of the sub
+        element table at ``(d, p, k)``, where ``i`` is the index of the
+        flattened block component.
+
+        Args:
+            nderivs: Number of derivatives.
+            points: Points to tabulate at.
+
+        Returns:
+            The sub element table, with shape ``(number of derivatives,
+            number of points, sub element dim)``, and the block size.
+        """
+        return np.asarray(self._sub_element.tabulate(nderivs, points)), self._block_size
 
     def get_component_element(self, flat_component: int) -> tuple[_ElementBase, int, int]:
         return self._sub_element, flat_component, self._block_size
@@ -1172,14 +1244,7 @@ class _BlockedElement(_ElementBase):
 
     @property
     def _wcoeffs(self) -> _npt.ArrayLike:
-        sub_wc = self._sub_element._wcoeffs
-        wcoeffs = np.zeros((sub_wc.shape[0] * self._block_size, sub_wc.shape[1] * self._block_size))  # type: ignore
-        for i in range(self._block_size):
-            wcoeffs[
-                sub_wc.shape[0] * i : sub_wc.shape[0] * (i + 1),  # type: ignore
-                sub_wc.shape[1] * i : sub_wc.shape[1] * (i + 1),  # type: ignore
-            ] = sub_wc
-        return wcoeffs
+        return _block_diagonal(np.asarray(self._sub_element._wcoeffs), self._block_size)
 
     @property
     def _x(self) -> list[list[_npt.ArrayLike]]:
@@ -1187,28 +1252,10 @@ class _BlockedElement(_ElementBase):
 
     @property
     def _M(self) -> list[list[_npt.ArrayLike]]:
-        M = []
-        for M_list in self._sub_element._M:
-            M_row = []
-            for mat in M_list:
-                new_mat = np.zeros(
-                    (
-                        mat.shape[0] * self._block_size,  # type: ignore
-                        mat.shape[1] * self._block_size,  # type: ignore
-                        mat.shape[2],  # type: ignore
-                        mat.shape[3],  # type: ignore
-                    )
-                )
-                for i in range(self._block_size):
-                    new_mat[
-                        i * mat.shape[0] : (i + 1) * mat.shape[0],  # type: ignore
-                        i * mat.shape[1] : (i + 1) * mat.shape[1],  # type: ignore
-                        :,
-                        :,
-                    ] = mat
-                M_row.append(new_mat)
-            M.append(M_row)
-        return M  # type: ignore
+        return [
+            [_block_diagonal(np.asarray(mat), self._block_size) for mat in M_list]
+            for M_list in self._sub_element._M
+        ]
 
     @property
     def has_tensor_product_factorisation(self) -> bool:
@@ -1534,28 +1581,67 @@ def _compute_signature(element: _basix.finite_element.FiniteElement) -> str:
         f"{element.discontinuous}, {element.embedded_subdegree}, {element.embedded_superdegree}, "
         f"{element.dtype}, {element.dof_ordering}"
     )
-    data = ",".join([f"{i}" for row in element.wcoeffs for i in row])  # type: ignore
-    data += "__"
-    for entity in element.x:
-        for points in entity:
-            data += ",".join([f"{i}" for p in points for i in p])  # type: ignore
-            data += "_"
-    data += "__"
-
-    for entity in element.M:
-        for matrices in entity:
-            data += ",".join([f"{i}" for mat in matrices for row in mat for i in row])  # type: ignore
-            data += "_"
-    data += "__"
-
-    for mat in element.entity_transformations().values():
-        data += ",".join([f"{i}" for row in mat for i in row])
-        data += "__"
-    signature += _hashlib.sha1(data.encode("utf-8")).hexdigest()
+    signature += f"{element.content_hash():016x}"
 
     return signature
 
 
+# Elements created by the functions in this module, so that calling a
+# function again with the same arguments returns the same element. An
+# element is removed when there are no other references to it.
+_element_cache: _weakref.WeakValueDictionary[tuple, _ElementBase] = _weakref.WeakValueDictionary()
+
+
+def _intern(key: tuple, e: _ElementBase) -> _ElementBase:
+    """Add an element to the cache.
+
+    Args:
+        key: The arguments that the element was created from.
+        e: The element.
+
+    Returns:
+        The element in the cache for this key. This is ``e``, unless
+        an element with the same key has already been added.
+    """
+    return _element_cache.setdefault(key, e)
+
+
+def _array_key(a: _typing.Optional[_npt.ArrayLike]) -> _typing.Optional[tuple]:
+    """Hashable key for the values of an array."""
+    if a is None:
+        return None
+    a = np.asarray(a)
+    return (a.dtype.str, a.shape, a.tobytes())
+
+
+def _element_key(
+    family: _basix.ElementFamily,
+    cell: _basix.CellType,
+    degree: int,
+    lagrange_variant: _basix.LagrangeVariant,
+    dpc_variant: _basix.DPCVariant,
+    discontinuous: bool,
+    dof_ordering: _typing.Optional[list[int]],
+    dtype: _typing.Optional[_npt.DTypeLike],
+    shape: _typing.Optional[tuple[int, ...]],
+    symmetry: _typing.Optional[bool],
+) -> tuple:
+    """Key of an element created by :func:`element` in the element cache."""
+    return (
+        "element",
+        family,
+        cell,
+        degree,
+        lagrange_variant,
+        dpc_variant,
+        discontinuous,
+        tuple(dof_ordering) if dof_ordering is not None else (),
+        np.dtype(dtype),
+        tuple(shape) if shape is not None else None,
+        symmetry,
+    )
+
+
 def element(
     family: _typing.Union[_basix.ElementFamily, str],
     cell: _typing.Union[_basix.CellType, str],
@@ -1586,8 +1672,61 @@ def element(
         dtype: Floating point data type.
 
     Returns:
-        A finite element.
+        A finite element. Calling this function again with the same
+        arguments returns the same element.
+
+    """
+    family, cell, lagrange_variant, dpc_variant, discontinuous = _element_args(
+        family, cell, lagrange_variant, dpc_variant, discontinuous
+    )
+    args = (family, cell, degree, lagrange_variant, dpc_variant, discontinuous, dof_ordering, dtype)
+    key = _element_key(*args, shape, symmetry)
+    e = _element_cache.get(key)
+    if e is None:
+        scalar_key = _element_key(*args, None, None)
+        scalar_e = _element_cache.get(scalar_key)
+        if scalar_e is None:
+            scalar_e = _intern(
+                scalar_key,
+                _BasixElement(
+                    _basix.create_element(
+                        family,
+                        cell,
+                        degree,
+                        lagrange_variant,
+                        dpc_variant,
+                        discontinuous,
+                        dof_ordering=dof_ordering,
+                        dtype=dtype,
+                    )
+                ),
+            )
+        e = _intern(key, _wrap_created_element(scalar_e, shape, symmetry))
+    return e
+
 
+def _element_args(
+    family: _typing.Union[_basix.ElementFamily, str],
+    cell: _typing.Union[_basix.CellType, str],
+    lagrange_variant: _basix.LagrangeVariant,
+    dpc_variant: _basix.DPCVariant,
+    discontinuous: bool,
+    stacklevel: int = 3,
+) -> tuple[_basix.ElementFamily, _basix.CellType, _basix.LagrangeVariant, _basix.DPCVariant, bool]:
+    """Convert string arguments of :func:`element` and choose default variants.
+
+    Args:
+        family: Element family/type.
+        cell: Element cell type.
+        lagrange_variant: Variant of Lagrange to be used.
+        dpc_variant: Variant of DPC to be used.
+        discontinuous: If ``True``, the discontinuous version of the
+            element is created.
+        stacklevel: Stack level of deprecation warnings.
+
+    Returns:
+        The family, cell type, Lagrange variant, DPC variant and
+        discontinuity of the element.
     """
     # Conversion of string arguments to types
     if isinstance(cell, str):
@@ -1603,7 +1742,7 @@ def element(
             _warn(
                 '"CG" element name is deprecated. Consider using "Lagrange" or "P" instead',
                 DeprecationWarning,
-                stacklevel=2,
+                stacklevel=stacklevel,
             )
             family = "P"
             discontinuous = False
@@ -1628,19 +1767,16 @@ def element(
         elif family == EF.DPC:
             dpc_variant = _basix.DPCVariant.diagonal_gll
 
-    e = _basix.create_element(
-        family,
-        cell,
-        degree,
-        lagrange_variant,
-        dpc_variant,
-        discontinuous,
-        dof_ordering=dof_ordering,
-        dtype=dtype,
-    )
-    ufl_e = _BasixElement(e)
+    return family, cell, lagrange_variant, dpc_variant, discontinuous
 
-    if shape is None or shape == tuple(e.value_shape):
+
+def _wrap_created_element(
+    ufl_e: _ElementBase,
+    shape: _typing.Optional[tuple[int, ...]],
+    symmetry: _typing.Optional[bool],
+) -> _ElementBase:
+    """Create the element with a value shape from an element created by :func:`element`."""
+    if shape is None or tuple(shape) == ufl_e.reference_value_shape:
         if symmetry is not None:
             raise ValueError("Cannot pass a symmetry argument to this element.")
         return ufl_e
@@ -1648,20 +1784,123 @@ def element(
         return blocked_element(ufl_e, shape=shape, symmetry=symmetry)
 
 
+def elements(
+    specs: _typing.Sequence[_typing.Union[tuple, dict[str, _typing.Any]]],
+    max_workers: _typing.Optional[int] = None,
+    dtype: _typing.Optional[_npt.DTypeLike] = None,
+) -> list[_ElementBase]:
+    """Create a list of UFL compatible elements in parallel.
+
+    The Basix elements are created with
+    :func:`basix.create_elements`, so they are created on multiple
+    threads and each distinct element is only created once.
+
+    Args:
+        specs: The arguments of :func:`element` for each element, as a
+            tuple of positional arguments or a dict of keyword
+            arguments. ``dtype`` cannot be given.
+        max_workers: The maximum number of threads to use. Must be at
+            least 1. If not set, the number of CPUs is used.
+        dtype: Floating point data type.
+
+    Returns:
+        The finite elements, in the same order as ``specs``. Elements
+        that have already been created by :func:`element` or
+        :func:`elements` are not created again.
+    """
+    signature = _inspect.signature(element)
+    args = []
+    for spec in specs:
+        bound = signature.bind(*spec) if isinstance(spec, tuple) else signature.bind(**spec)
+        if "dtype" in bound.arguments:
+            raise ValueError("The specs of elements cannot include dtype.")
+        bound.apply_defaults()
+        args.append(bound.arguments)
+
+    basix_specs = []
+    keys = []
+    for a in args:
+        family, cell, lagrange_variant, dpc_variant, discontinuous = _element_args(
+            a["family"], a["cell"], a["lagrange_variant"], a["dpc_variant"], a["discontinuous"]
+        )
+        spec = (family, cell, a["degree"], lagrange_variant, dpc_variant, discontinuous)
+        basix_specs.append((*spec, a["dof_ordering"]))
+        keys.append(
+            (
+                _element_key(*spec, a["dof_ordering"], dtype, None, None),
+                _element_key(*spec, a["dof_ordering"], dtype, a["shape"], a["symmetry"]),
+            )
+        )
+
+    # Only create the elements that are not in the cache
+    out = [_element_cache.get(key) for _, key in keys]
+    scalar_out = [_element_cache.get(scalar_key) for scalar_key, _ in keys]
+    missing = [i for i, (e, s) in enumerate(zip(out, scalar_out)) if e is None and s is None]
+    created = _basix.create_elements(
+        [basix_specs[i] for i in missing],
+        max_workers,
+        dtype=np.float64 if dtype is None else dtype,
+    )
+    for i, e in zip(missing, created):
+        scalar_out[i] = _intern(keys[i][0], _BasixElement(e))
+    for i, (a, (_, key)) in enumerate(zip(args, keys)):
+        if out[i] is None:
+            scalar_e = scalar_out[i]
+            assert scalar_e is not None
+            out[i] = _intern(key, _wrap_created_element(scalar_e, a["shape"], a["symmetry"]))
+    return out  # type: ignore
+
+
+def _build_elements(
+    elements_or_specs: _typing.Sequence[_typing.Union[_ElementBase, tuple, dict[str, _typing.Any]]],
+) -> list[_ElementBase]:
+    """Create the elements given as specs in a list of elements.
+
+    Args:
+        elements_or_specs: Elements, or the arguments of :func:`element`
+            as a tuple or dict.
+
+    Returns:
+        The elements, with all specs replaced by elements created in
+        parallel by :func:`elements`.
+    """
+    out = list(elements_or_specs)
+    spec_indices = [i for i, e in enumerate(out) if isinstance(e, (tuple, dict))]
+    if len(spec_indices) > 0:
+        for i, e in zip(spec_indices, elements([out[i] for i in spec_indices])):  # type: ignore
+            out[i] = e
+    return out  # type: ignore
+
+
 def enriched_element(
-    elements: list[_ElementBase],
+    elements: list[_typing.Union[_ElementBase, tuple, dict[str, _typing.Any]]],
     map_type: _typing.Optional[_basix.MapType] = None,
 ) -> _ElementBase:
     """Create an UFL compatible enriched element from a list of elements.
 
     Args:
-        elements: The list of elements
+        elements: The list of elements. Elements can also be given as
+            the arguments of :func:`element` in a tuple or dict; these
+            are created in parallel using :func:`elements`.
         map_type: The map type for the enriched element.
 
     Returns:
-        An enriched finite element.
+        An enriched finite element. Calling this function again with
+        the same arguments returns the same element.
 
     """
+    built = _build_elements(elements)
+    key = ("enriched", tuple(built), map_type)
+    e = _element_cache.get(key)
+    if e is None:
+        e = _intern(key, _enriched_element(built, map_type))
+    return e
+
+
+def _enriched_element(
+    elements: list[_ElementBase], map_type: _typing.Optional[_basix.MapType]
+) -> _ElementBase:
+    """Create an enriched element from a list of created elements."""
     ct = elements[0].cell_type
     ptype = elements[0].polyset_type
     vshape = elements[0].reference_value_shape
@@ -1807,16 +2046,26 @@ def custom_element(
     return _BasixElement(e)
 
 
-def mixed_element(elements: list[_ElementBase]) -> _ElementBase:
+def mixed_element(
+    elements: list[_typing.Union[_ElementBase, tuple, dict[str, _typing.Any]]],
+) -> _ElementBase:
     """Create a UFL compatible mixed element from a list of elements.
 
     Args:
-        elements: The list of elements
+        elements: The list of elements. Elements can also be given as
+            the arguments of :func:`element` in a tuple or dict; these
+            are created in parallel using :func:`elements`.
 
     Returns:
-        A mixed finite element.
+        A mixed finite element. Calling this function again with the
+        same arguments returns the same element.
     """
-    return _MixedElement(elements)
+    built = _build_elements(elements)
+    key = ("mixed", tuple(built))
+    e = _element_cache.get(key)
+    if e is None:
+        e = _intern(key, _MixedElement(built))
+    return e
 
 
 def quadrature_element(
@@ -1848,11 +2097,28 @@ def quadrature_element(
         dtype: Data type of quadrature points and weights
 
     Returns:
-        A 'quadrature' finite element.
+        A 'quadrature' finite element. Calling this function again with
+        the same arguments returns the same element.
     """
     if isinstance(cell, str):
         cell = _basix.CellType[cell]
 
+    key = (
+        "quadrature",
+        cell,
+        tuple(value_shape),
+        scheme,
+        degree,
+        _array_key(points),
+        _array_key(weights),
+        pullback,
+        symmetry,
+        np.dtype(dtype),
+    )
+    cached = _element_cache.get(key)
+    if cached is not None:
+        return cached
+
     if points is None:
         assert weights is None
         assert degree is not None
@@ -1870,9 +2136,9 @@ def quadrature_element(
     if value_shape == ():
         if symmetry is not None:
             raise ValueError("Cannot pass a symmetry argument to this element.")
-        return e
+        return _intern(key, e)
     else:
-        return blocked_element(e, shape=value_shape, symmetry=symmetry)
+        return _intern(key, blocked_element(e, shape=value_shape, symmetry=symmetry))
 
 
 def real_element(
@@ -1909,12 +2175,17 @@ def blocked_element(
             rank 2 elements only.
 
     Returns:
-        A blocked finite element.
+        A blocked finite element. Calling this function again with the
+        same arguments returns the same element.
     """
     if len(sub_element.reference_value_shape) != 0:
         raise ValueError("Cannot create a blocked element containing a non-scalar element.")
 
-    return _BlockedElement(sub_element, shape=shape, symmetry=symmetry)
+    key = ("blocked", sub_element, tuple(shape), symmetry)
+    e = _element_cache.get(key)
+    if e is None:
+        e = _intern(key, _BlockedElement(sub_element, shape=shape, symmetry=symmetry))
+    return e
 
 
 def wrap_element(element: _basix.finite_element.FiniteElement) -> _ElementBase:
@@ -0,0 +1,281 @@
+# Copyright (C) 2026 The FEniCS Project
+#
+# This file is part of Basix (https://www.fenicsproject.org)
+#
+# SPDX-License-Identifier:    MIT
+"""Functions for visualising high-order functions on lattices.
+
+A high-order function on a mesh can be visualised by evaluating it at
+the points of a lattice on each cell, and splitting each cell into the
+sub-cells of the lattice. This module creates the lattice points and
+sub-cells, evaluates functions at the points for chunks of cells at a
+time, and writes the result to a file without holding the values on
+all cells in memory.
+"""
+
+import typing
+import zipfile
+
+import numpy as np
+import numpy.typing as npt
+
+from basix.cell import CellType
+from basix.finite_element import FiniteElement
+from basix.lattice import LatticeSimplexMethod, LatticeType, create_lattice
+
+__all__ = ["create_lattice_mesh", "interpolate", "write"]
+
+
+def _simplex_indices(n: int, tdim: int) -> npt.NDArray:
+    """Index of each point of a simplex lattice.
+
+    Args:
+        n: Lattice size.
+        tdim: Topological dimension.
+
+    Returns:
+        Array of shape ``(n + 1,) * tdim`` holding the index of the
+        point with multi-index ``(i, j, ...)``, or -1 if there is no
+        such point.
+    """
+    idx = -np.ones((n + 1,) * tdim, dtype=np.int64)
+    c = 0
+    for m in np.ndindex(*(n + 1,) * tdim):
+        # The points are ordered with the first index varying fastest
+        m = m[::-1]
+        if sum(m) <= n:
+            idx[m] = c
+            c += 1
+    return idx
+
+
+def _triangle_cells(n: int, idx: npt.NDArray) -> npt.NDArray:
+    """Sub-triangles of a triangle lattice."""
+    i, j = np.nonzero(np.add.outer(np.arange(n + 1), np.arange(n + 1)) < n)
+    up = np.stack([idx[i, j], idx[i + 1, j], idx[i, j + 1]], axis=1)
+    i, j = np.nonzero(np.add.outer(np.arange(n + 1), np.arange(n + 1)) < n - 1)
+    down = np.stack([idx[i + 1, j], idx[i + 1, j + 1], idx[i, j + 1]], axis=1)
+    return np.concatenate([up, down])
+
+
+def _tetrahedron_cells(n: int, idx: npt.NDArray) -> npt.NDArray:
+    """Sub-tetrahedra of a tetrahedron lattice.
+
+    The lattice is split into upward tetrahedra, octahedra (each split
+    into four tetrahedra) and downward tetrahedra.
+    """
+    r = np.arange(n + 1)
+    s = r[:, None, None] + r[None, :, None] + r[None, None, :]
+    cells = []
+    i, j, k = np.nonzero(s < n)
+    cells.append([idx[i, j, k], idx[i + 1, j, k], idx[i, j + 1, k], idx[i, j, k + 1]])
+    i, j, k = np.nonzero(s < n - 1)
+    a, b = idx[i + 1, j, k], idx[i, j + 1, k + 1]
+    ring = [idx[i, j + 1, k], idx[i + 1, j + 1, k], idx[i + 1, j, k + 1], idx[i, j, k + 1]]
+    for c in range(4):
+        cells.append([a, b, ring[(c + 1) % 4], ring[c]])
+    i, j, k = np.nonzero(s < n - 2)
+    cells.append(
+        [idx[i + 1, j + 1, k], idx[i, j + 1, k + 1], idx[i + 1, j, k + 1], idx[i + 1, j + 1, k + 1]]
+    )
+    return np.concatenate([np.stack(c, axis=1) for c in cells])
+
+
+def _tensor_cells(n: int, tdim: int) -> npt.NDArray:
+    """Sub-cells of a quadrilateral or hexahedron lattice."""
+    idx = np.arange((n + 1) ** tdim).reshape((n + 1,) * tdim).T
+    corners = [np.array(c) for c in np.ndindex(*(2,) * tdim)]
+    origin = np.array(list(np.ndindex(*(n,) * tdim))).T
+    return np.stack([idx[tuple(origin + c[::-1, None])] for c in corners], axis=1)
+
+
+def _pyramid_cells(n: int) -> dict[CellType, npt.NDArray]:
+    """Sub-cells of a pyramid lattice.
+
+    Between each pair of layers of the lattice, the interior columns
+    are hexahedra, the columns on the two sloping faces are prisms, and
+    the column on the edge between them is a pyramid.
+    """
+    idx = -np.ones((n + 1,) * 3, dtype=np.int64)
+    c = 0
+    for k in range(n + 1):
+        for j in range(n + 1 - k):
+            for i in range(n + 1 - k):
+                idx[i, j, k] = c
+                c += 1
+
+    cells: dict[CellType, list[list[int]]] = {
+        CellType.hexahedron: [],
+        CellType.prism: [],
+        CellType.pyramid: [],
+    }
+    for k in range(n):
+        m = n - k - 1
+        for j in range(m + 1):
+            for i in range(m + 1):
+                v = [idx[i + a, j + b, k] for b in range(2) for a in range(2)]
+                if i < m and j < m:
+                    top = [idx[i + a, j + b, k + 1] for b in range(2) for a in range(2)]
+                    cells[CellType.hexahedron].append(v + top)
+                elif i < m:
+                    cells[CellType.prism].append(
+                        [v[0], v[2], idx[i, j, k + 1], v[1], v[3], idx[i + 1, j, k + 1]]
+                    )
+                elif j < m:
+                    cells[CellType.prism].append(
+                        [v[0], idx[i, j, k + 1], v[1], v[2], idx[i, j + 1, k + 1], v[3]]
+                    )
+                else:
+                    cells[CellType.pyramid].append(v + [idx[i, j, k + 1]])
+
+    return {cell: np.array(c, dtype=np.int64) for cell, c in cells.items() if len(c) > 0}
+
+
+def create_lattice_mesh(
+    celltype: CellType,
+    n: int,
+    ltype: LatticeType = LatticeType.equispaced,
+    method: LatticeSimplexMethod = LatticeSimplexMethod.none,
+) -> tuple[npt.NDArray, dict[CellType, npt.NDArray]]:
+    """Create the points of a lattice and the sub-cells that they form.
+
+    The points are the same as those returned by
+    :func:`basix.create_lattice` with ``exterior=True``. The vertices
+    of each sub-cell are ordered in the same way as the vertices of the
+    reference cell. The sub-cells of a pyramid are hexahedra, prisms
+    and pyramids; the sub-cells of all other cells have the same type
+    as the cell.
+
+    Args:
+        celltype: Cell type.
+        n: The size in each direction. There will be ``n+1`` points
+            along each edge of the cell.
+        ltype: Lattice type.
+        method: The simplex method used to generate points on simplices.
+
+    Returns:
+        Lattice points, with shape ``(npoints, tdim)``, and the vertices
+        of the sub-cells of each type.
+    """
+    if n < 1:
+        raise ValueError("Lattice size must be at least 1.")
+
+    points = np.asarray(create_lattice(celltype, n, ltype, True, method))
+    cells: dict[CellType, npt.NDArray]
+    if celltype == CellType.interval:
+        cells = {celltype: np.stack([np.arange(n), np.arange(1, n + 1)], axis=1)}
+    elif celltype == CellType.triangle:
+        cells = {celltype: _triangle_cells(n, _simplex_indices(n, 2))}
+    elif celltype == CellType.tetrahedron:
+        cells = {celltype: _tetrahedron_cells(n, _simplex_indices(n, 3))}
+    elif celltype == CellType.quadrilateral:
+        cells = {celltype: _tensor_cells(n, 2)}
+    elif celltype == CellType.hexahedron:
+        cells = {celltype: _tensor_cells(n, 3)}
+    elif celltype == CellType.prism:
+        tri = _triangle_cells(n, _simplex_indices(n, 2))
+        ntri = (n + 1) * (n + 2) // 2
+        layers = ntri * np.arange(n)[:, None, None]
+        cells = {
+            celltype: np.concatenate([tri + layers, tri + layers + ntri], axis=2).reshape(-1, 6)
+        }
+    elif celltype == CellType.pyramid:
+        cells = _pyramid_cells(n)
+    else:
+        raise ValueError(f"Unsupported cell type: {celltype.name}")
+
+    return points, {cell: c.astype(np.int64) for cell, c in cells.items()}
+
+
+def interpolate(
+    element: FiniteElement,
+    n: int,
+    dofs: typing.Iterable[npt.NDArray],
+    ltype: LatticeType = LatticeType.equispaced,
+    method: LatticeSimplexMethod = LatticeSimplexMethod.none,
+) -> typing.Iterator[npt.NDArray]:
+    """Evaluate functions at the points of a lattice, a chunk of cells at a time.
+
+    The basis functions of the element are tabulated at the lattice
+    points once. Each chunk of degree-of-freedom values is then mapped
+    to the values at the lattice points as the chunk is consumed, so
+    only one chunk of values is held in memory at a time.
+
+    The values are the values on the reference cell: no push forward
+    is applied, and the degree-of-freedom values must have had any
+    degree-of-freedom transformations already applied.
+
+    Args:
+        element: Finite element.
+        n: Lattice size, as passed to :func:`create_lattice_mesh`.
+        dofs: Chunks of degree-of-freedom values, each with shape
+            ``(ncells, element.dim)``.
+        ltype: Lattice type.
+        method: The simplex method used to generate points on simplices.
+
+    Returns:
+        Iterator over the values at the lattice points for each chunk,
+        each with shape ``(ncells, npoints, element.value_size)``.
+    """
+    points = np.asarray(create_lattice(element.cell_type, n, ltype, True, method))
+    table = np.asarray(element.tabulate(0, points.astype(element.dtype)))[0]
+    table = np.ascontiguousarray(table.transpose(1, 0, 2)).reshape(element.dim, -1)
+    for chunk in dofs:
+        chunk = np.asarray(chunk)
+        yield (chunk @ table).reshape(chunk.shape[0], points.shape[0], -1)
+
+
+def _write_npy(zf: zipfile.ZipFile, name: str, array: npt.NDArray) -> None:
+    """Write an array to a zip file in the ``.npy`` format."""
+    with zf.open(f"{name}.npy", "w", force_zip64=True) as f:
+        np.lib.format.write_array(f, np.ascontiguousarray(array), allow_pickle=False)
+
+
+def write(
+    filename: str,
+    points: npt.NDArray,
+    cells: dict[CellType, npt.NDArray],
+    values: typing.Iterable[npt.NDArray],
+    ncells: int,
+) -> None:
+    """Write lattice points, sub-cells and values to a file.
+
+    The data is written to an uncompressed ``.npz`` file that can be
+    read with :func:`numpy.load`. It contains the arrays ``points``,
+    ``cells_<type>`` for each sub-cell type and ``values``, with shape
+    ``(ncells, npoints, value_size)``. The values are written one chunk
+    at a time, so they can be streamed from :func:`interpolate` without
+    holding the values on all cells in memory.
+
+    Args:
+        filename: Name of the file.
+        points: Lattice points.
+        cells: Vertices of the sub-cells of each type.
+        values: Chunks of values at the lattice points, each with shape
+            ``(ncells, npoints, value_size)``.
+        ncells: Total number of cells in all chunks.
+    """
+    with zipfile.ZipFile(filename, "w", zipfile.ZIP_STORED, allowZip64=True) as zf:
+        _write_npy(zf, "points", points)
+        for cell, c in cells.items():
+            _write_npy(zf, f"cells_{cell.name}", c)
+
+        with zf.open("values.npy", "w", force_zip64=True) as f:
+            count = 0
+            for chunk in values:
+                chunk = np.ascontiguousarray(chunk)
+                if count == 0:
+                    header = {
+                        "descr": np.lib.format.dtype_to_descr(chunk.dtype),
+                        "fortran_order": False,
+                        "shape": (ncells,) + chunk.shape[1:],
+                    }
+                    np.lib.format.write_array_header_1_0(f, header)
+                count += chunk.shape[0]
+                if count > ncells:
+                    raise ValueError(f"More than {ncells} cells of values were given.")
+                f.write(chunk.tobytes())
+            if count == 0:
+                raise ValueError("No values were given.")
+            if count != ncells:
+                raise ValueError(f"{count} cells of values were given, but {ncells} expected.")
@@ -3,6 +3,7 @@
 // SPDX-License-Identifier:    MIT
 
 #include <basix/cell.h>
+#include <basix/dof-transformations.h>
 #include <basix/element-families.h>
 #include <basix/finite-element.h>
 #include <basix/indexing.h>
@@ -17,6 +18,8 @@
 #include <memory>
 #include <nanobind/nanobind.h>
 #include <nanobind/ndarray.h>
+#include <nanobind/stl/array.h>
+#include <nanobind/stl/map.h>
 #include <nanobind/stl/pair.h>
 #include <nanobind/stl/string.h>
 #include <nanobind/stl/tuple.h>
@@ -97,6 +100,7 @@ void declare_float(nb::module_& m, const std::string& type)
            })
       .def("__eq__", &FiniteElement<T>::operator==, nb::sig("def __eq__(self, arg: object, /) -> bool"))
       .def("hash", &FiniteElement<T>::hash)
+      .def("content_hash", &FiniteElement<T>::content_hash)
       .def("permute_subentity_closure",
            [](const FiniteElement<T>& self,
               const nb::ndarray<std::int32_t, nb::ndim<1>, nb::c_contig>& d,
@@ -163,6 +167,48 @@ void declare_float(nb::module_& m, const std::string& type)
                                       K.shape(2)));
              return as_nbarrayp(std::move(U));
            })
+      .def("interpolate",
+           [](const FiniteElement<T>& self,
+              nb::ndarray<const T, nb::ndim<2>, nb::c_contig> values)
+           {
+             const std::size_t dim = self.dim();
+             const std::size_t n = values.shape(1);
+             std::vector<T> c(dim * n);
+             self.interpolate(
+                 mdspan_t<const T, 2>(values.data(), values.shape(0), n),
+                 mdspan_t<T, 2>(c.data(), dim, n));
+             return as_nbarray(std::move(c), {dim, n});
+           })
+      .def(
+          "interpolate_cells",
+          [](const FiniteElement<T>& self,
+             nb::ndarray<const T, nb::ndim<3>, nb::c_contig> u,
+             nb::ndarray<const T, nb::ndim<3>, nb::c_contig> J,
+             nb::ndarray<const T, nb::ndim<1>, nb::c_contig> detJ,
+             nb::ndarray<const T, nb::ndim<3>, nb::c_contig> K,
+             nb::ndarray<const std::uint32_t, nb::ndim<1>, nb::c_contig>
+                 cell_info,
+             int num_threads)
+          {
+            const std::size_t ncells = u.shape(0);
+            const std::size_t dim = self.dim();
+            std::vector<T> c(ncells * dim);
+            {
+              nb::gil_scoped_release release;
+              self.interpolate_cells(
+                  mdspan_t<const T, 3>(u.data(), u.shape(0), u.shape(1),
+                                       u.shape(2)),
+                  mdspan_t<const T, 3>(J.data(), J.shape(0), J.shape(1),
+                                       J.shape(2)),
+                  std::span<const T>(detJ.data(), detJ.shape(0)),
+                  mdspan_t<const T, 3>(K.data(), K.shape(0), K.shape(1),
+                                       K.shape(2)),
+                  std::span<const std::uint32_t>(cell_info.data(),
+                                                 cell_info.shape(0)),
+                  mdspan_t<T, 2>(c.data(), ncells, dim), num_threads);
+            }
+            return as_nbarray(std::move(c), {ncells, dim});
+          })
       .def("T_apply", [](const FiniteElement<T>& self,
                          nb::ndarray<T, nb::ndim<1>, nb::c_contig> u, int n,
                          std::uint32_t cell_info)
@@ -188,6 +234,23 @@ void declare_float(nb::module_& m, const std::string& type)
                t[cell_type_to_str(key).c_str()] = as_nbarrayp(std::move(data));
              return t;
            })
+      .def("precompute_transformations",
+           &FiniteElement<T>::precompute_transformations)
+      .def("slim", &FiniteElement<T>::slim)
+      .def("memory_usage", &FiniteElement<T>::memory_usage)
+      .def_prop_ro("is_slim", &FiniteElement<T>::is_slim)
+      .def("cast",
+           [](const FiniteElement<T>& self, char dtype)
+               -> std::variant<FiniteElement<float>, FiniteElement<double>>
+           {
+             if (dtype == 'd')
+               return self.template cast<double>();
+             else if (dtype == 'f')
+               return self.template cast<float>();
+             else
+               throw std::runtime_error("Unsupported finite element dtype.");
+           })
+      .def("discontinuous_element", &FiniteElement<T>::discontinuous_element)
       .def("get_tensor_product_representation", [](const FiniteElement<T>& self)
            { return self.get_tensor_product_representation(); })
       .def_prop_ro("degree", &FiniteElement<T>::degree)
@@ -268,6 +331,8 @@ void declare_float(nb::module_& m, const std::string& type)
                 P.data(), shape.size(), shape.data(), nb::handle());
           },
           nb::rv_policy::reference_internal)
+      .def_prop_ro("interpolation_blocks",
+                   &FiniteElement<T>::interpolation_blocks)
       .def_prop_ro(
           "dual_matrix",
           [](const FiniteElement<T>& self)
@@ -510,7 +575,8 @@ NB_MODULE(_basixcpp, m)
       .value("default", quadrature::type::Default)
       .value("gauss_jacobi", quadrature::type::gauss_jacobi)
       .value("gll", quadrature::type::gll)
-      .value("xiao_gimbutas", quadrature::type::xiao_gimbutas);
+      .value("xiao_gimbutas", quadrature::type::xiao_gimbutas)
+      .value("symmetric", quadrature::type::symmetric);
 
   nb::enum_<cell::type>(m, "CellType", nb::is_arithmetic(), "Cell type.")
       .value("point", cell::type::point)
@@ -614,6 +680,25 @@ NB_MODULE(_basixcpp, m)
             throw std::runtime_error("Unsupported finite element dtype.");
         });
 
+  m.def("create_elements",
+        [](const std::vector<std::tuple<
+               element::family, cell::type, int, element::lagrange_variant,
+               element::dpc_variant, bool, std::vector<int>>>& specs,
+           int num_threads,
+           char dtype) -> std::variant<std::vector<FiniteElement<float>>,
+                                       std::vector<FiniteElement<double>>>
+        {
+          nb::gil_scoped_release release;
+          if (dtype == 'd')
+            return basix::create_elements<double>(specs, num_threads);
+          else if (dtype == 'f')
+            return basix::create_elements<float>(specs, num_threads);
+          else
+            throw std::runtime_error("Unsupported finite element dtype.");
+        });
+  m.def("entity_transformations_cache_hits",
+        &doftransforms::entity_transformations_cache_hits);
+
   m.def("create_tp_element",
         [](element::family family_name, cell::type cell, int degree,
            element::lagrange_variant lagrange_variant,
@@ -2,6 +2,7 @@
 # FEniCS Project
 # SPDX-License-Identifier: MIT
 
+import numpy as np
 import pytest
 
 import basix
@@ -81,3 +82,68 @@ def test_create_high_degree_lagrange():
     basix.create_element(
         basix.ElementFamily.P, basix.CellType.hexahedron, 7, basix.LagrangeVariant.gll_isaac
     )
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_create_elements(dtype):
+    specs = [
+        (basix.ElementFamily.P, basix.CellType.tetrahedron, 3, basix.LagrangeVariant.gll_warped),
+        {
+            "family": basix.ElementFamily.N1E,
+            "celltype": basix.CellType.triangle,
+            "degree": 2,
+            "lagrange_variant": basix.LagrangeVariant.legendre,
+        },
+        (basix.ElementFamily.P, basix.CellType.tetrahedron, 3, basix.LagrangeVariant.gll_warped),
+        {
+            "family": basix.ElementFamily.P,
+            "celltype": basix.CellType.triangle,
+            "degree": 1,
+            "discontinuous": True,
+        },
+        (basix.ElementFamily.P, basix.CellType.triangle, 1),
+    ]
+    created = basix.create_elements(specs, max_workers=2, dtype=dtype)
+    assert len(created) == len(specs)
+    for e, spec in zip(created, specs):
+        if isinstance(spec, dict):
+            assert e == basix.create_element(**spec, dtype=dtype)
+        else:
+            assert e == basix.create_element(*spec, dtype=dtype)
+        assert e.dtype == dtype
+    assert created[0] is created[2]
+    assert created[3] != created[4]
+    assert created[3].entity_dofs == basix.create_element(**specs[3]).entity_dofs
+
+
+def test_create_elements_errors():
+    with pytest.raises(RuntimeError):
+        basix.create_elements(
+            [
+                (basix.ElementFamily.P, basix.CellType.triangle, 1),
+                (basix.ElementFamily.P, basix.CellType.triangle, 4),
+            ]
+        )
+    with pytest.raises(ValueError):
+        basix.create_elements(
+            [
+                {
+                    "family": basix.ElementFamily.P,
+                    "celltype": basix.CellType.triangle,
+                    "degree": 1,
+                    "dtype": np.float32,
+                }
+            ]
+        )
+    assert basix.create_elements([]) == []
+    for max_workers in [0, -1]:
+        with pytest.raises(RuntimeError):
+            basix.create_elements(
+                [(basix.ElementFamily.P, basix.CellType.triangle, 1)], max_workers=max_workers
+            )
+
+
+def test_create_elements_many_workers():
+    specs = [(basix.ElementFamily.P, basix.CellType.triangle, k) for k in range(1, 3)]
+    created = basix.create_elements(specs, max_workers=1000)
+    assert created == [basix.create_element(*s) for s in specs]
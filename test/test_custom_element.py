@@ -172,6 +172,32 @@ def test_lagrange_custom_quadrilateral_degree1():
     assert np.allclose(lagrange.base_transformations(), element.base_transformations())
 
 
+@pytest.mark.parametrize("cell", [CellType.interval, CellType.triangle])
+def test_hermite_custom(cell):
+    """Test a custom element with derivative functionals.
+
+    Test that Hermite created as a custom element agrees with built-in
+    Hermite.
+    """
+    hermite = basix.create_element(basix.ElementFamily.Hermite, cell, 3)
+    element = basix.create_custom_element(
+        cell,
+        [],
+        hermite.wcoeffs,
+        hermite.x,
+        hermite.M,
+        1,
+        basix.MapType.identity,
+        basix.SobolevSpace.H1,
+        False,
+        3,
+        3,
+        basix.PolysetType.standard,
+    )
+    points = basix.create_lattice(cell, 5, basix.LatticeType.equispaced, True)
+    assert np.allclose(hermite.tabulate(1, points), element.tabulate(1, points))
+
+
 def test_raviart_thomas_triangle_degree1():
     """Test custom  Raviart-Thomas element.
 
@@ -290,6 +316,79 @@ def test_create_lagrange1_quad():
     create_lagrange1_quad()
 
 
+def test_content_hash():
+    """Test the content hash of a custom element."""
+    z = np.zeros((0, 2))
+    x = [
+        [np.array([[0.0, 0.0]]), np.array([[1.0, 0.0]]), np.array([[0.0, 1.0]])],
+        [z, z, z],
+        [z],
+        [],
+    ]
+
+    def create(value):
+        z = np.zeros((0, 1, 0, 1))
+        M = [
+            [np.array([[[[value]]]]), np.array([[[[1.0]]]]), np.array([[[[1.0]]]])],
+            [z, z, z],
+            [z],
+            [],
+        ]
+        return basix.create_custom_element(
+            CellType.triangle,
+            [],
+            np.eye(3),
+            x,
+            M,
+            0,
+            basix.MapType.identity,
+            basix.SobolevSpace.H1,
+            False,
+            1,
+            1,
+            basix.PolysetType.standard,
+        )
+
+    e = create(1.0)
+    # The hash is the same in all processes and on all platforms
+    assert e.content_hash() == 0xCF38C03F56C282A3
+    assert e.content_hash() == create(1.0).content_hash()
+    assert e.content_hash() == e.slim().content_hash()
+    assert e.content_hash() != create(2.0).content_hash()
+    assert e.content_hash() != e.astype(np.float32).content_hash()
+    assert hash(e) == hash(create(1.0))
+
+
+def test_equal_custom_elements_have_equal_hashes():
+    """Test that custom elements that compare equal have the same hash."""
+    e = basix.create_element(
+        basix.ElementFamily.P, CellType.triangle, 1, basix.LagrangeVariant.equispaced
+    )
+
+    def create(wcoeffs):
+        return basix.create_custom_element(
+            CellType.triangle,
+            [],
+            wcoeffs,
+            e.x,
+            e.M,
+            0,
+            basix.MapType.identity,
+            basix.SobolevSpace.H1,
+            False,
+            1,
+            1,
+            basix.PolysetType.standard,
+        )
+
+    a = create(np.eye(3))
+    c = create(np.eye(3) + 1e-14)
+    assert a.content_hash() != c.content_hash()
+    assert a == c
+    assert hash(a) == hash(c)
+    assert len({a, c}) == 1
+
+
 def test_wcoeffs_wrong_shape():
     """Test that a runtime error is thrown when wcoeffs is the wrong shape."""
     with pytest.raises(RuntimeError, match="wcoeffs has the wrong number of"):
@@ -572,3 +671,25 @@ def test_point_outside_cell_gives_warning(dim, component):
             4,
             basix.PolysetType.standard,
         )
+
+
+def test_transformation_errors_on_creation():
+    """Test that errors in the DOF transformations are raised on creation."""
+    e = basix.create_element(
+        basix.ElementFamily.P, CellType.triangle, 2, basix.LagrangeVariant.equispaced
+    )
+    with pytest.raises(RuntimeError, match="Map not implemented"):
+        basix.create_custom_element(
+            e.cell_type,
+            e.value_shape,
+            e.wcoeffs,
+            e.x,
+            e.M,
+            0,
+            basix.MapType.L2Piola,
+            e.sobolev_space,
+            False,
+            2,
+            2,
+            e.polyset_type,
+        )
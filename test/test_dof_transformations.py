@@ -8,6 +8,7 @@ import numpy as np
 import pytest
 
 import basix
+from basix import _basixcpp
 
 from .utils import parametrize_over_elements
 
@@ -639,3 +640,82 @@ def test_permute_subentity_closure_inverse(family, cell_type, degree, args):
                 subentity.value,
             )
             np.testing.assert_allclose(data, ref_data)
+
+
+@pytest.mark.parametrize(
+    "family, cell_type, degree",
+    [
+        (basix.ElementFamily.P, basix.CellType.tetrahedron, 4),
+        (basix.ElementFamily.N1E, basix.CellType.triangle, 3),
+        (basix.ElementFamily.RT, basix.CellType.hexahedron, 2),
+    ],
+)
+def test_shared_entity_transformations(family, cell_type, degree):
+    """Test elements defined by the same data have the same transformations."""
+    e = basix.create_element(family, cell_type, degree, basix.LagrangeVariant.gll_warped)
+    num_cached = sum(1 for t in e.entity_transformations().values() if t.shape[1] > 0)
+    assert num_cached > 0
+
+    # The transformations of each entity type with DOFs are found in the
+    # cache
+    hits = _basixcpp.entity_transformations_cache_hits()
+    e2 = basix.create_element(family, cell_type, degree, basix.LagrangeVariant.gll_warped)
+    e2.entity_transformations()
+    assert _basixcpp.entity_transformations_cache_hits() == hits + num_cached
+    custom = basix.create_custom_element(
+        cell_type,
+        e.value_shape,
+        e.wcoeffs,
+        e.x,
+        e.M,
+        0,
+        e.map_type,
+        e.sobolev_space,
+        False,
+        e.embedded_subdegree,
+        e.embedded_superdegree,
+        e.polyset_type,
+    )
+    for e1 in [e2, custom]:
+        t, t1 = e.entity_transformations(), e1.entity_transformations()
+        assert t.keys() == t1.keys()
+        for cell in t:
+            assert np.allclose(t[cell], t1[cell])
+
+
+def test_entity_transformations_not_shared():
+    """Test elements defined by different data have their own transformations."""
+    elements = [
+        basix.create_element(basix.ElementFamily.N1E, basix.CellType.triangle, 2, variant)
+        for variant in [basix.LagrangeVariant.legendre, basix.LagrangeVariant.equispaced]
+    ]
+    t = [e.entity_transformations()["interval"] for e in elements]
+    assert not np.allclose(t[0], t[1])
+
+    # The custom elements have the same cell, degree, value size, map
+    # and polyset type, and only differ in their DOFs
+    for e, te in zip(elements, t):
+        custom = basix.create_custom_element(
+            e.cell_type,
+            e.value_shape,
+            e.wcoeffs,
+            e.x,
+            e.M,
+            0,
+            e.map_type,
+            e.sobolev_space,
+            False,
+            e.embedded_subdegree,
+            e.embedded_superdegree,
+            e.polyset_type,
+        )
+        assert np.allclose(custom.entity_transformations()["interval"], te)
+
+
+@parametrize_over_elements(3)
+def test_lazy_transformations(cell_type, element_type, degree, element_args):
+    """Test transformations computed on first use match eager ones."""
+    lazy = basix.create_element(element_type, cell_type, degree, *element_args)
+    eager = basix.create_element(element_type, cell_type, degree, *element_args, lazy=False)
+    assert lazy.dof_transformations_are_identity == eager.dof_transformations_are_identity
+    assert np.allclose(lazy.base_transformations(), eager.base_transformations())
@@ -29,6 +29,8 @@ import pytest
 import basix
 import basix.ufl
 
+from .utils import parametrize_over_elements
+
 
 def random_point(cell):
     vertices = basix.geometry(basix.CellType[cell])
@@ -229,3 +231,100 @@ def test_hash():
     for i, d0 in enumerate(different_elements):
         for d1 in different_elements[:i]:
             assert hash(d0) != hash(d1)
+
+
+@parametrize_over_elements(3)
+def test_slim(cell_type, element_type, degree, element_args):
+    e = basix.create_element(element_type, cell_type, degree, *element_args)
+    slim = e.slim()
+    assert slim.is_slim and not e.is_slim
+    assert slim == e
+
+    points = basix.create_lattice(cell_type, 3, basix.LatticeType.equispaced, True)
+    assert np.allclose(slim.tabulate(1, points), e.tabulate(1, points))
+    assert np.allclose(slim.base_transformations(), e.base_transformations())
+    values = np.random.default_rng(0).random(e.interpolation_matrix.shape[1])
+    assert np.allclose(slim.interpolate(values), e.interpolate(values))
+
+    with pytest.raises(RuntimeError):
+        slim.wcoeffs
+    with pytest.raises(RuntimeError):
+        slim.interpolation_matrix
+
+    usage, slim_usage = e.memory_usage(), slim.memory_usage()
+    assert usage.keys() == slim_usage.keys()
+    assert slim_usage["coeffs"] == usage["coeffs"]
+    assert slim_usage["wcoeffs"] == 0 and slim_usage["M"] == 0
+    assert sum(slim_usage.values()) - slim_usage["transformations"] < sum(usage.values())
+
+
+@parametrize_over_elements(3)
+def test_points_on_entities(cell_type, element_type, degree, element_args):
+    e = basix.create_element(element_type, cell_type, degree, *element_args)
+    geometry = basix.geometry(cell_type)
+    topology = basix.topology(cell_type)
+    for d, x_d in enumerate(e.x):
+        for i, x in enumerate(x_d):
+            if x.shape[0] == 0:
+                continue
+            v = geometry[topology[d][i]]
+            axes = (v[1:] - v[0]).T
+            if axes.shape[1] == 0:
+                assert np.allclose(x, v[0])
+            else:
+                # Check that the points lie in the affine span of the entity
+                coords = np.linalg.lstsq(axes, (x - v[0]).T, rcond=None)[0]
+                assert np.allclose(v[0] + (axes @ coords).T, x)
+
+
+@parametrize_over_elements(3)
+def test_astype(cell_type, element_type, degree, element_args):
+    e = basix.create_element(element_type, cell_type, degree, *element_args)
+    e32 = e.astype(np.float32)
+    assert e32.dtype == np.float32
+    assert e32 is e.astype(np.float32)
+    assert e.astype(np.float64) is e
+    assert e32 == basix.create_element(
+        element_type, cell_type, degree, *element_args, dtype=np.float32
+    )
+
+    points = basix.create_lattice(cell_type, 3, basix.LatticeType.equispaced, True)
+    table = e.tabulate(0, points)
+    table32 = e32.tabulate(0, points.astype(np.float32))
+    assert np.allclose(table32, table, atol=1e-4 * np.abs(table).max())
+    assert np.allclose(e32.base_transformations(), e.base_transformations(), atol=1e-5)
+    assert np.allclose(e32.interpolation_matrix, e.interpolation_matrix, atol=1e-5)
+
+    slim = e.slim().astype(np.float32)
+    assert slim.is_slim and slim.dtype == np.float32
+    assert np.allclose(slim.tabulate(0, points.astype(np.float32)), table32)
+
+
+@parametrize_over_elements(3)
+def test_discontinuous_element(cell_type, element_type, degree, element_args):
+    e = basix.create_element(element_type, cell_type, degree, *element_args)
+    if element_type == basix.ElementFamily.bubble:
+        with pytest.raises(RuntimeError):
+            e.discontinuous_element()
+        return
+
+    d = basix.create_element(element_type, cell_type, degree, *element_args, discontinuous=True)
+    assert d.discontinuous_element() is d
+
+    points = basix.create_lattice(cell_type, 3, basix.LatticeType.equispaced, True)
+    for source in [e, e.slim()]:
+        e_d = source.discontinuous_element()
+        assert e_d == d
+        assert e_d.is_slim == source.is_slim
+        assert e_d.sobolev_space == basix.SobolevSpace.L2
+        assert e_d.entity_dofs == d.entity_dofs
+        assert e_d.entity_closure_dofs == d.entity_closure_dofs
+        assert np.allclose(e_d.tabulate(1, points), d.tabulate(1, points))
+        assert np.allclose(e_d.base_transformations(), d.base_transformations())
+
+    e_d = e.discontinuous_element()
+    for x0, x1 in zip(e_d.x, d.x):
+        assert [x.shape for x in x0] == [x.shape for x in x1]
+    for M0, M1 in zip(e_d.M, d.M):
+        assert [M.shape for M in M0] == [M.shape for M in M1]
+    assert np.allclose(e_d.interpolation_matrix, d.interpolation_matrix)
@@ -0,0 +1,43 @@
+# Copyright (c) 2026 The FEniCS Project
+# SPDX-License-Identifier: MIT
+
+import subprocess
+import sys
+
+import pytest
+
+
+def test_lazy_submodules():
+    lazy = ["basix.ufl", "basix.numba_helpers", "basix.vis", "ufl", "numba"]
+    code = f"import sys, basix; print(','.join(m for m in {lazy} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == ""
+
+
+def test_lazy_submodule_access():
+    import basix
+
+    assert "vis" in dir(basix)
+    assert basix.vis.create_lattice_mesh is not None
+    with pytest.raises(AttributeError):
+        basix.not_a_submodule
+
+
+def test_missing_optional_dependency():
+    code = """
+import inspect, sys
+sys.modules["numba"] = None
+import basix
+assert not hasattr(basix, "numba_helpers")
+inspect.getmembers(basix)
+assert "ufl" not in sys.modules
+try:
+    import basix.numba_helpers
+except ImportError as e:
+    assert "Numba" in str(e)
+else:
+    raise AssertionError
+"""
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout == ""
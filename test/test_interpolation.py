@@ -63,3 +63,94 @@ def test_interpolation_is_identity(cell_type, degree, element_type, element_args
         assert element.interpolation_is_identity == np.allclose(i_m, np.eye(i_m.shape[0]))
     else:
         assert not element.interpolation_is_identity
+
+
+@parametrize_over_elements(3)
+def test_interpolate(cell_type, degree, element_type, element_args):
+    element = basix.create_element(element_type, cell_type, degree, *element_args)
+    i_m = element.interpolation_matrix
+
+    values = np.random.default_rng(1).random((i_m.shape[1], 3))
+    assert np.allclose(element.interpolate(values), i_m @ values)
+    assert np.allclose(element.interpolate(values[:, 0]), i_m @ values[:, 0])
+
+    # The blocks must cover every DOF and only couple entities to their
+    # own points
+    blocks = element.interpolation_blocks
+    assert sum(b[1] for b in blocks) == element.dim
+    mask = np.zeros(i_m.shape, dtype=bool)
+    vs = element.value_size
+    npts = element.points.shape[0]
+    for dof0, ndofs, p0, np0 in blocks:
+        m = mask[dof0 : dof0 + ndofs].reshape(ndofs, vs, npts, -1)
+        m[:, :, p0 : p0 + np0] = True
+    assert np.allclose(i_m[~mask], 0)
+
+
+@pytest.mark.parametrize("num_threads", [1, 3])
+@pytest.mark.parametrize(
+    "element_type, cell_type, degree, element_args",
+    [
+        (basix.ElementFamily.P, basix.CellType.triangle, 3, [basix.LagrangeVariant.gll_warped]),
+        (basix.ElementFamily.N1E, basix.CellType.tetrahedron, 2, [basix.LagrangeVariant.legendre]),
+        (basix.ElementFamily.RT, basix.CellType.quadrilateral, 2, [basix.LagrangeVariant.legendre]),
+        (basix.ElementFamily.N2E, basix.CellType.triangle, 2, [basix.LagrangeVariant.legendre]),
+    ],
+)
+def test_interpolate_cells(element_type, cell_type, degree, element_args, num_threads):
+    element = basix.create_element(element_type, cell_type, degree, *element_args)
+    tdim = len(basix.topology(cell_type)) - 1
+    rng = np.random.default_rng(3)
+
+    ncells = 70
+    J = rng.random((ncells, tdim, tdim)) + 2 * np.identity(tdim)
+    K = np.linalg.inv(J)
+    detJ = np.linalg.det(J)
+    u = rng.random((ncells, element.points.shape[0], element.value_size))
+    cell_info = rng.integers(0, 2**30, ncells, dtype=np.uint32)
+
+    coeffs = element.interpolate_cells(u, J, detJ, K, cell_info, num_threads)
+    for c in range(ncells):
+        U = element.pull_back(u[c : c + 1], J[c : c + 1], detJ[c : c + 1], K[c : c + 1])[0]
+        expected = element.interpolation_matrix @ U.T.reshape(-1)
+        element.Tt_inv_apply(expected, 1, int(cell_info[c]))
+        assert np.allclose(coeffs[c], expected)
+
+
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_interpolate_cells_wrong_shape(num_threads):
+    element = basix.create_element(
+        basix.ElementFamily.N1E, basix.CellType.tetrahedron, 1, basix.LagrangeVariant.legendre
+    )
+    ncells = 70
+    J = np.tile(np.identity(3), (ncells, 1, 1))
+    detJ = np.ones(ncells)
+    npts = element.points.shape[0]
+    element.interpolate_cells(np.zeros((ncells, npts, 3)), J, detJ, J, None, num_threads)
+    for u in [np.zeros((ncells, npts, 1)), np.zeros((ncells, npts, 0))]:
+        with pytest.raises(RuntimeError):
+            element.interpolate_cells(u, J, detJ, J, None, num_threads)
+    with pytest.raises(RuntimeError):
+        element.interpolate_cells(
+            np.zeros((ncells, npts, 3)), J[:, :, :2], detJ, J, None, num_threads
+        )
+    with pytest.raises(RuntimeError):
+        element.interpolate_cells(
+            np.zeros((ncells, npts, 3)), J, detJ, J[:, :2, :], None, num_threads
+        )
+
+
+def test_interpolate_cells_num_threads():
+    element = basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 2)
+    npts = element.points.shape[0]
+    for ncells in [0, 100]:
+        J = np.tile(np.identity(2), (ncells, 1, 1))
+        detJ = np.ones(ncells)
+        u = np.ones((ncells, npts, 1))
+        for num_threads in [1, 1000]:
+            coeffs = element.interpolate_cells(u, J, detJ, J, None, num_threads)
+            assert coeffs.shape == (ncells, element.dim)
+            assert np.allclose(coeffs, 1.0)
+        for num_threads in [0, -1]:
+            with pytest.raises(RuntimeError):
+                element.interpolate_cells(u, J, detJ, J, None, num_threads)
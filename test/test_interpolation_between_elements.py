@@ -314,3 +314,66 @@ def test_degree_bounds(cell_type, degree, element_type, element_args):
         coeffs = basix.compute_interpolation_operator(lagrange, element) @ lagrange_coeffs
         values = np.array([tab[:, :, i] @ coeffs for i in range(element.value_size)])
         assert not np.allclose(values, lagrange_values)
+
+
+@pytest.mark.parametrize(
+    "family1, family2, cell_type",
+    [
+        (basix.ElementFamily.P, basix.ElementFamily.P, basix.CellType.tetrahedron),
+        (basix.ElementFamily.P, basix.ElementFamily.P, basix.CellType.quadrilateral),
+        (basix.ElementFamily.RT, basix.ElementFamily.N1E, basix.CellType.triangle),
+    ],
+)
+@pytest.mark.parametrize("block_size", [1, 3])
+def test_sparse_interpolation_operator(family1, family2, cell_type, block_size):
+    pytest.importorskip("scipy")
+    e0 = basix.create_element(family1, cell_type, 2, basix.LagrangeVariant.gll_warped)
+    e1 = basix.create_element(family2, cell_type, 3, basix.LagrangeVariant.gll_warped)
+    dense = basix.compute_interpolation_operator(e0, e1)
+    sparse = basix.compute_interpolation_operator(e0, e1, sparse=True, block_size=block_size)
+    assert sparse.format == "csr"
+    assert sparse.shape == (e1.dim * block_size, e0.dim * block_size)
+    assert sparse.nnz <= np.count_nonzero(dense) * block_size
+
+    blocked = np.kron(dense, np.eye(block_size))
+    assert np.allclose(sparse.toarray(), blocked, atol=1e-12)
+
+    # The operator is cached, but the caller gets its own copy
+    dense[:] = 0.0
+    assert np.allclose(
+        basix.compute_interpolation_operator(e0, e1), blocked[::block_size, ::block_size]
+    )
+
+
+@pytest.mark.parametrize("cell_type", [basix.CellType.quadrilateral, basix.CellType.hexahedron])
+@pytest.mark.parametrize("orders", [(1, 3), (4, 2)])
+@pytest.mark.parametrize("tp", [True, False])
+def test_tensor_product_interpolation_operator(cell_type, orders, tp):
+    create = basix.create_tp_element if tp else basix.create_element
+    e0 = create(basix.ElementFamily.P, cell_type, orders[0], basix.LagrangeVariant.gll_warped)
+    e1 = basix.create_element(
+        basix.ElementFamily.P, cell_type, orders[1], basix.LagrangeVariant.gll_warped
+    )
+    dense = basix.compute_interpolation_operator(e0, e1)
+    op = basix.compute_tensor_product_interpolation_operator(e0, e1)
+    assert op.shape == dense.shape
+    assert op.nbytes < dense.nbytes
+    assert np.allclose(op.todense(), dense)
+
+    x = np.random.default_rng(5).random((e0.dim, 2))
+    assert np.allclose(op @ x, dense @ x)
+    assert np.allclose(op @ x[:, 0], dense @ x[:, 0])
+
+    # Changing the returned operator does not change the cached factors
+    op.factors[0] = 2 * op.factors[0]
+    with pytest.raises(ValueError):
+        op.factors[1][0, 0] = 1.0
+    op = basix.compute_tensor_product_interpolation_operator(e0, e1)
+    assert np.allclose(op.todense(), dense)
+
+
+def test_tensor_product_interpolation_operator_no_factorisation():
+    e0 = basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 2)
+    e1 = basix.create_element(basix.ElementFamily.P, basix.CellType.triangle, 1)
+    with pytest.raises(ValueError):
+        basix.compute_tensor_product_interpolation_operator(e0, e1)
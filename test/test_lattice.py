@@ -121,3 +121,30 @@ def test_triangle(n, lattice_type, simplex_method):
     idx = np.where(np.isclose(tri_pts[:, 0] + tri_pts[:, 1], 1.0))
     tri_xyz = tri_pts[idx][:, 1:]
     assert np.allclose(np.sort(interval_pts), np.sort(tri_xyz))
+
+
+@pytest.mark.parametrize("celltype", [basix.CellType.triangle, basix.CellType.tetrahedron])
+@pytest.mark.parametrize("n", [20, 40])
+def test_isaac_high_degree(celltype, n):
+    pts = basix.create_lattice(
+        celltype, n, basix.LatticeType.gll, True, basix.LatticeSimplexMethod.isaac
+    )
+    tdim = pts.shape[1]
+    assert pts.shape[0] == np.prod([n + 1 + i for i in range(tdim)]) // np.prod(range(1, tdim + 1))
+
+    # Points on an edge are the GLL points
+    gll = basix.create_lattice(basix.CellType.interval, n, basix.LatticeType.gll, True)
+    on_edge = np.all(pts[:, 1:] == 0, axis=1)
+    assert np.allclose(np.sort(pts[on_edge, 0]), np.sort(gll[:, 0]))
+
+    # Points are invariant under swapping the first two coordinates
+    swapped = pts.copy()
+    swapped[:, [0, 1]] = pts[:, [1, 0]]
+    assert np.allclose(np.sort(swapped, axis=0), np.sort(pts, axis=0))
+
+    assert np.allclose(
+        basix.create_lattice(
+            celltype, n, basix.LatticeType.gll, True, basix.LatticeSimplexMethod.isaac
+        ),
+        pts,
+    )
@@ -2,6 +2,8 @@
 # FEniCS Project
 # SPDX-License-Identifier: MIT
 
+import math
+
 import numpy as np
 import pytest
 import sympy
@@ -203,3 +205,203 @@ def test_gauss_jacobi_rule(alpha, degree):
 
     expected = 1 / (alpha + degree + 1)
     assert np.isclose(integral, expected)
+
+
+@pytest.mark.parametrize("m", [10, 50, 100, 200])
+def test_gauss_legendre_high_order(m):
+    pts, wts = basix.quadrature.gauss_jacobi_rule(0.0, m)
+    ref_pts, ref_wts = np.polynomial.legendre.leggauss(m)
+    assert np.allclose(2 * pts - 1, ref_pts, rtol=0, atol=1e-14)
+    assert np.allclose(2 * wts, ref_wts, rtol=1e-10, atol=0)
+
+
+@pytest.mark.parametrize("alpha", [0.0, 1.0, 2.0, 3.0])
+@pytest.mark.parametrize("m", [20, 100, 300])
+def test_gauss_jacobi_rule_high_order(alpha, m):
+    pts, wts = basix.quadrature.gauss_jacobi_rule(alpha, m)
+    assert np.all(np.diff(pts) > 0)
+    assert pts[0] > 0 and pts[-1] < 1
+    for degree in [0, m, 2 * m - 1]:
+        integral = sum(w * p**degree for p, w in zip(pts, wts))
+        expected = math.exp(
+            math.lgamma(degree + 1) + math.lgamma(alpha + 1) - math.lgamma(degree + alpha + 2)
+        )
+        assert np.isclose(integral, expected, rtol=1e-12, atol=0)
+
+
+@pytest.mark.parametrize("m", [10, 50, 200])
+def test_gll_high_order(m):
+    pts, wts = basix.make_quadrature(
+        basix.CellType.interval, 2 * m - 3, rule=basix.QuadratureType.gll
+    )
+    assert len(wts) == m
+    for degree in [0, m, 2 * m - 3]:
+        assert np.isclose(sum(wts * pts[:, 0] ** degree), 1 / (degree + 1), rtol=1e-12, atol=0)
+
+
+@pytest.mark.parametrize(
+    "celltype, max_degree",
+    [(basix.CellType.triangle, 30), (basix.CellType.tetrahedron, 15)],
+)
+def test_xiao_gimbutas_degree_range(celltype, max_degree):
+    pts, wts = basix.make_quadrature(celltype, max_degree, rule=basix.QuadratureType.xiao_gimbutas)
+    assert pts.shape == (len(wts), len(basix.topology(celltype)) - 1)
+    with pytest.raises(RuntimeError):
+        basix.make_quadrature(celltype, max_degree + 1, rule=basix.QuadratureType.xiao_gimbutas)
+
+
+@pytest.mark.parametrize(
+    "celltype",
+    [
+        basix.CellType.quadrilateral,
+        basix.CellType.hexahedron,
+        basix.CellType.prism,
+        basix.CellType.pyramid,
+    ],
+)
+@pytest.mark.parametrize("m", range(12))
+def test_symmetric(celltype, m):
+    pts, wts = basix.make_quadrature(celltype, m, rule=basix.QuadratureType.symmetric)
+    ref_pts, ref_wts = basix.make_quadrature(
+        celltype, m + 2, rule=basix.QuadratureType.gauss_jacobi
+    )
+    assert len(wts) <= len(ref_wts)
+    assert (wts > 0).all()
+    assert (pts > 0).all()
+    if celltype in [basix.CellType.quadrilateral, basix.CellType.hexahedron]:
+        assert (pts < 1).all()
+    elif celltype == basix.CellType.prism:
+        assert (pts[:, 0] + pts[:, 1] < 1).all() and (pts[:, 2] < 1).all()
+    else:
+        assert (np.maximum(pts[:, 0], pts[:, 1]) + pts[:, 2] < 1).all()
+
+    tdim = pts.shape[1]
+    for powers in np.ndindex(*[m + 1] * tdim):
+        if sum(powers) <= m:
+            f = np.prod(pts**powers, axis=1)
+            f_ref = np.prod(ref_pts**powers, axis=1)
+            assert np.isclose(wts @ f, ref_wts @ f_ref, rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.parametrize(
+    "celltype, m",
+    [(basix.CellType.quadrilateral, 5), (basix.CellType.hexahedron, 5), (basix.CellType.prism, 4)],
+)
+def test_symmetric_point_count(celltype, m):
+    _, wts = basix.make_quadrature(celltype, m, rule=basix.QuadratureType.symmetric)
+    _, gj_wts = basix.make_quadrature(celltype, m, rule=basix.QuadratureType.gauss_jacobi)
+    assert len(wts) < len(gj_wts)
+
+
+@pytest.mark.parametrize("celltype", [basix.CellType.triangle, basix.CellType.tetrahedron])
+@pytest.mark.parametrize("m", [2, 6])
+def test_symmetric_fallback(celltype, m):
+    pts, wts = basix.make_quadrature(celltype, m, rule=basix.QuadratureType.symmetric)
+    d_pts, d_wts = basix.make_quadrature(celltype, m)
+    assert np.allclose(pts, d_pts) and np.allclose(wts, d_wts)
+
+
+@pytest.mark.parametrize(
+    "celltype",
+    [
+        basix.CellType.interval,
+        basix.CellType.triangle,
+        basix.CellType.quadrilateral,
+        basix.CellType.tetrahedron,
+        basix.CellType.hexahedron,
+    ],
+)
+@pytest.mark.parametrize("degree", [1, 3])
+def test_facet_quadrature(celltype, degree):
+    pts, wts = basix.make_facet_quadrature(celltype, degree)
+    tdim = len(basix.topology(celltype)) - 1
+    geometry = basix.geometry(celltype)
+    facets = basix.topology(celltype)[tdim - 1]
+    assert pts.shape[0] == wts.shape[0] == len(facets)
+    assert pts.shape[1:] == (wts.shape[1], tdim)
+
+    for f, facet in enumerate(facets):
+        v = geometry[facet]
+        if tdim == 1:
+            assert np.allclose(pts[f], v) and np.allclose(wts[f], 1.0)
+            continue
+        facettype = basix.cell.sub_entity_type(celltype, tdim - 1, f)
+        fpts, _ = basix.make_quadrature(facettype, degree)
+        mapped = v[0] + fpts @ (v[1 : tdim + 1] - v[0])[: tdim - 1]
+        assert np.allclose(pts[f], mapped)
+
+        # Integrate the first coordinate over the facet
+        size = np.sum(wts[f])
+        if tdim == 2:
+            assert np.isclose(size, np.linalg.norm(v[1] - v[0]))
+        assert np.isclose(wts[f] @ pts[f, :, 0], size * np.mean(v[:, 0]))
+
+    assert basix.make_facet_quadrature(celltype, degree)[0] is pts
+    assert not pts.flags.writeable
+
+
+@pytest.mark.parametrize(
+    "celltype, norientations",
+    [
+        (basix.CellType.triangle, 2),
+        (basix.CellType.quadrilateral, 2),
+        (basix.CellType.tetrahedron, 6),
+        (basix.CellType.hexahedron, 8),
+    ],
+)
+def test_facet_quadrature_orientations(celltype, norientations):
+    pts, wts = basix.make_facet_quadrature(celltype, 2)
+    opts, owts = basix.make_facet_quadrature(celltype, 2, orientations=True)
+    assert opts.shape == (pts.shape[0], norientations, *pts.shape[1:])
+    assert np.allclose(owts, wts)
+    assert np.allclose(opts[:, 0], pts)
+
+    # Each orientation maps the facet onto itself
+    tdim = pts.shape[2]
+    for f, normal in enumerate(basix.cell.facet_normals(celltype)):
+        v0 = basix.geometry(celltype)[basix.topology(celltype)[tdim - 1][f][0]]
+        assert np.allclose((opts[f] - v0) @ normal, 0.0)
+        for o in range(1, norientations):
+            assert np.isclose(owts[f] @ opts[f, o, :, 0], owts[f] @ opts[f, 0, :, 0])
+            assert not np.allclose(opts[f, o], opts[f, 0])
+
+
+def test_facet_quadrature_mixed_facets():
+    with pytest.raises(ValueError):
+        basix.make_facet_quadrature(basix.CellType.prism, 2)
+
+
+@pytest.mark.parametrize(
+    "celltype", [basix.CellType.interval, basix.CellType.quadrilateral, basix.CellType.hexahedron]
+)
+@pytest.mark.parametrize(
+    "rule",
+    [basix.QuadratureType.default, basix.QuadratureType.gauss_jacobi, basix.QuadratureType.gll],
+)
+@pytest.mark.parametrize("degree", [1, 4])
+def test_tensor_quadrature(celltype, rule, degree):
+    pts, wts = basix.make_quadrature(celltype, degree, rule=rule)
+    q = basix.make_quadrature(celltype, degree, rule=rule, tensor=True)
+    assert isinstance(q, basix.quadrature.TensorQuadrature)
+    assert q.tdim == pts.shape[1]
+    assert np.prod(q.shape) == len(wts)
+
+    ipts, iwts = basix.make_quadrature(basix.CellType.interval, degree, rule=rule)
+    for p, w in q.factors:
+        assert np.allclose(p, ipts[:, 0]) and np.allclose(w, iwts)
+
+    tpts, twts = q
+    assert np.allclose(tpts, pts) and np.allclose(twts, wts)
+
+
+@pytest.mark.parametrize(
+    "celltype, rule",
+    [
+        (basix.CellType.triangle, basix.QuadratureType.default),
+        (basix.CellType.prism, basix.QuadratureType.gauss_jacobi),
+        (basix.CellType.quadrilateral, basix.QuadratureType.symmetric),
+    ],
+)
+def test_tensor_quadrature_unsupported(celltype, rule):
+    with pytest.raises(ValueError):
+        basix.make_quadrature(celltype, 2, rule=rule, tensor=True)
@@ -185,6 +185,34 @@ def test_finite_element_block_hash(family, cell, degree, shape):
     assert e.basix_hash() is not None
 
 
+@pytest.mark.parametrize("shape", [(2,), (3,), (2, 3)])
+def test_blocked_element_tabulate(shape):
+    sub = basix.ufl.element("Lagrange", "triangle", 2)
+    e = basix.ufl.blocked_element(sub, shape=shape)
+    points = basix.create_lattice(basix.CellType.triangle, 4, basix.LatticeType.equispaced, True)
+    sub_table = sub.tabulate(1, points)
+    table = e.tabulate(1, points)
+    assert table.shape == (*sub_table.shape[:2], *shape, e.dim)
+
+    bs = e.block_size
+    table = table.reshape(*sub_table.shape[:2], bs, sub.dim, bs)
+    for i in range(bs):
+        for j in range(bs):
+            if i == j:
+                assert np.allclose(table[:, :, i, :, j], sub_table)
+            else:
+                assert np.allclose(table[:, :, i, :, j], 0)
+
+    sub_table2, block_size = e.tabulate_sub_element(1, points)
+    assert block_size == bs
+    assert np.allclose(sub_table2, sub_table)
+
+    assert np.allclose(e._wcoeffs, np.kron(np.eye(bs), sub._wcoeffs))
+    for M_d, sub_M_d in zip(e._M, sub._M):
+        for M, sub_M in zip(M_d, sub_M_d):
+            assert np.allclose(M, np.kron(np.eye(bs)[:, :, None, None], sub_M))
+
+
 @pytest.mark.parametrize("component", [0, 1, 0])
 def test_component_element_eq_hash(component):
     base_el = basix.ufl.element("Lagrange", "triangle", 1)
@@ -193,6 +221,73 @@ def test_component_element_eq_hash(component):
     assert (e1 == e2) == (hash(e1) == hash(e2))
 
 
+@pytest.mark.parametrize(
+    "sub_elements",
+    [
+        [("N1E", "triangle", 2), ("P", "triangle", 1)],
+        [("RT", "triangle", 1), ("DG", "triangle", 0), ("P", "triangle", 3)],
+    ],
+)
+def test_mixed_element_tabulate_and_dofs(sub_elements):
+    sub_elements = [basix.ufl.element(*e) for e in sub_elements]
+    e = basix.ufl.mixed_element(sub_elements)
+    points = basix.create_lattice(basix.CellType.triangle, 4, basix.LatticeType.equispaced, True)
+
+    table = e.tabulate(1, points)
+    assert table.shape == (3, points.shape[0], e.reference_value_size * e.dim)
+    start = 0
+    for sub, sub_table in zip(sub_elements, [s.tabulate(1, points) for s in sub_elements]):
+        vs = sub.reference_value_size
+        for i in range(0, sub.dim, vs):
+            assert np.allclose(table[:, :, start : start + vs], sub_table[:, :, i : i + vs])
+            assert np.allclose(table[:, :, start + vs : start + e.reference_value_size], 0)
+            start += e.reference_value_size
+    assert np.allclose(table[:, :, start:], 0)
+
+    offset = 0
+    dofs = [[[] for _ in entities] for entities in e.entity_dofs]
+    closure_dofs = [[[] for _ in entities] for entities in e.entity_closure_dofs]
+    for sub in sub_elements:
+        for d, entities in enumerate(sub.entity_dofs):
+            for i, entity_dofs in enumerate(entities):
+                dofs[d][i] += [offset + j for j in entity_dofs]
+        for d, entities in enumerate(sub.entity_closure_dofs):
+            for i, entity_dofs in enumerate(entities):
+                closure_dofs[d][i] += [offset + j for j in entity_dofs]
+        offset += sub.dim
+    assert [[list(i) for i in entities] for entities in e.entity_dofs] == dofs
+    assert [[list(i) for i in entities] for entities in e.entity_closure_dofs] == closure_dofs
+    assert [list(n) for n in e.num_entity_dofs] == [[len(i) for i in d] for d in dofs]
+    assert [list(n) for n in e.num_entity_closure_dofs] == [
+        [len(i) for i in d] for d in closure_dofs
+    ]
+    assert e.entity_dofs is e.entity_dofs
+
+
+def test_mixed_element_tabulate_blocked():
+    # Taylor-Hood element
+    P2 = basix.ufl.element("P", "triangle", 2)
+    P1 = basix.ufl.element("P", "triangle", 1)
+    e = basix.ufl.mixed_element([basix.ufl.blocked_element(P2, shape=(2,)), P1])
+    points = basix.create_lattice(basix.CellType.triangle, 4, basix.LatticeType.equispaced, True)
+
+    table = e.tabulate(1, points)
+    assert table.shape == (3, points.shape[0], e.reference_value_size * e.dim)
+    P2_table = P2.tabulate(1, points)
+    P1_table = P1.tabulate(1, points)
+    start = 0
+    for k in range(P2.dim):
+        for c in range(2):
+            assert np.allclose(table[:, :, start + c], P2_table[:, :, k])
+        assert np.allclose(table[:, :, start + 2 : start + 3], 0)
+        start += 3
+    for k in range(P1.dim):
+        assert np.allclose(table[:, :, start], P1_table[:, :, k])
+        assert np.allclose(table[:, :, start + 1 : start + 3], 0)
+        start += 3
+    assert np.allclose(table[:, :, start:], 0)
+
+
 @pytest.mark.parametrize(
     "e1,e2",
     [
@@ -266,3 +361,90 @@ def test_dof_ordering():
 
     for i, j in enumerate([1, 2, 0]):
         assert np.allclose(table[:, i], table2[:, j])
+
+
+def test_elements():
+    specs = [
+        ("Lagrange", "triangle", 2),
+        {"family": "N1curl", "cell": "triangle", "degree": 1},
+        (
+            "Lagrange",
+            "triangle",
+            2,
+            basix.LagrangeVariant.unset,
+            basix.DPCVariant.unset,
+            False,
+            (2,),
+        ),
+    ]
+    created = basix.ufl.elements(specs, max_workers=2)
+    assert created[0] == basix.ufl.element("Lagrange", "triangle", 2)
+    assert created[1] == basix.ufl.element("N1curl", "triangle", 1)
+    assert created[2] == basix.ufl.element("Lagrange", "triangle", 2, shape=(2,))
+
+    mixed = basix.ufl.mixed_element([specs[2], created[0]])
+    assert mixed == basix.ufl.mixed_element([created[2], created[0]])
+
+    enriched = basix.ufl.enriched_element(
+        [("Lagrange", "triangle", 1), {"family": "bubble", "cell": "triangle", "degree": 3}]
+    )
+    assert enriched.dim == 4
+
+
+def test_interned_elements():
+    e = basix.ufl.element("Lagrange", "triangle", 2)
+    assert basix.ufl.element(basix.ElementFamily.P, basix.CellType.triangle, 2) is e
+    assert basix.ufl.element("Lagrange", "triangle", 2, dtype=np.float32) is not e
+    assert basix.ufl.element("Lagrange", "triangle", 3) is not e
+    assert basix.ufl.elements([("Lagrange", "triangle", 2)])[0] is e
+
+    v = basix.ufl.element("Lagrange", "triangle", 2, shape=(2,))
+    assert v.sub_elements[0] is e
+    assert basix.ufl.blocked_element(e, shape=(2,)) is v
+    assert basix.ufl.element("Lagrange", "triangle", 2, shape=(2,)) is v
+
+    p1 = basix.ufl.element("Lagrange", "triangle", 1)
+    mixed = basix.ufl.mixed_element([v, p1])
+    assert basix.ufl.mixed_element([v, ("Lagrange", "triangle", 1)]) is mixed
+    assert basix.ufl.mixed_element([p1, v]) is not mixed
+
+    bubble = basix.ufl.element("bubble", "triangle", 3)
+    enriched = basix.ufl.enriched_element([p1, bubble])
+    assert basix.ufl.enriched_element([p1, bubble]) is enriched
+
+    q = basix.ufl.quadrature_element("triangle", degree=2)
+    assert basix.ufl.quadrature_element("triangle", degree=2) is q
+    points, weights = basix.make_quadrature(basix.CellType.triangle, 2)
+    q2 = basix.ufl.quadrature_element("triangle", points=points, weights=weights)
+    assert basix.ufl.quadrature_element("triangle", points=points, weights=weights) is q2
+    assert basix.ufl.quadrature_element("triangle", degree=3) is not q
+
+    # Elements are removed from the cache when they are no longer used
+    e9 = basix.ufl.element("Lagrange", "interval", 9)
+    n = len(basix.ufl._element_cache)
+    del e9
+    assert len(basix.ufl._element_cache) == n - 1
+
+
+def test_equal_custom_elements_have_equal_hashes():
+    e = basix.create_element(
+        basix.ElementFamily.P, basix.CellType.triangle, 1, basix.LagrangeVariant.equispaced
+    )
+    a, c = (
+        basix.ufl.custom_element(
+            basix.CellType.triangle,
+            (),
+            wcoeffs,
+            e.x,
+            e.M,
+            0,
+            basix.MapType.identity,
+            basix.SobolevSpace.H1,
+            False,
+            1,
+            1,
+        )
+        for wcoeffs in [np.eye(3), np.eye(3) + 1e-14]
+    )
+    assert a == c
+    assert hash(a) == hash(c)
@@ -0,0 +1,100 @@
+# Copyright (c) 2026 The FEniCS Project
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+import pytest
+
+import basix
+import basix.vis
+
+
+def subcell_volume(celltype, vertices):
+    """Volume of a cell with the given vertices, using a P1 geometry map."""
+    e = basix.create_element(basix.ElementFamily.P, celltype, 1, basix.LagrangeVariant.equispaced)
+    pts, wts = basix.make_quadrature(celltype, 4)
+    tab = e.tabulate(1, pts)[1:, :, :, 0]
+    J = np.einsum("dpv,vi->pid", tab, vertices)
+    detJ = np.linalg.det(J)
+    return np.sum(wts * detJ), detJ.min()
+
+
+@pytest.mark.parametrize(
+    "celltype",
+    [
+        basix.CellType.interval,
+        basix.CellType.triangle,
+        basix.CellType.quadrilateral,
+        basix.CellType.tetrahedron,
+        basix.CellType.hexahedron,
+        basix.CellType.prism,
+        basix.CellType.pyramid,
+    ],
+)
+@pytest.mark.parametrize("n", [1, 2, 3, 5])
+def test_lattice_mesh(celltype, n):
+    points, cells = basix.vis.create_lattice_mesh(celltype, n)
+    assert np.allclose(
+        points, basix.create_lattice(celltype, n, basix.LatticeType.equispaced, True)
+    )
+
+    volume = 0.0
+    used = set()
+    for subtype, c in cells.items():
+        assert c.shape[1] == len(basix.geometry(subtype))
+        used.update(c.flatten())
+        for v in c:
+            if subtype == basix.CellType.interval:
+                volume += np.linalg.norm(points[v[1]] - points[v[0]])
+                continue
+            vol, min_detj = subcell_volume(subtype, points[v])
+            assert min_detj > 1e-12
+            volume += vol
+    assert np.isclose(volume, basix.cell.volume(celltype))
+    assert used == set(range(points.shape[0]))
+
+
+def test_lattice_mesh_gll():
+    points, cells = basix.vis.create_lattice_mesh(
+        basix.CellType.triangle, 6, basix.LatticeType.gll, basix.LatticeSimplexMethod.warp
+    )
+    volume = sum(
+        subcell_volume(basix.CellType.triangle, points[v])[0]
+        for v in cells[basix.CellType.triangle]
+    )
+    assert len(cells[basix.CellType.triangle]) == 36
+    assert np.isclose(volume, 0.5)
+
+
+@pytest.mark.parametrize("celltype", [basix.CellType.triangle, basix.CellType.hexahedron])
+def test_interpolate(celltype):
+    e = basix.create_element(basix.ElementFamily.P, celltype, 3, basix.LagrangeVariant.gll_warped)
+    n = 4
+    dofs = np.random.default_rng(0).random((10, e.dim))
+    values = list(basix.vis.interpolate(e, n, (dofs[i : i + 3] for i in range(0, 10, 3))))
+    assert [v.shape[0] for v in values] == [3, 3, 3, 1]
+
+    points, _ = basix.vis.create_lattice_mesh(celltype, n)
+    tab = e.tabulate(0, points)[0, :, :, 0]
+    assert np.allclose(np.concatenate(values)[:, :, 0], dofs @ tab.T)
+
+
+def test_write(tmp_path):
+    e = basix.create_element(
+        basix.ElementFamily.P, basix.CellType.triangle, 2, basix.LagrangeVariant.equispaced
+    )
+    points, cells = basix.vis.create_lattice_mesh(basix.CellType.triangle, 3)
+    dofs = np.random.default_rng(1).random((7, e.dim))
+    filename = tmp_path / "out.npz"
+    basix.vis.write(
+        filename, points, cells, basix.vis.interpolate(e, 3, np.array_split(dofs, 3)), 7
+    )
+
+    with np.load(filename) as data:
+        assert np.allclose(data["points"], points)
+        assert np.array_equal(data["cells_triangle"], cells[basix.CellType.triangle])
+        values = data["values"]
+    assert values.shape == (7, points.shape[0], 1)
+    assert np.allclose(values[:, :, 0], dofs @ e.tabulate(0, points)[0, :, :, 0].T)
+
+    with pytest.raises(ValueError):
+        basix.vis.write(filename, points, cells, basix.vis.interpolate(e, 3, [dofs]), 6)